@@ -0,0 +1,207 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Autosave saves the interface of a top level whenever it changes. A burst of changes (like dragging
+the handle of a paned) is merged into a single save, made once the interface stays unchanged for
+``delay`` milliseconds. Like ``Aduct.save_interface``, the interface is encoded and written in a
+thread and the file is replaced atomically. A write is skipped when the encoded interface has the
+same hash as the one last written.
+
+The interface changes when views or elements are added, removed or changed, and when a provider
+emits ``child-props-changed`` for a child whose content changed (see :mod:`.Provider`). So a
+provider has to emit it for edits of its children to be saved. The interface saved is always
+taken afresh, so a save made for any reason writes the latest content of all children.
+
+.. code:: python
+
+   from Aduct.Autosave import Autosave
+
+   autosave = Autosave(top_level, "aduct.ui", delay=2000)
+   ...
+   autosave.flush()  # Before quitting.
+"""
+
+import hashlib
+from threading import Thread, current_thread
+
+from gi.repository import GLib, GObject
+
+from . import _encode_interface, _write_interface, get_interface
+
+
+class Autosave(GObject.Object):
+
+    __gsignals__ = {"saved": (2, None, (object,))}
+
+    codec = GObject.Property(type=str, default="json")
+    delay = GObject.Property(type=int, default=1000)
+
+    def __init__(self, top_level, path, **kwargs):
+
+        """
+        Makes an autosave that saves the interface of given top level to given file.
+
+        Arguments
+        ---------
+        top_level : :mod:`.View`
+            A view which acts as the root widget.
+        path : :class:`str`
+            The path of file to which the interface has to be saved.
+        **kwargs
+            The values to be passed to :class:`GObject.Object`. ``delay`` is the number of
+            milliseconds the interface has to stay unchanged before it is saved. Default is 1000.
+            ``codec`` is the format of file, as in ``Aduct.save_interface``. Default is ``json``.
+
+        Attributes
+        ----------
+        last_hash : :class:`str`
+            The hash of the interface last written, :obj:`None` if nothing is written yet.
+        skips : :class:`int`
+            The number of saves skipped as the interface was not changed.
+        writes : :class:`int`
+            The number of times the file was written.
+
+        Signals
+            saved
+                Emitted after the file is written, with the raised exception or :obj:`None` on
+                success.
+        """
+
+        GObject.Object.__init__(self, **kwargs)
+        self.top_level = top_level
+        self.path = path
+        self.last_hash = None
+        self.skips = 0
+        self.writes = 0
+
+        self.pending = False
+        self.result = None
+        self.source = None
+        self.thread = None
+        self.handler = top_level.connect("interface-changed", self.__handle_changed__)
+
+    def __handle_changed__(self, top_level):
+
+        if self.source is not None:
+            GLib.source_remove(self.source)
+        self.source = GLib.timeout_add(self.get_property("delay"), self.__handle_timeout__)
+
+    def __finish_save__(self):
+
+        digest, err = self.result
+        self.result = None
+        self.thread = None
+        if err is not None:
+            self.emit("saved", err)
+        elif digest is None:
+            self.skips += 1
+        else:
+            self.last_hash = digest
+            self.writes += 1
+            self.emit("saved", None)
+
+        if self.pending:
+            self.pending = False
+            self.save()
+
+    def __handle_saved__(self, thread):
+
+        # The save may already be finished by flush.
+        if thread is self.thread:
+            self.__finish_save__()
+        return False
+
+    def __handle_timeout__(self):
+
+        self.source = None
+        self.save()
+        return False
+
+    def flush(self):
+
+        """
+        Saves the pending changes at once and waits till they are written, along with the saves
+        queued behind a save in progress.
+        """
+
+        if self.source is not None:
+            GLib.source_remove(self.source)
+            self.source = None
+            self.save()
+        while self.thread is not None:
+            self.thread.join()
+            self.__finish_save__()
+
+    def get_stats(self):
+
+        """
+        Gets the counters of :obj:`self`.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with keys ``writes`` and ``skips``.
+        """
+
+        stats = {"writes": self.writes, "skips": self.skips}
+        return stats
+
+    def save(self):
+
+        """
+        Saves the interface now, unless it is unchanged since the last write. When a save is
+        already in progress, another one is made after it.
+        """
+
+        if self.thread is not None:
+            self.pending = True
+            return
+
+        interface_props = get_interface(self.top_level)
+        last_hash = self.last_hash
+        codec = self.get_property("codec")
+
+        def save():
+            digest = err = None
+            try:
+                data = _encode_interface(interface_props, codec)
+                new_hash = hashlib.sha256(data).hexdigest()
+                if new_hash != last_hash:
+                    _write_interface(self.path, data)
+                    digest = new_hash
+            except Exception as error:
+                err = error
+            self.result = (digest, err)
+            GLib.idle_add(self.__handle_saved__, current_thread())
+
+        self.thread = Thread(target=save)
+        self.thread.start()
+
+    def stop(self):
+
+        """
+        Stops saving the interface. Pending changes are not saved, call :meth:`flush` before to
+        save them.
+        """
+
+        if self.source is not None:
+            GLib.source_remove(self.source)
+            self.source = None
+        if self.handler is not None:
+            self.top_level.disconnect(self.handler)
+            self.handler = None
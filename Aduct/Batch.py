@@ -0,0 +1,119 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Batch holds the visual updates deferred while a batch of changes is made, see ``Aduct.batch``.
+
+While a batch is open, the widgets to be shown are collected instead of being shown, the
+``interface-changed`` signals of views are collected so that each view emits it once, and the tab
+labels of notebooks are changed once at the end. The windows of top levels are frozen, so that
+they are not drawn till the batch is closed. Batches can be nested, the updates are made when the
+outermost one is closed.
+"""
+
+from gi.repository import GObject
+
+depth = 0
+changed = {}
+labels = {}
+to_show = []
+top_levels = []
+
+
+def begin(top_level):
+
+    """
+    Opens a batch for the given top level.
+
+    Arguments
+    ---------
+    top_level : :mod:`.View`
+        A view which acts as the root widget.
+    """
+
+    global depth
+
+    depth += 1
+    window = top_level.get_window()
+    if window is not None:
+        window.freeze_updates()
+    top_levels.append((top_level, window))
+
+
+def end():
+
+    """
+    Closes the last opened batch. When it is the outermost one, the deferred updates are made.
+    """
+
+    global depth
+
+    depth -= 1
+    if depth:
+        return
+
+    # Taken out at once, so that nothing is left for the next batch when an update raises.
+    widgets = list(changed)
+    changed.clear()
+    pairs = list(labels)
+    labels.clear()
+    shown = dict.fromkeys(to_show)
+    to_show.clear()
+    frozen = list(top_levels)
+    top_levels.clear()
+
+    try:
+        for widget in widgets:
+            if GObject.signal_lookup("interface-changed", type(widget)):
+                widget.emit("interface-changed")
+
+        for notebook, child in pairs:
+            if child.get_parent() is notebook:
+                notebook.change_child_label(child)
+
+        for widget in shown:
+            parent = widget.get_parent()
+            while parent is not None and parent not in shown:
+                parent = parent.get_parent()
+            # A widget is shown along with its ancestor, if that is shown too.
+            if parent is None:
+                widget.show_all()
+    finally:
+        for top_level, window in frozen:
+            if window is not None:
+                window.thaw_updates()
+            top_level.queue_resize()
+
+
+def show_all(widget):
+
+    """
+    Shows the given widget and its children, at the end of batch when one is open. Nothing is
+    done when it is :obj:`None`, like the parent of a detached widget.
+
+    Arguments
+    ---------
+    widget : :class:`Gtk.Widget`
+        The widget to be shown.
+    """
+
+    if widget is None:
+        return
+    if depth:
+        to_show.append(widget)
+    else:
+        widget.show_all()
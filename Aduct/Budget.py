@@ -0,0 +1,235 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Budget limits the number of live children, or their estimated cost, across all the
+:mod:`.Element` added to it. The elements are ordered by the last time they were mapped or
+focused. When the limit is exceeded, the least recently used elements that are not mapped are
+hibernated (see :meth:`.Element.hibernate`) till the usage is within the limit again. The cost of
+a child is estimated by ``Provider.get_child_cost``.
+
+A single budget can be shared by elements of all windows. :meth:`Budget.get_default` gives a budget
+for the whole process, to which every element is added unless it is made with another budget or
+with ``budget=False``. It has no limits till they are set, so it only keeps the counters then.
+"""
+
+from collections import OrderedDict
+
+from gi.repository import GLib, GObject
+
+default_budget = None
+
+
+class Budget(GObject.Object):
+
+    max_children = GObject.Property(type=int, default=0)
+    max_cost = GObject.Property(type=int, default=0)
+
+    def __init__(self, **kwargs):
+
+        """
+        Makes a budget based on given properties.
+
+        Arguments
+        ---------
+        **kwargs
+            The values to be passed to :class:`GObject.Object`. ``max_children`` is the number of
+            live children allowed and ``max_cost`` is the total estimated cost allowed. A value
+            of 0, which is the default, means no limit.
+
+        Attributes
+        ----------
+        elements : :class:`collections.OrderedDict`
+            The elements having a live child, as ``{element: cost}``, from least to most
+            recently used.
+        evictions : :class:`int`
+            The number of children released by :obj:`self`.
+        """
+
+        GObject.Object.__init__(self, **kwargs)
+        self.elements = OrderedDict()
+        self.evictions = 0
+        self.handlers = {}
+        self.enforce_source = None
+
+    def __handle_child_added__(self, element):
+
+        if element.is_child_pending():
+            return
+        provider = element.get_provider()
+        cost = provider.get_child_cost(element.get_child_name(), element.get_child())
+        self.elements[element] = cost
+        self.elements.move_to_end(element)
+        self.queue_enforce()
+
+    def __handle_child_removed__(self, element):
+
+        self.elements.pop(element, None)
+
+    def __handle_destroy__(self, element):
+
+        self.remove_element(element)
+
+    def __handle_enforce__(self):
+
+        self.enforce_source = None
+        self.enforce()
+        return False
+
+    def __handle_unmap__(self, element):
+
+        if element in self.elements:
+            self.queue_enforce()
+
+    def __handle_used__(self, element, *args):
+
+        if element in self.elements:
+            self.elements.move_to_end(element)
+
+    def add_element(self, element):
+
+        """
+        Adds the given element to :obj:`self`.
+
+        Arguments
+        ---------
+        element : :mod:`.Element`
+            The element to be tracked by :obj:`self`.
+        """
+
+        if element in self.handlers:
+            return
+
+        self.handlers[element] = (
+            element.connect("child-added", self.__handle_child_added__),
+            element.connect("child-realized", self.__handle_child_added__),
+            element.connect("child-removed", self.__handle_child_removed__),
+            element.connect("child-hibernated", self.__handle_child_removed__),
+            element.connect("map", self.__handle_used__),
+            element.connect("set-focus-child", self.__handle_used__),
+            element.connect("unmap", self.__handle_unmap__),
+            element.connect("destroy", self.__handle_destroy__),
+        )
+        if element.get_child():
+            self.__handle_child_added__(element)
+
+    def enforce(self):
+
+        """
+        Hibernates the least recently used elements that are not mapped, till the usage of
+        :obj:`self` is within its limits.
+
+        Returns
+        -------
+        :class:`int`
+            The number of children released.
+        """
+
+        if not self.is_exceeded():
+            return 0
+
+        n_released = 0
+        candidates = [element for element in self.elements if not element.get_mapped()]
+        for element in candidates:
+            if not self.is_exceeded():
+                break
+            if element.hibernate():
+                n_released += 1
+
+        self.evictions += n_released
+        return n_released
+
+    @staticmethod
+    def get_default():
+
+        """
+        Gets the budget shared by the whole process. It is made on first call, without limits.
+
+        Returns
+        -------
+        :mod:`.Budget`
+            The default budget.
+        """
+
+        global default_budget
+        if default_budget is None:
+            default_budget = Budget()
+        return default_budget
+
+    def get_stats(self):
+
+        """
+        Gets the counters of :obj:`self`.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with keys ``children`` (the number of live children), ``cost`` (their
+            total estimated cost) and ``evictions``.
+        """
+
+        stats = {
+            "children": len(self.elements),
+            "cost": sum(self.elements.values()),
+            "evictions": self.evictions,
+        }
+        return stats
+
+    def is_exceeded(self):
+
+        """
+        Gets whether the usage of :obj:`self` is beyond its limits.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if a limit is exceeded, else :obj:`False`.
+        """
+
+        max_children = self.get_property("max-children")
+        max_cost = self.get_property("max-cost")
+        if max_children > 0 and len(self.elements) > max_children:
+            return True
+        if max_cost > 0 and sum(self.elements.values()) > max_cost:
+            return True
+        return False
+
+    def queue_enforce(self):
+
+        """
+        Schedules :meth:`enforce` to be run when the main loop is idle. Requests made before it is
+        run are merged. Nothing is done when the usage of :obj:`self` is within its limits.
+        """
+
+        if self.enforce_source is None and self.is_exceeded():
+            self.enforce_source = GLib.idle_add(self.__handle_enforce__)
+
+    def remove_element(self, element):
+
+        """
+        Removes the given element from :obj:`self`.
+
+        Arguments
+        ---------
+        element : :mod:`.Element`
+            The element that should no longer be tracked by :obj:`self`.
+        """
+
+        handlers = self.handlers.pop(element, ())
+        for handler in handlers:
+            element.disconnect(handler)
+        self.elements.pop(element, None)
@@ -0,0 +1,326 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Codec is a compact binary format for interface dictionaries, that holds the same values as JSON
+(dictionaries with string keys, lists, strings, integers, floats, booleans and :obj:`None`).
+
+A file starts with :obj:`MAGIC` followed by the version as a varint. Each value is a tag byte
+followed by its data. Integers are zigzag encoded varints and floats are 8 byte doubles. A string
+is written in full only the first time, after which it is referred by its index in the table of
+strings seen so far. So the keys like ``type``, ``provider`` and ``element_17`` that repeat across
+the interface take one or two bytes each. Lists and dictionaries are written as their length
+followed by their items.
+
+Both :func:`dump` and :func:`load` stream through the file in chunks and do not recurse, so deep
+interfaces do not hit the recursion limit. ``Aduct.save_interface`` writes this format when
+``codec="binary"`` is given and ``Aduct.load_interface`` detects it by :obj:`MAGIC`.
+"""
+
+import io
+import struct
+
+MAGIC = b"ADUCT"
+VERSION = 1
+CHUNK_SIZE = 65536
+
+NONE = 0
+FALSE = 1
+TRUE = 2
+INT = 3
+FLOAT = 4
+STR_NEW = 5
+STR_REF = 6
+LIST = 7
+DICT = 8
+
+DOUBLE = struct.Struct("<d")
+NO_KEY = object()
+
+
+class _Reader:
+    def __init__(self, fp):
+
+        self.fp = fp
+        self.buffer = b""
+        self.pos = 0
+
+    def read(self, size):
+
+        end = self.pos + size
+        if end > len(self.buffer):
+            # A read can give fewer bytes than asked (like that of a pipe), so it is repeated till
+            # there are enough bytes or the data ends.
+            chunks = [self.buffer[self.pos:]]
+            n_bytes = len(chunks[0])
+            while n_bytes < size:
+                chunk = self.fp.read(max(size - n_bytes, CHUNK_SIZE))
+                if not chunk:
+                    raise ValueError("Aduct.Codec data is truncated")
+                chunks.append(chunk)
+                n_bytes += len(chunk)
+            self.buffer = b"".join(chunks)
+            self.pos = 0
+            end = size
+        data = self.buffer[self.pos:end]
+        self.pos = end
+        return data
+
+    def read_byte(self):
+
+        if self.pos >= len(self.buffer):
+            self.buffer = self.fp.read(CHUNK_SIZE)
+            self.pos = 0
+            if not self.buffer:
+                raise ValueError("Aduct.Codec data is truncated")
+        byte = self.buffer[self.pos]
+        self.pos += 1
+        return byte
+
+    def at_end(self):
+
+        if self.pos < len(self.buffer):
+            return False
+        self.buffer = self.fp.read(CHUNK_SIZE)
+        self.pos = 0
+        return not self.buffer
+
+    def read_varint(self):
+
+        pos = self.pos
+        buffer = self.buffer
+        if pos < len(buffer) and buffer[pos] < 0x80:
+            self.pos = pos + 1
+            return buffer[pos]
+
+        shift = 0
+        value = 0
+        while True:
+            byte = self.read_byte()
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+
+def _write_varint(buffer, value):
+
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def dump(obj, fp):
+
+    """
+    Writes the given value to a binary file.
+
+    Arguments
+    ---------
+    obj : :class:`dict`
+        The value to be written, usually an interface dictionary.
+    fp : :class:`io.BufferedIOBase`
+        The file opened for writing in binary mode.
+
+    Raises
+    ------
+    TypeError
+        Raised when :obj:`obj` holds a value that can not be written, or a dictionary key that is
+        not a string.
+    """
+
+    buffer = bytearray(MAGIC)
+    _write_varint(buffer, VERSION)
+    strings = {}
+    stack = [obj]
+
+    while stack:
+        value = stack.pop()
+        if value is None:
+            buffer.append(NONE)
+        elif value is False:
+            buffer.append(FALSE)
+        elif value is True:
+            buffer.append(TRUE)
+        elif isinstance(value, str):
+            index = strings.get(value)
+            if index is None:
+                strings[value] = len(strings)
+                data = value.encode()
+                buffer.append(STR_NEW)
+                _write_varint(buffer, len(data))
+                buffer += data
+            else:
+                buffer.append(STR_REF)
+                _write_varint(buffer, index)
+        elif isinstance(value, int):
+            buffer.append(INT)
+            _write_varint(buffer, value << 1 if value >= 0 else ((-value) << 1) - 1)
+        elif isinstance(value, float):
+            buffer.append(FLOAT)
+            buffer += DOUBLE.pack(value)
+        elif isinstance(value, dict):
+            buffer.append(DICT)
+            _write_varint(buffer, len(value))
+            for key, item in reversed(list(value.items())):
+                if not isinstance(key, str):
+                    raise TypeError(f"Keys must be str for Aduct.Codec, not {type(key).__name__}")
+                stack.append(item)
+                stack.append(key)
+        elif isinstance(value, (list, tuple)):
+            buffer.append(LIST)
+            _write_varint(buffer, len(value))
+            stack.extend(reversed(value))
+        else:
+            name = type(value).__name__
+            raise TypeError(f"Object of type {name} can not be written by Aduct.Codec")
+
+        if len(buffer) >= CHUNK_SIZE:
+            fp.write(buffer)
+            buffer.clear()
+
+    fp.write(buffer)
+
+
+def dumps(obj):
+
+    """
+    Encodes the given value into bytes. See :func:`dump`.
+
+    Arguments
+    ---------
+    obj : :class:`dict`
+        The value to be encoded, usually an interface dictionary.
+
+    Returns
+    -------
+    :class:`bytes`
+        The encoded value.
+    """
+
+    fp = io.BytesIO()
+    dump(obj, fp)
+    return fp.getvalue()
+
+
+def load(fp):
+
+    """
+    Reads a value written by :func:`dump` from a binary file.
+
+    Arguments
+    ---------
+    fp : :class:`io.BufferedIOBase`
+        The file opened for reading in binary mode.
+
+    Returns
+    -------
+    :class:`dict`
+        The value read, usually an interface dictionary.
+
+    Raises
+    ------
+    ValueError
+        Raised when the data is not of this format or version, is corrupt or has bytes after the
+        value.
+    """
+
+    reader = _Reader(fp)
+    if reader.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Data is not in Aduct.Codec format")
+    version = reader.read_varint()
+    if version != VERSION:
+        raise ValueError(f"Expected Aduct.Codec version {VERSION}, but got {version}")
+
+    read_byte = reader.read_byte
+    read_varint = reader.read_varint
+    strings = []
+    stack = []
+    while True:
+        size = 0
+        tag = read_byte()
+        # The tags are checked in the order of how often they occur in an interface.
+        if tag == STR_REF:
+            value = strings[read_varint()]
+        elif tag == DICT:
+            value = {}
+            size = read_varint()
+        elif tag == INT:
+            value = read_varint()
+            value = -((value + 1) >> 1) if value & 1 else value >> 1
+        elif tag == STR_NEW:
+            value = reader.read(read_varint()).decode()
+            strings.append(value)
+        elif tag == NONE:
+            value = None
+        elif tag == FALSE:
+            value = False
+        elif tag == TRUE:
+            value = True
+        elif tag == FLOAT:
+            value = DOUBLE.unpack(reader.read(DOUBLE.size))[0]
+        elif tag == LIST:
+            value = []
+            size = read_varint()
+        else:
+            raise ValueError(f"Unknown tag {tag} in Aduct.Codec data")
+
+        if stack:
+            frame = stack[-1]
+            container = frame[0]
+            if container.__class__ is dict:
+                if frame[2] is NO_KEY:
+                    frame[2] = value
+                    continue
+                container[frame[2]] = value
+                frame[2] = NO_KEY
+            else:
+                container.append(value)
+            frame[1] -= 1
+            while stack and stack[-1][1] == 0:
+                stack.pop()
+        else:
+            root = value
+
+        if size:
+            stack.append([value, size, NO_KEY])
+        if not stack:
+            break
+
+    if not reader.at_end():
+        raise ValueError("Aduct.Codec data has bytes after the value")
+    return root
+
+
+def loads(data):
+
+    """
+    Decodes a value encoded by :func:`dumps`. See :func:`load`.
+
+    Arguments
+    ---------
+    data : :class:`bytes`
+        The encoded value.
+
+    Returns
+    -------
+    :class:`dict`
+        The decoded value.
+    """
+
+    return load(io.BytesIO(data))
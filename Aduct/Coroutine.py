@@ -0,0 +1,318 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Coroutine lets providers and signal handlers be coroutines, by running an asyncio event loop on
+the GLib main context. The loop is installed by :func:`install_event_loop`, before the main loop
+is run.
+
+.. code:: python
+
+   import Aduct
+   from Aduct import Coroutine
+
+   Coroutine.install_event_loop()
+
+   async def on_clicked(button, element):
+       await Coroutine.change_child_at_element(element, provider, "Entry")
+
+   Coroutine.connect(button, "clicked", on_clicked, element)
+   Gtk.main()
+
+With the loop installed, ``Provider.get_a_child``, ``Provider.get_child_from_props``,
+``Provider.prepare`` and ``Provider.build`` can be coroutine functions. They are awaited by the
+functions of this module and by the methods of providers and elements that do not block, while the
+blocking ones like ``Aduct.set_interface`` raise :class:`TypeError` for them.
+"""
+
+import asyncio
+import inspect
+
+from . import _get_props_to_build, _get_props_to_prepare, change_child_at_element_async
+from . import resolve_interface
+from . import set_interface as set_prepared_interface
+
+tasks = set()
+
+
+def install_event_loop():
+
+    """
+    Installs an asyncio event loop that runs on the GLib main context.
+
+    The loop of PyGObject (``gi.events``, from version 3.50) is used when available, else the one
+    of ``gbulb``.
+
+    Returns
+    -------
+    :class:`asyncio.AbstractEventLoop`
+        The installed event loop.
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        Raised when neither of them is available.
+    """
+
+    try:
+        from gi.events import GLibEventLoopPolicy
+    except ImportError:
+        try:
+            import gbulb
+        except ImportError:
+            raise RuntimeError("Aduct.Coroutine requires PyGObject >= 3.50 or gbulb")
+        gbulb.install(gtk=True)
+    else:
+        asyncio.set_event_loop_policy(GLibEventLoopPolicy())
+    return asyncio.get_event_loop_policy().get_event_loop()
+
+
+def connect(obj, signal, coroutine_func, *args):
+
+    """
+    Connects a coroutine function to the given signal.
+
+    Each emission schedules a task of ``coroutine_func(obj, *signal_args, *args)`` on the event
+    loop. The value returned to the emitter is always :obj:`None`.
+
+    Arguments
+    ---------
+    obj : :class:`GObject.Object`
+        The object whose signal has to be connected.
+    signal : :class:`str`
+        The name of signal.
+    coroutine_func : :class:`callable`
+        The coroutine function that handles the signal.
+    *args
+        The values to be passed to :obj:`coroutine_func` after the signal arguments.
+
+    Returns
+    -------
+    :class:`int`
+        The handler id, as returned by ``GObject.Object.connect``.
+    """
+
+    def handler(*signal_args):
+        run(coroutine_func(*signal_args))
+
+    return obj.connect(signal, handler, *args)
+
+
+def run(coroutine):
+
+    """
+    Schedules the given coroutine as a task on the event loop.
+
+    A reference to the task is kept till it is done, so that it is not garbage collected while
+    it runs.
+
+    Arguments
+    ---------
+    coroutine : :class:`collections.abc.Coroutine`
+        The coroutine to be run.
+
+    Returns
+    -------
+    :class:`asyncio.Task`
+        The scheduled task.
+    """
+
+    task = asyncio.ensure_future(coroutine)
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+    return task
+
+
+async def change_child_at_element(element, provider, child_name):
+
+    """
+    Changes the child at given element, waiting for the child to be added.
+
+    It is same as ``Aduct.change_child_at_element_async``, except that it returns once the child
+    is added. If the request is superseded by another request at :obj:`element`,
+    :class:`asyncio.CancelledError` is raised. Cancelling this coroutine cancels the request.
+
+    Arguments
+    ---------
+    element : :mod:`.Element`
+        The element whose child has to be changed.
+    provider : :mod:`.Provider`
+        The provider that acts as source of child. Its ``get_a_child`` can be a coroutine
+        function.
+    child_name  : :class:`str`
+        The name of child to be added to :obj:`element`.
+    """
+
+    change_child_at_element_async(element, provider, child_name)
+    await wait_for_request(element)
+
+
+async def prepare_interface(interface_props):
+
+    """
+    Runs ``Provider.prepare`` for the elements of given interface properties concurrently.
+
+    It is same as ``Aduct.prepare_interface``, except that ``Provider.prepare`` that is a coroutine
+    function is awaited on the event loop, while the others are run in the default executor of
+    the loop.
+
+    Arguments
+    ---------
+    interface_props : :class:`dict`
+        The interface properties, whose ``type`` and ``provider`` values are already substituted
+        with objects.
+    """
+
+    loop = asyncio.get_running_loop()
+    to_prepare = _get_props_to_prepare(interface_props)
+
+    awaitables = []
+    for props in to_prepare:
+        prepare = props["provider"].prepare
+        if inspect.iscoroutinefunction(prepare):
+            awaitables.append(prepare(props["child"]))
+        else:
+            awaitables.append(loop.run_in_executor(None, prepare, props["child"]))
+
+    results = await asyncio.gather(*awaitables)
+    for props, prepared in zip(to_prepare, results):
+        props["prepared"] = prepared
+
+
+async def build_interface(interface_props):
+
+    """
+    Builds the children of elements of given interface properties whose provider builds them
+    through a coroutine function.
+
+    The child is built by ``Provider.build`` when the element is prepared, else by
+    ``Provider.get_child_from_props``, and awaited when it is awaitable. It is stored at the
+    ``built`` key of properties of its element, which is taken out by ``Element.set_from_props``.
+    Lazy elements are skipped, as they request their child without blocking when mapped.
+
+    Arguments
+    ---------
+    interface_props : :class:`dict`
+        The interface properties, whose ``type`` and ``provider`` values are already substituted
+        with objects.
+    """
+
+    for props in _get_props_to_build(interface_props):
+        provider = props["provider"]
+        if "built" in props or not (
+            inspect.iscoroutinefunction(provider.build)
+            or inspect.iscoroutinefunction(provider.get_child_from_props)
+        ):
+            continue
+        if "prepared" in props:
+            result = provider.build(props.pop("prepared"))
+        else:
+            result = provider.get_child_from_props(props["child"])
+        if inspect.isawaitable(result):
+            result = await result
+        props["built"] = result
+
+
+async def set_interface(interface_dict, top_level, creator_maps, init_maps):
+
+    """
+    Sets the interface starting from given the top level, without blocking while elements are
+    prepared.
+
+    It is same as ``Aduct.set_interface``, except that the preparation of elements is awaited
+    through :func:`prepare_interface` and their children are built through
+    :func:`build_interface` before the views are made.
+
+    Arguments
+    ---------
+    interface_dict: :class:`dict`
+        A dictionary that can be used to set interface.
+    top_level: :mod:`.View`
+        The root widget from which the interface has to be set.
+    creator_maps : :class:`dict`
+        A dictionary of format ``{key: (func, args, kwargs)}``. See ``Aduct.set_interface``.
+    init_maps : :class:`dict`
+        A dictionary of format ``{key: object}``. See ``Aduct.set_interface``.
+
+    Returns
+    -------
+    :class:`Gtk.Widget`
+        The widget that was previous child of :obj:`top_level`, :obj:`None` if :obj:`top_level` has
+        no child.
+    """
+
+    interface_props = resolve_interface(interface_dict, creator_maps, init_maps)
+    await prepare_interface(interface_props)
+    await build_interface(interface_props)
+    return set_prepared_interface(interface_props, top_level, {}, {})
+
+
+async def wait_for_request(element):
+
+    """
+    Waits till the child requested without blocking at given element is added, or till a deferred
+    child being built at it is realized.
+
+    Returns immediately when :obj:`element` has no request in flight. Cancelling this coroutine
+    cancels the request.
+
+    Arguments
+    ---------
+    element : :mod:`.Element`
+        The element whose request has to be waited for.
+
+    Raises
+    ------
+    :class:`asyncio.CancelledError`
+        Raised when the request is cancelled.
+    :class:`Exception`
+        The exception raised by the provider, when the child could not be made.
+    """
+
+    request = element.request
+    if request is None:
+        return
+
+    future = asyncio.get_running_loop().create_future()
+
+    def handle_added(element):
+        if not future.done():
+            future.set_result(None)
+
+    def handle_failed(element, error):
+        if not future.done():
+            future.set_exception(error)
+
+    def handle_cancelled(request):
+        if not future.done():
+            future.cancel()
+
+    added_handler = element.connect("child-added", handle_added)
+    realized_handler = element.connect("child-realized", handle_added)
+    failed_handler = element.connect("child-failed", handle_failed)
+    cancelled_handler = request.connect("cancelled", handle_cancelled)
+    try:
+        await future
+    except asyncio.CancelledError:
+        if element.request is request:
+            element.cancel_request()
+        raise
+    finally:
+        element.disconnect(added_handler)
+        element.disconnect(realized_handler)
+        element.disconnect(failed_handler)
+        request.disconnect(cancelled_handler)
@@ -32,12 +32,47 @@ The format of ``child_dict`` is as follows
 
 Here only ``header_child`` key is optional.
 
-
+An element made with ``lazy=True`` does not build its child in :meth:`Element.set_from_props`
+until it is mapped. Till then, it holds a cheap placeholder and the interface properties of the
+child, which are used to build the child through the provider when :obj:`map` is emitted.
+
+An element made with a positive ``hibernate_timeout`` hibernates when it stays unmapped for that
+many seconds. The state of child is saved through ``Provider.get_child_props``, the child is
+cleared by the provider and a placeholder is held in its place, just like a deferred child. The
+child is built again when the element is mapped. Providers can opt out through
+``Provider.can_hibernate``. The counters of hibernation are given by
+:meth:`Element.get_hibernation_stats`.
+
+A child can also be requested without blocking through :meth:`Element.set_child_async` or
+:meth:`Element.set_from_props_async`. A placeholder is shown till the provider hands over the
+child. Only the latest request lands, so a request that is superseded (or cancelled by
+:meth:`Element.cancel_request`) is cancelled and its child, if any arrives, is cleared by the
+provider. A request whose child could not be made removes its placeholder and emits
+``child-failed``. A deferred child of a coroutine provider is requested the same way when the
+element is mapped, but its placeholder and properties are kept till the child lands.
+
+The properties given by :meth:`Element.get_props` can be cached (see :mod:`.View`). The cache is
+dropped when a child is added or removed, or when the provider emits ``child-props-changed`` for
+the child of element.
 """
-from gi.repository import GObject, Gtk
+import inspect
+
+from gi.repository import Gio, GLib, GObject, Gtk
 
+from . import Batch, Registry, Walk
+from .Budget import Budget
 from .Views.View import View
 
+hibernation_stats = {"hibernated": 0, "restored": 0, "reclaimed": 0, "reclaimed_total": 0}
+
+
+def _clear_child_dict(child_dict):
+
+    # A deferred child, taken by Element.take_child, has nothing built to clear.
+    provider = child_dict.pop("provider")
+    if "props" not in child_dict and not provider.recycle_child(child_dict):
+        provider.clear_child(child_dict)
+
 
 class Element(View, Gtk.Grid):
 
@@ -45,12 +80,17 @@ class Element(View, Gtk.Grid):
         "action-clicked": (2, None, (Gtk.Button, int)),
         "child-added": (2, None, ()),
         "child-cleared": (2, None, ()),
+        "child-failed": (2, None, (object,)),
+        "child-hibernated": (2, None, ()),
+        "child-realized": (2, None, ()),
         "child-removed": (2, None, ()),
+        "interface-changed": (2, None, ()),
     }
 
     type = GObject.Property(type=str, default="element", flags=GObject.ParamFlags.READABLE)
 
-    def __init__(self, child_dict=None, use_action_button=True, pack_type=0, **kwargs):
+    def __init__(self, child_dict=None, use_action_button=True, pack_type=0, lazy=False,
+                 hibernate_timeout=0, budget=None, **kwargs):
 
         """
         Makes an element based on given properties. Its CSS name is *aduct-element*.
@@ -66,6 +106,16 @@ class Element(View, Gtk.Grid):
             Specfies the position of action button. It can be an integer of value either 0 or 1,
             which represents :class:`Gtk.PackType.START` or :class:`Gtk.PackType.END` respectively.
             The default value is :class:`Gtk.PackType.START`.
+        lazy : :class:`bool`
+            States whether to defer building the child in :meth:`set_from_props` till :obj:`self`
+            is mapped. Default is :class:`False`.
+        hibernate_timeout : :class:`int`
+            The number of seconds :obj:`self` has to stay unmapped before it hibernates. Default
+            is 0, which disables hibernation.
+        budget : :mod:`.Budget`
+            The budget that :obj:`self` has to be added to. When not given, :obj:`self` is added to
+            the default budget given by ``Budget.get_default``. It is :obj:`False` to not add
+            :obj:`self` to any budget.
         **kwargs
             The values to be passed to :class:`Gtk.Grid`, from which :mod:`.Element` is derived.
 
@@ -74,12 +124,21 @@ class Element(View, Gtk.Grid):
         action_button : :class:`Gtk.Button`
             Action button that is used to handle interactions with user. Its default name is
             *aduct-element-action_button*.
+        budget : :mod:`.Budget`
+            The budget that :obj:`self` is added to, :obj:`None` if it is not added to any.
         child_name : :class:`str`
             The name of child held by :obj:`self`.
+        hibernate_timeout : :class:`int`
+            The number of seconds :obj:`self` has to stay unmapped before it hibernates.
+        lazy : :class:`bool`
+            States whether building the child is deferred till :obj:`self` is mapped.
         pack_type : :class:`Gtk.PackType`
             The position of action button in :obj:`self`.
         provider : :mod:`.Provider`
             The provider that produced the child of :obj:`self`.
+        request : :class:`Gio.Cancellable`
+            The cancellable of the child requested without blocking, :obj:`None` if there is no
+            such request in flight.
 
         Signals
             action-clicked
@@ -89,8 +148,17 @@ class Element(View, Gtk.Grid):
                 Emitted when a child is added to :obj:`self`.
             child-cleared
                 Emitted when the child of :obj:`self` is cleared.
+            child-failed
+                Emitted with the raised exception when a child requested without blocking could
+                not be made.
+            child-hibernated
+                Emitted when the child of :obj:`self` is released by hibernation.
+            child-realized
+                Emitted when a deferred child is built and added to :obj:`self`.
             child-removed
                 Emitted when the child of :obj:`self` is removed.
+            interface-changed
+                Emitted when the properties of :obj:`self` are changed.
 
         Note
         ----
@@ -100,32 +168,140 @@ class Element(View, Gtk.Grid):
 
         Gtk.Grid.__init__(self, **kwargs)
         self.set_css_name("aduct-element")
+        Registry.add(self)
 
         self.action_button = Gtk.Button(name="aduct-element-action_button",
                                         halign=Gtk.Align.START,
                                         relief=Gtk.ReliefStyle.NORMAL)
 
         self.pack_type = pack_type
+        self.lazy = lazy
+        self.pending_props = None
+        self.hibernate_timeout = hibernate_timeout
+        self.hibernate_source = None
+        self.hibernated_cost = None
+        self.request = None
+        self.provider_handler = None
+        self.child_name = None
+        self.provider = None
 
         if child_dict:
             self.set_child(child_dict)
-        else:
-            self.child_name = None
-            self.provider = None
 
         if use_action_button:
             self.enable_action_button()
         self.action_button.connect("button-press-event", self.__handle_event__)
+        self.connect("map", self.__handle_map__)
+        self.connect("unmap", self.__handle_unmap__)
+        self.connect("destroy", self.__handle_destroy__)
+        self.connect("child-added", self.__handle_changed__)
+        self.connect("child-realized", self.__handle_changed__)
+        self.connect("child-removed", self.__handle_changed__)
+
+        if budget is None:
+            budget = Budget.get_default()
+        self.budget = budget or None
+        if self.budget is not None:
+            self.budget.add_element(self)
 
     def __add_child__(self, child):
 
         self.attach(child, 0, 1, 2, 1)
 
+    def __add_child_dict__(self, child_dict):
+
+        child = child_dict.get("child")
+        child_name = child_dict.get("child_name")
+        icon = child_dict.get("icon")
+        provider = child_dict.get("provider")
+        header_child = child_dict.get("header_child", None)
+
+        self.__add_child__(child)
+        self.set_child_name(child_name)
+        self.set_icon(icon)
+        self.set_provider(provider)
+
+        if header_child:
+            self.set_header_child(header_child)
+
+        Batch.show_all(self)
+
+    def __add_placeholder__(self, provider, child_props):
+
+        self.pending_props = child_props
+        self.__add_child__(self.get_placeholder())
+        self.set_child_name(child_props["child_name"])
+        self.set_provider(provider)
+        Batch.show_all(self)
+
     def __handle_event__(self, button, event):
 
         self.emit("action-clicked", button, event.button)
         return True
 
+    def __begin_request__(self):
+
+        if self.child_name:
+            self.clear_child()
+        self.cancel_request()
+
+        self.request = Gio.Cancellable()
+        self.__add_child__(self.get_placeholder())
+        Batch.show_all(self)
+        return self.request
+
+    def __finish_request__(self, child_dict, request, provider, child_name, error=None):
+
+        if request is not self.request or request.is_cancelled():
+            if child_dict:
+                provider.clear_child(child_dict)
+            return
+
+        self.remove(self.get_child_at(0, 1))
+        self.request = None
+        if error is not None:
+            self.emit("child-failed", error)
+            return
+
+        child_dict["child_name"] = child_name
+        child_dict["provider"] = provider
+        self.set_child(child_dict)
+
+    def __handle_destroy__(self, element):
+
+        self.__stop_hibernate_timer__()
+        if self.request is not None:
+            self.request.cancel()
+        # A hibernating element that is destroyed no longer holds its cost back.
+        if self.hibernated_cost is not None:
+            hibernation_stats["reclaimed"] -= self.hibernated_cost
+            self.hibernated_cost = None
+
+    def __handle_map__(self, element):
+
+        self.__stop_hibernate_timer__()
+        if self.pending_props is not None:
+            self.realize_child()
+
+    def __handle_props_changed__(self, provider, child):
+
+        if child is self.get_child():
+            self.mark_dirty()
+
+    def __handle_timeout__(self):
+
+        self.hibernate_source = None
+        if not self.get_mapped():
+            self.hibernate()
+        return False
+
+    def __handle_unmap__(self, element):
+
+        if self.hibernate_timeout > 0 and self.hibernate_source is None:
+            self.hibernate_source = GLib.timeout_add_seconds(
+                self.hibernate_timeout, self.__handle_timeout__
+            )
+
     def __remove_child__(self):
 
         child = self.get_child()
@@ -151,16 +327,47 @@ class Element(View, Gtk.Grid):
             self.remove(header_child)
         return header_child
 
+    def __remove_placeholder__(self):
+
+        self.remove(self.get_child_at(0, 1))
+        child_props = self.pending_props
+        self.pending_props = None
+
+        if self.hibernated_cost is not None:
+            hibernation_stats["reclaimed"] -= self.hibernated_cost
+            self.hibernated_cost = None
+        return child_props
+
+    def __stop_hibernate_timer__(self):
+
+        if self.hibernate_source is not None:
+            GLib.source_remove(self.hibernate_source)
+            self.hibernate_source = None
+
+    def cancel_request(self):
+
+        """
+        Cancels the child requested without blocking and removes its placeholder. Nothing is done
+        if there is no request in flight.
+        """
+
+        if self.request is None:
+            return
+        self.request.cancel()
+        # A deferred child being built keeps its placeholder, which goes with the deferred child.
+        if self.pending_props is None:
+            self.remove(self.get_child_at(0, 1))
+        self.request = None
+
     def clear_child(self):
 
         """
         Clears the child at :obj:`self`.
-        After clearing, :obj:`child-cleared` signal is emitted.
+        The child is parked in the pool of its provider when possible, else it is cleared by the
+        provider. After clearing, :obj:`child-cleared` signal is emitted.
         """
 
-        child_dict = self.remove_child()
-        provider = child_dict.pop("provider")
-        provider.clear_child(child_dict)
+        _clear_child_dict(self.take_child())
         self.emit("child-cleared")
 
     def disable_action_button(self):
@@ -189,11 +396,27 @@ class Element(View, Gtk.Grid):
         Returns
         -------
         :class:`Gtk.Widget` or :obj:`None`
-            The child of :obj:`self` or :obj:`None` if :obj:`self` has no child.
+            The child of :obj:`self` or :obj:`None` if :obj:`self` has no child or its child is
+            not yet built.
         """
 
+        if self.pending_props is not None or self.request is not None:
+            return None
         return self.get_child_at(0, 1)
 
+    def get_child_slots(self):
+
+        """
+        Gets the slots of children of interface, which :obj:`self` has none.
+
+        Returns
+        -------
+        :class:`list`
+            An empty list.
+        """
+
+        return []
+
     def get_child_name(self):
 
         """
@@ -221,6 +444,23 @@ class Element(View, Gtk.Grid):
         x_coord = not self.pack_type
         return self.get_child_at(x_coord, 0)
 
+    @staticmethod
+    def get_hibernation_stats():
+
+        """
+        Gets the counters of hibernation of all elements.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with keys ``hibernated`` and ``restored`` (the number of times a child
+            was released and rebuilt), ``reclaimed`` (the estimated cost held by hibernating
+            elements now) and ``reclaimed_total`` (the estimated cost released so far). The cost
+            is estimated by ``Provider.get_child_cost``.
+        """
+
+        return {**hibernation_stats}
+
     def get_icon(self):
 
         """
@@ -234,19 +474,49 @@ class Element(View, Gtk.Grid):
 
         return self.action_button.get_child()
 
-    def get_props(self):
+    def get_props(self, use_cache=False):
 
         """
         Gets the properties of child held by :obj:`self`.
 
+        Arguments
+        ---------
+        use_cache : :class:`bool`
+            States whether to reuse the cached properties. The returned dictionary is then shared
+            and must not be modified. Default is :obj:`False`.
+
         Returns
         -------
         :class:`dict`
             The dictionary that can be later used to build the same interface.
         """
 
-        props = {"type": "element"}
-        if self.child_name:
+        if use_cache and self.props_cache is not None:
+            return self.props_cache
+
+        props = self.get_own_props()
+        if use_cache:
+            self.props_cache = props
+        return props
+
+    def get_own_props(self):
+
+        """
+        Gets the properties of child held by :obj:`self`, as :obj:`self` has no children of
+        interface.
+
+        Returns
+        -------
+        :class:`dict`
+            The dictionary that can be later used to build the same interface.
+        """
+
+        props = {"type": "element", "id": self.id}
+        if self.pending_props is not None:
+            props["provider"] = self.provider.get_name()
+            # A copy, so that changing the properties does not change the deferred child.
+            props["child"] = Walk.copy_props(self.pending_props)
+        elif self.child_name:
             child_props = self.provider.get_child_props(
                 self.child_name, self.get_child(), self.get_header_child()
             )
@@ -257,6 +527,19 @@ class Element(View, Gtk.Grid):
             props["child"] = {}
         return props
 
+    def get_placeholder(self):
+
+        """
+        Gets a new placeholder that stands in for a child which is not yet built.
+
+        Returns
+        -------
+        :class:`Gtk.Widget`
+            The placeholder. Its name is *aduct-element-placeholder*.
+        """
+
+        return Gtk.Label(name="aduct-element-placeholder", expand=True)
+
     def get_provider(self):
 
         """
@@ -283,13 +566,126 @@ class Element(View, Gtk.Grid):
 
         return self.get_property("type")
 
+    def hibernate(self):
+
+        """
+        Releases the child of :obj:`self` and holds a placeholder in its place.
+
+        The state of child is saved through ``Provider.get_child_props`` and the child is cleared
+        by the provider. The child is built again from the saved state when :obj:`self` is mapped.
+        Nothing is done when :obj:`self` has no built child or the provider does not allow it.
+        A :obj:`child-hibernated` signal is emitted after release.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if the child was released, else :obj:`False`.
+        """
+
+        if not self.child_name or self.pending_props is not None:
+            return False
+
+        provider = self.provider
+        child_name = self.child_name
+        child = self.get_child()
+        if not provider.can_hibernate(child_name, child):
+            return False
+
+        child_props = provider.get_child_props(child_name, child, self.get_header_child())
+        cost = provider.get_child_cost(child_name, child)
+
+        child_dict = {"child_name": child_name}
+        child_dict["child"] = self.__remove_child__()
+        child_dict["icon"] = self.__remove_icon__()
+        child_dict["header_child"] = self.__remove_header_child__()
+        provider.clear_child(child_dict)
+
+        self.__add_placeholder__(provider, child_props)
+        self.hibernated_cost = cost
+        hibernation_stats["hibernated"] += 1
+        hibernation_stats["reclaimed"] += cost
+        hibernation_stats["reclaimed_total"] += cost
+
+        self.emit("child-hibernated")
+        return True
+
+    def is_child_pending(self):
+
+        """
+        Gets whether :obj:`self` holds a child that is not yet built.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if the child of :obj:`self` is waiting to be built, else :obj:`False`.
+        """
+
+        return self.pending_props is not None
+
+    def realize_child(self):
+
+        """
+        Builds the deferred child of :obj:`self` and replaces the placeholder with it.
+
+        The child is built through ``Provider.get_child_from_props`` with the properties saved by
+        :meth:`set_from_props`. Nothing is done if :obj:`self` has no deferred child or it is
+        already being built. A :obj:`child-realized` signal is emitted after addition.
+
+        The child of a coroutine provider is requested without blocking. Till it lands, the
+        placeholder and the properties of child are kept, and a :obj:`child-failed` signal is
+        emitted if it could not be made.
+        """
+
+        if self.pending_props is None or self.request is not None:
+            return
+
+        provider = self.provider
+        child_props = self.pending_props
+
+        if inspect.iscoroutinefunction(provider.get_child_from_props):
+            request = self.request = Gio.Cancellable()
+
+            def callback(child_dict, error=None):
+                if request is not self.request or request.is_cancelled():
+                    if child_dict:
+                        provider.clear_child(child_dict)
+                    return
+                self.request = None
+                if error is not None:
+                    self.emit("child-failed", error)
+                    return
+                if self.hibernated_cost is not None:
+                    hibernation_stats["restored"] += 1
+                self.__remove_placeholder__()
+                child_dict["child_name"] = child_props["child_name"]
+                child_dict["provider"] = provider
+
+                self.__add_child_dict__(child_dict)
+                self.emit("child-realized")
+
+            provider.get_child_from_props_async(child_props, request, callback)
+            return
+
+        # The placeholder goes only once the child is built, so a provider that raises leaves
+        # the deferred child as it is.
+        child_dict = provider.get_child_from_props(child_props)
+        provider.__check_child__(child_dict, "get_child_from_props")
+        if self.hibernated_cost is not None:
+            hibernation_stats["restored"] += 1
+        self.__remove_placeholder__()
+        child_dict["child_name"] = child_props["child_name"]
+        child_dict["provider"] = provider
+
+        self.__add_child_dict__(child_dict)
+        self.emit("child-realized")
+
     def remove_child(self):
 
         """
         Removes the child held by :obj:`self`.
 
         By removing a child, all its associated properties like icon, header child are also
-        removed.
+        removed. A deferred child is built before it is removed.
         A :obj:`child-removed` signal is emitted by :obj:`self` after removal.
 
         Raises
@@ -307,6 +703,7 @@ class Element(View, Gtk.Grid):
             err = "Aduct.Element has no child"
             raise ValueError(err)
 
+        self.realize_child()
         child_dict = {}
 
         child_dict["child_name"] = self.child_name
@@ -317,7 +714,7 @@ class Element(View, Gtk.Grid):
         child_dict["header_child"] = self.__remove_header_child__()
 
         self.child_name = None
-        self.provider = None
+        self.set_provider(None)
 
         self.emit("child-removed")
 
@@ -329,7 +726,8 @@ class Element(View, Gtk.Grid):
         Sets the child in :obj:`self` from given properties.
 
         If :obj:`self` already has a child, then its cleared before adding this new child.
-        A :obj:`child-added` signal is emitted after addition.
+        A :obj:`child-added` signal is emitted after addition. A deferred child taken by
+        :meth:`take_child` is set back deferred, and it is built if :obj:`self` is mapped.
 
         Arguments
         ---------
@@ -337,32 +735,62 @@ class Element(View, Gtk.Grid):
             A valid dictionary with properties of child.
         """
 
+        self.cancel_request()
         if self.child_name:
             self.clear_child()
 
-        child = child_dict.get("child")
-        child_name = child_dict.get("child_name")
-        icon = child_dict.get("icon")
-        provider = child_dict.get("provider")
-        header_child = child_dict.get("header_child", None)
+        if "props" in child_dict:
+            self.__add_placeholder__(child_dict["provider"], child_dict["props"])
+            self.emit("child-added")
+            if self.get_mapped():
+                self.realize_child()
+            return
 
-        self.__add_child__(child)
-        self.set_child_name(child_name)
-        self.set_icon(icon)
-        self.set_provider(provider)
+        self.__add_child_dict__(child_dict)
+        self.emit("child-added")
 
-        if header_child:
-            self.set_header_child(header_child)
+    def set_child_async(self, provider, child_name):
 
-        self.show_all()
-        self.emit("child-added")
+        """
+        Requests a child of given name from the provider without blocking.
+
+        If :obj:`self` already has a child, then its cleared and a placeholder is shown till the
+        child is handed over by ``Provider.get_a_child_async``. Any request in flight is
+        cancelled. A :obj:`child-added` signal is emitted after addition, or a
+        :obj:`child-failed` signal if the child could not be made.
+
+        Arguments
+        ---------
+        provider : :mod:`.Provider`
+            The provider that acts as source of child.
+        child_name : :class:`str`
+            The name of child to be added to :obj:`self`.
+        """
+
+        request = self.__begin_request__()
+
+        def callback(child_dict, error=None):
+            self.__finish_request__(child_dict, request, provider, child_name, error)
+
+        provider.get_a_child_async(child_name, request, callback)
 
     def set_from_props(self, props):
 
         """
         Sets the interface of :obj:`self` from given properties.
 
-        If :obj:`self` already has a child, then its cleared before adding this new child.
+        If :obj:`self` already has a child, then its cleared before adding this new child. When
+        :obj:`lazy` is :obj:`True` and :obj:`self` is not mapped, a placeholder is added instead
+        and the child is built when :obj:`self` is mapped.
+
+        When :obj:`props` has a ``prepared`` key, it is taken out and the child is built from its
+        value by ``Provider.build``, else the child is built by ``Provider.get_child_from_props``.
+        When it has a ``built`` key, its value is taken out and used as the ``child_dict`` of child.
+
+        Raises
+        ------
+        :class:`TypeError`
+            Raised when the provider builds the child through a coroutine function.
 
         Arguments
         ---------
@@ -370,17 +798,86 @@ class Element(View, Gtk.Grid):
             The dictionary from which properties are set.
         """
 
+        if "id" in props:
+            self.set_id(props["id"], replace=True)
         provider = props["provider"]
         if not provider:
             return
 
         child_props = props["child"]
-        child_dict = provider.get_child_from_props(child_props)
+        self.cancel_request()
+        if self.lazy and not self.get_mapped():
+            props.pop("prepared", None)
+            props.pop("built", None)
+            if self.child_name:
+                self.clear_child()
+            self.__add_placeholder__(provider, child_props)
+            self.emit("child-added")
+            return
+
+        if "built" in props:
+            child_dict = props.pop("built")
+        elif "prepared" in props:
+            child_dict = provider.build(props.pop("prepared"))
+            provider.__check_child__(child_dict, "build")
+        else:
+            child_dict = provider.get_child_from_props(child_props)
+            provider.__check_child__(child_dict, "get_child_from_props")
         child_dict["child_name"] = child_props["child_name"]
         child_dict["provider"] = provider
 
         self.set_child(child_dict)
 
+    def set_own_props(self, props):
+
+        """
+        Sets the interface of :obj:`self` from given properties, see :meth:`set_from_props`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The dictionary from which properties are set.
+
+        Returns
+        -------
+        :class:`list`
+            An empty list, as :obj:`self` has no children of interface.
+        """
+
+        self.set_from_props(props)
+        return []
+
+    def set_from_props_async(self, props):
+
+        """
+        Sets the interface of :obj:`self` from given properties without blocking.
+
+        It is same as :meth:`set_from_props`, except that the child is requested through
+        ``Provider.get_child_from_props_async`` and a placeholder is shown till it is handed over.
+        Any request in flight is cancelled.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The dictionary from which properties are set.
+        """
+
+        if "id" in props:
+            self.set_id(props["id"], replace=True)
+        provider = props["provider"]
+        if not provider:
+            return
+
+        child_props = props["child"]
+        request = self.__begin_request__()
+
+        def callback(child_dict, error=None):
+            self.__finish_request__(
+                child_dict, request, provider, child_props["child_name"], error
+            )
+
+        provider.get_child_from_props_async(child_props, request, callback)
+
     def set_child_name(self, child_name):
 
         """
@@ -393,6 +890,7 @@ class Element(View, Gtk.Grid):
         """
 
         self.child_name = child_name
+        Registry.update(self)
 
     def set_header_child(self, header_child):
 
@@ -431,4 +929,47 @@ class Element(View, Gtk.Grid):
             The new provider of child.
         """
 
+        if self.provider_handler is not None:
+            self.provider.disconnect(self.provider_handler)
+            self.provider_handler = None
         self.provider = provider
+        if provider is not None:
+            self.provider_handler = provider.connect(
+                "child-props-changed", self.__handle_props_changed__
+            )
+        Registry.update(self)
+
+    def take_child(self):
+
+        """
+        Takes the child out of :obj:`self` without clearing it, so that it can be set back by
+        :meth:`set_child`.
+
+        It is same as :meth:`remove_child`, except that a deferred child is not built. It is taken
+        as a dictionary with ``child_name``, ``provider`` and ``props`` keys, where ``props`` are
+        the interface properties of child. A :obj:`child-removed` signal is emitted after removal.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`self` has no child.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with child properties.
+        """
+
+        if self.pending_props is None:
+            return self.remove_child()
+
+        self.cancel_request()
+        child_dict = {"child_name": self.child_name, "provider": self.provider}
+        child_dict["props"] = self.__remove_placeholder__()
+
+        self.child_name = None
+        self.set_provider(None)
+
+        self.emit("child-removed")
+
+        return child_dict
@@ -0,0 +1,470 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+History keeps the undo and redo stacks of the operations (see :mod:`.Operations`) made under a
+top level. Each operation is recorded along with its inverse, so undoing it moves the widgets back
+to their old places, instead of building the interface again.
+
+The widgets taken out of the interface by an operation, like a removed element or the paned of an
+undone split, are kept detached and alive while they can be brought back. So are the children
+taken out of elements, as the ``child_dict`` given by ``Element.take_child``, so that they come
+back with their state. A deferred child is kept as its properties, without building it. History
+does not change the interface when it is notified of an operation; the children are handed to it
+by the operation, as a keeper of :mod:`.Operations`.
+
+The size of history is bounded by ``max-depth``, the number of operations that can be undone, and
+``max-kept``, the number of views, elements and children kept detached. When either is crossed,
+the oldest operations are forgotten and the widgets kept only by them are destroyed, while the
+children are cleared by their providers.
+
+.. code:: python
+
+   from Aduct.History import History
+
+   history = History(top_level, max_depth=50)
+   Aduct.remove_element(element, notebook)
+   history.undo()  # The element is back in notebook.
+
+The changes made otherwise to the interface, like ``Aduct.patch_interface``, can not be undone and
+they clear the history. The position of paneds and the weights of tiles are not recorded.
+"""
+
+from collections import deque
+
+from gi.repository import GObject
+
+from . import Operations
+from .Element import _clear_child_dict
+from . import (
+    _count_children,
+    _dispose,
+    add_to_notebook,
+    add_to_paned,
+    add_to_tiles,
+    get_path,
+    remove_element,
+    replace_child,
+)
+from .Views import Tiles
+from .Walk import walk
+
+
+def _get_cost(kept):
+
+    # A child_dict is counted as one, like an element.
+    return sum(
+        1 if isinstance(item, dict) else sum(1 for child in walk(item, paths=False))
+        for item in kept
+    )
+
+
+def _insert_child(view, index, child):
+
+    type_ = view.get_type()
+    if type_ == "paned":
+        view.add_child(child, index + 1)
+    elif type_ in ("notebook", "tiles"):
+        view.add_child(child, index)
+    else:
+        view.add_child(child)
+
+
+class History(GObject.Object):
+
+    __gsignals__ = {"changed": (2, None, ())}
+
+    max_depth = GObject.Property(type=int, default=100)
+    max_kept = GObject.Property(type=int, default=1000)
+
+    def __init__(self, top_level, **kwargs):
+
+        """
+        Makes a history that records the operations made under the given top level.
+
+        Arguments
+        ---------
+        top_level : :mod:`.View`
+            A view which acts as the root widget.
+        **kwargs
+            The values to be passed to :class:`GObject.Object`. ``max_depth`` is the number of
+            operations that can be undone. Default is 100. ``max_kept`` is the number of views and
+            elements that can be kept detached. Default is 1000.
+
+        Attributes
+        ----------
+        n_kept : :class:`int`
+            The number of views and elements kept detached.
+
+        Signals
+            changed
+                Emitted when an operation is recorded, undone or redone, or the history is
+                cleared.
+        """
+
+        GObject.Object.__init__(self, **kwargs)
+        self.top_level = top_level
+        self.n_kept = 0
+
+        self.busy = False
+        self.taking = None
+        self.undo_stack = deque()
+        self.redo_stack = deque()
+        Operations.add_observer(self.__handle_operation__)
+        Operations.add_keeper(self.__keep_child__)
+
+    def __handle_operation__(self, name, target, **args):
+
+        if self.busy or name in ("set_position", "set_weights"):
+            return
+        self.taking = None
+
+        anchor = target
+        if name == "add_to_notebook" and target.get_parent() is None:
+            anchor = args["notebook"]
+        if anchor is not self.top_level and get_path(anchor, self.top_level) is None:
+            return
+
+        record = getattr(self, f"__record_{name}__", None)
+        if record is None or (name == "set_interface" and args.get("child") is None):
+            self.clear()
+            return
+
+        undo, redo, kept, cost = record(target, **args)
+        self.__release_all__(self.redo_stack)
+        self.undo_stack.append({"name": name, "undo": undo, "redo": redo})
+        if self.taking is not None:
+            self.taking["entry"] = self.undo_stack[-1]
+        self.__keep__(self.undo_stack[-1], kept, cost)
+        self.emit("changed")
+
+    def __keep_child__(self, element, child_dict):
+
+        # The child taken out by the operation just recorded, if its entry is not forgotten yet.
+        taking = self.taking
+        self.taking = None
+        if taking is None or taking["element"] is not element:
+            return False
+        entry = taking["entry"]
+        if not any(entry is other for other in self.undo_stack):
+            return False
+
+        taking["state"]["kept"].append(child_dict)
+        self.n_kept -= entry["cost"]
+        self.__keep__(entry, taking["state"]["kept"], entry["cost"] + 1)
+        return True
+
+    def __record_add_to_notebook__(self, element, notebook, position):
+
+        parent = element.get_parent()
+
+        def undo():
+            notebook.remove_child(element)
+            if parent is None:
+                return [element]
+            parent.replace_child(notebook, element)
+            return [notebook]
+
+        def redo():
+            add_to_notebook(element, notebook, position)
+            return []
+
+        return undo, redo, [], 0
+
+    def __record_add_to_paned__(self, child1, child2, paned, position):
+
+        parent = child1.get_parent()
+
+        def undo():
+            paned.remove_child(child1)
+            paned.remove_child(child2)
+            parent.replace_child(paned, child1)
+            return [paned, child2]
+
+        def redo():
+            add_to_paned(child1, child2, paned, position)
+            return []
+
+        return undo, redo, [], 0
+
+    def __record_add_to_tiles__(self, child1, child2, tiles, position):
+
+        parent = child1.get_parent()
+        if isinstance(parent, Tiles) and parent.get_orientation() == tiles.get_orientation():
+            weights = parent.get_weights()
+
+            def undo():
+                parent.remove_child(child2)
+                parent.set_weights(weights)
+                return [child2]
+
+        else:
+
+            def undo():
+                tiles.remove_child(child1)
+                tiles.remove_child(child2)
+                parent.replace_child(tiles, child1)
+                return [tiles, child2]
+
+        def redo():
+            add_to_tiles(child1, child2, tiles, position)
+            return []
+
+        return undo, redo, [], 0
+
+    def __record_change_child__(self, element, provider, child_name):
+
+        # The old child is handed over by the operation, see __keep_child__.
+        state = {"kept": []}
+        if element.get_child_name():
+            self.taking = {"element": element, "state": state}
+
+        def swap():
+            child_dict = element.take_child() if element.get_child_name() else None
+            for old_dict in state["kept"]:
+                element.set_child(old_dict)
+            state["kept"] = [] if child_dict is None else [child_dict]
+            return state["kept"]
+
+        return swap, swap, state["kept"], 0
+
+    def __record_remove_element__(self, element, view):
+
+        if view.get_type() == "bin":
+            # The child is handed over by the operation, to be set back as it is.
+            state = {"kept": []}
+            if element.get_child_name():
+                self.taking = {"element": element, "state": state}
+
+            def undo():
+                for child_dict in state["kept"]:
+                    element.set_child(child_dict)
+                state["kept"] = []
+                return []
+
+            def redo():
+                state["kept"] = [element.take_child()] if element.get_child_name() else []
+                return state["kept"]
+
+            return undo, redo, state["kept"], 0
+
+        index = view.get_child_index(element)
+        weights = view.get_weights() if view.get_type() == "tiles" else None
+        parent = view.get_parent()
+        # Same as remove_element, the view is put out when it is left with one child.
+        other_child = None
+        if _count_children(view) == 2 and hasattr(parent, "get_type"):
+            if view.get_type() == "notebook":
+                other_child = view.get_nth_child(1 - index)
+            else:
+                children = view.get_children()
+                other_child = children[0] if children[1] is element else children[1]
+            other_index = view.get_child_index(other_child)
+        kept = [element] if other_child is None else [element, view]
+        # The cost is counted before the view is emptied.
+        cost = _get_cost([element]) + len(kept) - 1
+
+        def undo():
+            if other_child is None:
+                _insert_child(view, index, element)
+            else:
+                parent.replace_child(other_child, view)
+                for child_index, child in sorted(((index, element), (other_index, other_child))):
+                    _insert_child(view, child_index, child)
+            if weights is not None:
+                view.set_weights(weights)
+            return []
+
+        def redo():
+            remove_element(element, view)
+            return kept
+
+        return undo, redo, kept, cost
+
+    def __record_replace_child__(self, child1, view, child2):
+
+        def undo():
+            view.replace_child(child2, child1)
+            return [child2]
+
+        def redo():
+            replace_child(view, child1, child2)
+            return [child1]
+
+        return undo, redo, [child1], _get_cost([child1])
+
+    def __record_set_interface__(self, top_level, child, **args):
+
+        # It is given when the operation is notified after the change.
+        old_child = args["old_child"] if "old_child" in args else top_level.get_child()
+
+        def undo():
+            if old_child is None:
+                top_level.remove_child(child)
+            else:
+                top_level.replace_child(child, old_child)
+            return [child]
+
+        def redo():
+            if old_child is None:
+                top_level.add_child(child)
+                return []
+            top_level.replace_child(old_child, child)
+            return [old_child]
+
+        if old_child is None:
+            return undo, redo, [], 0
+        return undo, redo, [old_child], _get_cost([old_child])
+
+    def __release__(self, entry):
+
+        self.n_kept -= entry["cost"]
+        for item in entry["kept"]:
+            if isinstance(item, dict):
+                # A child_dict is kept only by the entry that took it out.
+                _clear_child_dict(item)
+                continue
+            if item.get_parent() is not None:
+                continue
+            stacks = (self.undo_stack, self.redo_stack)
+            if not any(
+                any(item is other_item for other_item in other["kept"])
+                for stack in stacks
+                for other in stack
+            ):
+                _dispose(item)
+
+    def __release_all__(self, stack):
+
+        while stack:
+            self.__release__(stack.pop())
+
+    def __step__(self, from_stack, to_stack, action, name):
+
+        if not from_stack:
+            return False
+
+        entry = from_stack.pop()
+        self.n_kept -= entry["cost"]
+        self.busy = True
+        try:
+            kept = entry[action]()
+            entry["cost"] = 0
+            to_stack.append(entry)
+            self.__keep__(entry, kept, _get_cost(kept))
+            Operations.notify(name, self.top_level)
+        finally:
+            self.busy = False
+        self.emit("changed")
+        return True
+
+    def __keep__(self, entry, kept, cost):
+
+        entry["kept"] = kept
+        entry["cost"] = cost
+        self.n_kept += cost
+
+        max_depth = self.get_property("max-depth")
+        max_kept = self.get_property("max-kept")
+        while self.undo_stack and len(self.undo_stack) > max_depth:
+            self.__release__(self.undo_stack.popleft())
+        for stack in (self.undo_stack, self.redo_stack):
+            while stack and self.n_kept > max_kept:
+                self.__release__(stack.popleft())
+
+    def can_redo(self):
+
+        """
+        Checks whether there is an operation to redo.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if :meth:`redo` can be done, else :obj:`False`.
+        """
+
+        return bool(self.redo_stack)
+
+    def can_undo(self):
+
+        """
+        Checks whether there is an operation to undo.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if :meth:`undo` can be done, else :obj:`False`.
+        """
+
+        return bool(self.undo_stack)
+
+    def clear(self):
+
+        """
+        Forgets all the recorded operations. The widgets kept detached are destroyed and the
+        children kept are cleared by their providers.
+        """
+
+        kept = {}
+        for entry in (*self.undo_stack, *self.redo_stack):
+            kept.update((id(item), item) for item in entry["kept"])
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.n_kept = 0
+        for item in kept.values():
+            if isinstance(item, dict):
+                _clear_child_dict(item)
+            elif item.get_parent() is None:
+                _dispose(item)
+        self.emit("changed")
+
+    def redo(self):
+
+        """
+        Makes the last undone operation again. ``Operations.notify`` is called with ``redo``
+        after it.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if an operation was redone, :obj:`False` if there was none.
+        """
+
+        return self.__step__(self.redo_stack, self.undo_stack, "redo", "redo")
+
+    def stop(self):
+
+        """
+        Stops recording the operations and clears the history.
+        """
+
+        Operations.remove_observer(self.__handle_operation__)
+        Operations.remove_keeper(self.__keep_child__)
+        self.clear()
+
+    def undo(self):
+
+        """
+        Reverts the last operation. ``Operations.notify`` is called with ``undo`` after it.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if an operation was undone, :obj:`False` if there was none.
+        """
+
+        return self.__step__(self.undo_stack, self.redo_stack, "undo", "undo")
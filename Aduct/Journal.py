@@ -0,0 +1,421 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Journal records the changes made to an interface as a log of operations, instead of saving the
+whole interface after every change. The journal file has one JSON record per line. The first
+record is a snapshot of the interface, given by ``Aduct.get_interface``, and the rest are the
+operations (see :mod:`.Operations`) made under the top level since then, with their targets given
+by paths (see ``Aduct.get_path``).
+
+.. code:: python
+
+   {"op": "snapshot", "interface": {...}}
+   {"op": "add_to_paned", "path": [0], "child": {...}, "paned": {...}, "position": 1}
+   {"op": "set_position", "path": [0], "position": 240}
+   {"op": "set_weights", "path": [0], "weights": [1.0, 2.0]}
+
+Recording an operation costs the same however large the interface is. The records are appended
+when the main loop is idle, merging the consecutive positions of a paned, or weights of a tiles,
+into one. The positions moved by allocation, like when the window is resized, are not recorded.
+Once ``max-ops`` operations are recorded, the journal is compacted, that is, the file is replaced
+by a fresh snapshot, which is written in a thread. It is also compacted after an operation it can
+not record, like ``Aduct.set_interface``. The state of children kept by providers is saved by
+snapshots, and by ``change_child`` records as it is when they are appended.
+
+.. code:: python
+
+   from Aduct.Journal import Journal
+
+   root = Journal.restore("aduct.journal", top_level, creator_maps, init_maps)
+   journal = Journal(root, "aduct.journal")
+
+The top level of a journal should not be replaced itself, like a :mod:`.Bin` that is the root of
+interface. The journal is stopped when its top level is destroyed.
+"""
+
+import json
+from threading import Thread, current_thread
+
+from gi.repository import GLib, GObject
+
+from . import Operations, Walk
+from . import (
+    _write_interface,
+    add_to_notebook,
+    add_to_paned,
+    add_to_tiles,
+    change_child_at_element,
+    get_interface,
+    get_path,
+    get_widget_at_path,
+    remove_element,
+    replace_child,
+    resolve_interface,
+    set_interface,
+)
+
+
+RECORDED = (
+    "add_to_notebook",
+    "add_to_paned",
+    "add_to_tiles",
+    "change_child",
+    "remove_element",
+    "replace_child",
+)
+MERGED = {"set_position": "position", "set_weights": "weights"}
+
+
+def _build(props, creator_maps, init_maps):
+
+    props = resolve_interface(Walk.copy_props(props), creator_maps, init_maps)
+    widget = props["type"]
+    widget.set_from_props(props)
+    widget.show_all()
+    return widget
+
+
+def _replay(record, root, creator_maps, init_maps):
+
+    op = record["op"]
+    target = get_widget_at_path(root, record["path"])
+    if target is None:
+        raise ValueError(f"No widget at path {record['path']} for {op} in Aduct.Journal")
+
+    if op == "add_to_notebook":
+        notebook = _build(record["notebook"], creator_maps, init_maps)
+        add_to_notebook(target, notebook, record["position"])
+    elif op == "add_to_paned":
+        child = _build(record["child"], creator_maps, init_maps)
+        paned = _build(record["paned"], creator_maps, init_maps)
+        add_to_paned(target, child, paned, record["position"])
+    elif op == "add_to_tiles":
+        child = _build(record["child"], creator_maps, init_maps)
+        tiles = _build(record["tiles"], creator_maps, init_maps)
+        if add_to_tiles(target, child, tiles, record["position"]) is not tiles:
+            tiles.destroy()
+    elif op == "change_child":
+        provider = init_maps["provider"][record["provider"]]
+        if "child" in record:
+            # The child is built with the state it had when recorded, not as a new one.
+            target.set_from_props({"provider": provider, "child": record["child"]})
+        else:
+            change_child_at_element(target, provider, record["child_name"])
+    elif op == "remove_element":
+        remove_element(target, target.get_parent())
+    elif op == "replace_child":
+        child = _build(record["child"], creator_maps, init_maps)
+        replace_child(target.get_parent(), target, child)
+    elif op == "set_position":
+        target.set_position(record["position"])
+    elif op == "set_weights":
+        target.set_weights(record["weights"])
+    else:
+        raise ValueError(f"Unknown operation {op} in Aduct.Journal")
+
+
+def _encode(record):
+
+    if record["op"] == "change_child":
+        record = {**record}
+        element = record.pop("element")
+        # The state of child is taken now, so that the edits made since it was added are kept.
+        if element.child_name and element.provider:
+            record["provider"] = element.provider.get_name()
+            record["child_name"] = element.child_name
+            record["child"] = element.get_own_props()["child"]
+    return json.dumps(record) + "\n"
+
+
+class Journal(GObject.Object):
+
+    __gsignals__ = {"compacted": (2, None, (object,))}
+
+    max_ops = GObject.Property(type=int, default=1000)
+
+    def __init__(self, top_level, path, **kwargs):
+
+        """
+        Makes a journal that records the operations made under the given top level to given file.
+        The file is started with a snapshot of the interface.
+
+        Arguments
+        ---------
+        top_level : :mod:`.View`
+            A view which acts as the root widget.
+        path : :class:`str`
+            The path of journal file.
+        **kwargs
+            The values to be passed to :class:`GObject.Object`. ``max_ops`` is the number of
+            operations recorded before the journal is compacted. Default is 1000.
+
+        Attributes
+        ----------
+        n_ops : :class:`int`
+            The number of operations recorded since the last snapshot.
+
+        Signals
+            compacted
+                Emitted after a snapshot is written, with the raised exception or :obj:`None` on
+                success. When it fails, the operations are appended to the old journal.
+        """
+
+        GObject.Object.__init__(self, **kwargs)
+        self.top_level = top_level
+        self.path = path
+        self.n_ops = 0
+
+        self.records = []
+        self.fp = None
+        self.compact_source = None
+        self.flush_source = None
+        self.thread = None
+        self.error = None
+        self.pending = False
+        self.compact()
+        Operations.add_observer(self.__handle_operation__)
+        self.destroy_handler = top_level.connect("destroy", self.__handle_destroy__)
+
+    def __finish_compact__(self):
+
+        error = self.error
+        self.thread = None
+        self.error = None
+        self.fp = open(self.path, "a")
+        self.emit("compacted", error)
+        if self.pending:
+            self.pending = False
+            self.compact()
+
+    def __handle_compact__(self):
+
+        self.compact_source = None
+        self.compact()
+        return False
+
+    def __handle_compacted__(self, thread):
+
+        # The compaction may already be finished by flush.
+        if thread is self.thread:
+            self.__finish_compact__()
+            if self.thread is None:
+                self.flush()
+        return False
+
+    def __handle_destroy__(self, top_level):
+
+        self.stop()
+
+    def __handle_flush__(self):
+
+        self.flush_source = None
+        # The operations recorded while a snapshot is written are appended after it.
+        if self.thread is None:
+            self.flush()
+        return False
+
+    def __handle_operation__(self, name, target, **args):
+
+        if name in MERGED:
+            path = get_path(target, self.top_level)
+            if path is None:
+                return
+            key = MERGED[name]
+            record = {"op": name, "path": path, key: args[key]}
+            last = self.records[-1] if self.records else None
+            if last and last["op"] == name and last["path"] == path:
+                self.records[-1] = record
+                return
+        elif name in RECORDED:
+            path = get_path(target, self.top_level)
+            if path is None:
+                return
+            record = {"op": name, "path": path}
+            if name == "add_to_notebook":
+                record["notebook"] = args["notebook"].get_props()
+                record["position"] = args["position"]
+            elif name == "add_to_paned":
+                record["child"] = args["child2"].get_props()
+                record["paned"] = args["paned"].get_props()
+                record["position"] = args["position"]
+            elif name == "add_to_tiles":
+                record["child"] = args["child2"].get_props()
+                record["tiles"] = args["tiles"].get_props()
+                record["position"] = args["position"]
+            elif name == "change_child":
+                record["provider"] = args["provider"].get_name()
+                record["child_name"] = args["child_name"]
+                record["element"] = target
+            elif name == "replace_child":
+                record["child"] = args["child2"].get_props()
+        else:
+            # A change it can not follow is snapshotted only when it is made at or around the tree
+            # journaled, not under another top level.
+            if (get_path(target, self.top_level) is None
+                    and get_path(self.top_level, target) is None):
+                return
+            self.queue_compact()
+            return
+
+        self.records.append(record)
+        self.n_ops += 1
+        if self.n_ops >= self.get_property("max-ops"):
+            self.queue_compact()
+        elif self.flush_source is None:
+            self.flush_source = GLib.idle_add(self.__handle_flush__)
+
+    def compact(self):
+
+        """
+        Replaces the journal file with a snapshot of the interface.
+
+        The interface is taken at once by ``Aduct.get_interface``, while it is encoded and written
+        in a thread. The operations recorded meanwhile are appended once it is written. When a
+        snapshot is already being written, another one is made after it.
+        """
+
+        if self.compact_source is not None:
+            GLib.source_remove(self.compact_source)
+            self.compact_source = None
+        if self.thread is not None:
+            self.pending = True
+            return
+        if self.fp is not None:
+            # The old journal is kept complete, in case the snapshot can not be written.
+            self.flush()
+            self.fp.close()
+            self.fp = None
+
+        snapshot = {"op": "snapshot", "interface": get_interface(self.top_level)}
+        self.records = []
+        self.n_ops = 0
+
+        def write():
+            try:
+                _write_interface(self.path, (json.dumps(snapshot) + "\n").encode())
+            except Exception as error:
+                self.error = error
+            GLib.idle_add(self.__handle_compacted__, current_thread())
+
+        self.thread = Thread(target=write)
+        self.thread.start()
+
+    def flush(self):
+
+        """
+        Appends the recorded operations to the journal file. When a snapshot is being written, it
+        waits till the snapshot is written.
+        """
+
+        while self.thread is not None:
+            self.thread.join()
+            self.__finish_compact__()
+        if not self.records:
+            return
+        self.fp.write("".join(_encode(record) for record in self.records))
+        self.fp.flush()
+        self.records = []
+
+    def queue_compact(self):
+
+        """
+        Schedules :meth:`compact` to be run when the main loop is idle. Requests made before it is
+        run are merged.
+        """
+
+        if self.compact_source is None:
+            self.compact_source = GLib.idle_add(self.__handle_compact__)
+
+    @staticmethod
+    def restore(path, top_level, creator_maps, init_maps):
+
+        """
+        Sets the interface recorded in given journal file, starting from the given top level.
+
+        The snapshot is set by ``Aduct.set_interface`` and then the operations are made again on
+        its root. An incomplete last record, left by a crash while writing, is ignored.
+
+        Arguments
+        ---------
+        path : :class:`str`
+            The path of journal file.
+        top_level : :mod:`.View`
+            The widget to which the root of interface has to be added.
+        creator_maps : :class:`dict`
+            A dictionary of format ``{key: (func, args, kwargs)}``. See ``Aduct.set_interface``.
+        init_maps : :class:`dict`
+            A dictionary of format ``{key: object}``. See ``Aduct.set_interface``. The providers
+            of ``change_child`` operations are taken from its ``provider`` key.
+
+        Returns
+        -------
+        :mod:`.View`
+            The root of interface, which is the child of :obj:`top_level`.
+
+        Raises
+        ------
+        ValueError
+            Raised when the journal does not start with a snapshot or an operation can not be
+            made.
+        """
+
+        with open(path) as fp:
+            lines = fp.read().split("\n")
+
+        records = []
+        for idx, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                if idx < len(lines) - 1 and any(lines[idx + 1:]):
+                    raise
+                break
+
+        if not records or records[0]["op"] != "snapshot":
+            raise ValueError("Aduct.Journal has to start with a snapshot")
+
+        set_interface(records[0]["interface"], top_level, creator_maps, init_maps)
+        root = top_level.get_child()
+        for record in records[1:]:
+            _replay(record, root, creator_maps, init_maps)
+        return root
+
+    def stop(self):
+
+        """
+        Stops recording the operations, after appending the ones already recorded. Nothing is done
+        if :obj:`self` is already stopped.
+        """
+
+        if self.destroy_handler is None:
+            return
+        Operations.remove_observer(self.__handle_operation__)
+        self.top_level.disconnect(self.destroy_handler)
+        self.destroy_handler = None
+
+        self.pending = False
+        self.flush()
+        for source in (self.compact_source, self.flush_source):
+            if source is not None:
+                GLib.source_remove(source)
+        self.compact_source = None
+        self.flush_source = None
+        self.fp.close()
+        self.fp = None
@@ -0,0 +1,302 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Normalize removes the views that do not change how an interface looks, so that the interface
+stays shallow after many splits, removals and wraps. The views removed are,
+
+* A bin held by a bin, which is replaced by its child.
+* A paned or tiles with one child, which is replaced by its child, or with no child, which is
+  taken out.
+* A notebook with one page and no action buttons, which is replaced by its element. Its tab is
+  gone, so the element gets the space of tab too.
+* A tiles held by a tiles of the same orientation, whose children are moved to the outer tiles
+  with their weights scaled, so that they keep their space.
+
+Paneds of the same orientation nested directly, like those made by splitting a panel again and
+again, can be merged into a :mod:`.Tiles` too. As a tiles has no handles to drag, this is only done
+when asked. The children keep the space they are allocated, so the paneds have to be shown.
+
+The elements are moved to their new places as they are, their children are not built again.
+
+.. code:: python
+
+   stats = Aduct.normalize(top_level)
+   print(stats["removed"], "views removed")
+
+   from Aduct.Normalize import Normalizer
+
+   normalizer = Normalizer(top_level)  # Normalizes whenever the interface changes.
+"""
+
+from gi.repository import GLib, GObject, Gtk
+
+from . import Batch, Operations
+from .Element import Element
+from .Views import Bin, Notebook, Paned, Tiles, View
+from .Walk import walk
+
+
+def _get_children(widget, parent):
+
+    # Gets the children that replace the given view in parent, None if the view has to stay.
+    if isinstance(widget, Bin):
+        if isinstance(parent, Bin):
+            child = widget.get_child()
+            return [child] if child else []
+    elif isinstance(widget, (Paned, Tiles)):
+        children = widget.get_children()
+        if len(children) < 2:
+            return children
+    elif isinstance(widget, Notebook):
+        if widget.get_n_pages() == 1 and not widget.get_number_of_action_buttons():
+            return widget.get_children()
+    return None
+
+
+def _get_length(widget, orientation):
+
+    if orientation == Gtk.Orientation.HORIZONTAL:
+        return widget.get_allocated_width()
+    return widget.get_allocated_height()
+
+
+def _get_panes(paned, keep):
+
+    # Gets the paneds of the same orientation nested in the given paned and the children they hold,
+    # None if they can not be merged.
+    orientation = paned.get_orientation()
+    paneds = []
+    children = []
+    stack = [paned]
+    while stack:
+        widget = stack.pop()
+        if not isinstance(widget, Paned) or widget.get_orientation() != orientation:
+            children.append(widget)
+            continue
+        if widget in keep or not widget.get_mapped():
+            return None
+        paneds.append(widget)
+        stack.extend(reversed(widget.get_children()))
+    return paneds, children
+
+
+def _is_same_tiles(widget, orientation):
+
+    return isinstance(widget, Tiles) and widget.get_orientation() == orientation
+
+
+def normalize(top_level, keep=(), merge_paneds=False):
+
+    """
+    Removes the redundant views under the given top level, see :mod:`.Normalize`.
+
+    ``Operations.notify`` is called with ``normalize`` and each view before it is removed, or before
+    the paneds under it are merged. Nothing is notified when there is no view to remove.
+
+    Arguments
+    ---------
+    top_level : :mod:`.View`
+        A view which acts as the root widget. It is never removed.
+    keep : :class:`list`
+        The views that must not be removed, like the top levels of :mod:`.History` or
+        :mod:`.Journal` below :obj:`top_level`.
+    merge_paneds : :class:`bool`
+        States whether to merge the paneds of same orientation nested directly into a
+        :mod:`.Tiles`. Default is :obj:`False`.
+
+    Returns
+    -------
+    :class:`dict`
+        A dictionary with keys ``removed``, the number of views removed, and ``added``, the
+        number of tiles added in place of paneds.
+    """
+
+    stats = {"removed": 0, "added": 0}
+    keep = set(keep)
+    # The children are normalized before their parent, which can then become redundant.
+    widgets = [widget for widget, depth, path in walk(top_level, "post", paths=False)]
+
+    def remove(views):
+        for view in views:
+            view.destroy()
+        stats["removed"] += len(views)
+
+    Batch.begin(top_level)
+    try:
+        for widget in widgets:
+            parent = widget.get_parent()
+            if widget is top_level or widget in keep or isinstance(widget, Element):
+                continue
+            # A view removed before has no parent.
+            if not isinstance(parent, View):
+                continue
+
+            children = _get_children(widget, parent)
+            if children is not None:
+                Operations.notify("normalize", widget)
+                for child in children:
+                    widget.remove_child(child)
+                if children:
+                    parent.replace_child(widget, children[0])
+                else:
+                    parent.remove_child(widget)
+                remove([widget])
+                continue
+
+            orientation = widget.get_orientation() if isinstance(widget, Tiles) else None
+            if orientation is not None and _is_same_tiles(parent, orientation):
+                Operations.notify("normalize", widget)
+                index = parent.get_child_index(widget)
+                weight = parent.get_weights()[index]
+                children = widget.get_children()
+                weights = widget.get_weights()
+                for child in children:
+                    widget.remove_child(child)
+                parent.remove_child(widget)
+                for offset, child in enumerate(children):
+                    share = weight * weights[offset] / sum(weights)
+                    parent.add_child(child, index + offset, share)
+                remove([widget])
+                continue
+
+            if not merge_paneds or not isinstance(widget, Paned):
+                continue
+            orientation = widget.get_orientation()
+            if isinstance(parent, Paned) and parent.get_orientation() == orientation:
+                continue
+            panes = _get_panes(widget, keep)
+            if panes is None:
+                continue
+            paneds, children = panes
+            into_parent = _is_same_tiles(parent, orientation)
+            if len(paneds) < 2 and not into_parent:
+                continue
+
+            Operations.notify("normalize", widget)
+            lengths = [max(1, _get_length(child, orientation)) for child in children]
+            for child in children:
+                child.get_parent().remove_child(child)
+            if into_parent:
+                tiles = parent
+                index = parent.get_child_index(widget)
+                weight = parent.get_weights()[index]
+                parent.remove_child(widget)
+                weights = [weight * length / sum(lengths) for length in lengths]
+            else:
+                tiles = Tiles(orientation=orientation)
+                index = 0
+                parent.replace_child(widget, tiles)
+                weights = lengths
+                stats["added"] += 1
+            for offset, child in enumerate(children):
+                tiles.add_child(child, index + offset, weights[offset])
+            Batch.show_all(tiles)
+            remove(paneds)
+    finally:
+        Batch.end()
+
+    return stats
+
+
+class Normalizer(GObject.Object):
+
+    __gsignals__ = {"normalized": (2, None, (object,))}
+
+    merge_paneds = GObject.Property(type=bool, default=False)
+
+    def __init__(self, top_level, keep=(), **kwargs):
+
+        """
+        Makes a normalizer that normalizes the interface of given top level whenever it changes.
+        The interface is normalized when the main loop is idle, so a burst of changes is followed
+        by a single normalization.
+
+        Arguments
+        ---------
+        top_level : :mod:`.View`
+            A view which acts as the root widget.
+        keep : :class:`list`
+            The views that must not be removed, see :func:`normalize`.
+        **kwargs
+            The values to be passed to :class:`GObject.Object`. ``merge_paneds`` is passed to
+            :func:`normalize`. Default is :obj:`False`.
+
+        Attributes
+        ----------
+        removed : :class:`int`
+            The number of views removed so far.
+
+        Signals
+            normalized
+                Emitted after a normalization that removed some views, with the dictionary given
+                by :func:`normalize`.
+        """
+
+        GObject.Object.__init__(self, **kwargs)
+        self.top_level = top_level
+        self.keep = keep
+        self.removed = 0
+
+        self.busy = False
+        self.source = None
+        self.handler = top_level.connect("interface-changed", self.__handle_changed__)
+
+    def __handle_changed__(self, top_level):
+
+        if not self.busy and self.source is None:
+            self.source = GLib.idle_add(self.__handle_idle__)
+
+    def __handle_idle__(self):
+
+        self.source = None
+        self.normalize()
+        return False
+
+    def normalize(self):
+
+        """
+        Normalizes the interface now.
+
+        Returns
+        -------
+        :class:`dict`
+            The dictionary given by :func:`normalize`.
+        """
+
+        self.busy = True
+        try:
+            stats = normalize(self.top_level, self.keep, self.get_property("merge-paneds"))
+        finally:
+            self.busy = False
+        self.removed += stats["removed"]
+        if stats["removed"]:
+            self.emit("normalized", stats)
+        return stats
+
+    def stop(self):
+
+        """
+        Stops normalizing the interface.
+        """
+
+        if self.source is not None:
+            GLib.source_remove(self.source)
+            self.source = None
+        if self.handler is not None:
+            self.top_level.disconnect(self.handler)
+            self.handler = None
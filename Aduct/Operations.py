@@ -0,0 +1,165 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Operations lets observers learn of the changes made to interfaces through the functions of Aduct.
+An observer is called as ``observer(name, target, **args)`` just before the change is made, so
+that the target is still at its old place. The operations are as follows.
+
+.. code:: python
+
+   ("add_to_notebook", element, notebook=Aduct.Notebook, position=int)
+   ("add_to_paned", child1, child2=Gtk.Widget, paned=Aduct.Paned, position=int)
+   ("add_to_tiles", child1, child2=Gtk.Widget, tiles=Aduct.Tiles, position=int)
+   ("change_child", element, provider=Aduct.Provider, child_name=str)
+   ("normalize", view)
+   ("remove_element", element, view=Aduct.View)
+   ("replace_child", child1, view=Aduct.View, child2=Gtk.Widget)
+   ("set_interface", top_level, child=Gtk.Widget)
+   ("set_position", paned, position=int)
+   ("set_weights", tiles, weights=list)
+   ("undo", top_level)
+   ("redo", top_level)
+
+``set_interface`` is notified without ``child`` by ``Aduct.patch_interface``, which changes the
+interface in place. ``set_position`` is notified when the position of an ``Aduct.Paned`` is
+changed, ``set_weights`` when the weights of an ``Aduct.Tiles`` are set, and ``undo`` and ``redo``
+when an operation is undone or redone by :mod:`.History`, all of which happen after the change.
+``Aduct.set_interface_incremental`` notifies ``set_interface`` after the interface is built too,
+with ``old_child=Gtk.Widget``, the child it replaced or :obj:`None`. Observers should treat an
+operation of unknown name as a change they can not follow.
+
+Observers are called in the order they were added and must not change the interface, as the
+observers after them still have to see it as it was. An observer that has to keep the child
+cleared by ``change_child``, or by ``remove_element`` from an ``Aduct.Bin``, is added as a keeper
+too (see :func:`add_keeper`). The operation takes the child out by ``Element.take_child`` after
+notifying, and offers it to the keepers through :func:`keep_child` before clearing it.
+"""
+
+keepers = []
+observers = []
+
+
+def add_keeper(keeper):
+
+    """
+    Adds the given keeper, which is offered the children taken out by operations.
+
+    Arguments
+    ---------
+    keeper : :class:`callable`
+        The function called as ``keeper(element, child_dict)``, which returns :obj:`True` when it
+        keeps ``child_dict``, the child taken out of ``element``.
+    """
+
+    if keeper not in keepers:
+        keepers.append(keeper)
+
+
+def add_observer(observer):
+
+    """
+    Adds the given observer, which is called for every operation.
+
+    Arguments
+    ---------
+    observer : :class:`callable`
+        The function called as ``observer(name, target, **args)``.
+    """
+
+    if observer not in observers:
+        observers.append(observer)
+
+
+def keep_child(element, child_dict):
+
+    """
+    Offers the child taken out of an element by an operation to the keepers, in the order they
+    were added, till one keeps it.
+
+    Arguments
+    ---------
+    element : :mod:`.Element`
+        The element from which the child was taken.
+    child_dict : :class:`dict`
+        The child given by ``Element.take_child``.
+
+    Returns
+    -------
+    :class:`bool`
+        :obj:`True` if a keeper kept the child, else :obj:`False`, in which case it has to be
+        cleared.
+    """
+
+    return any(keeper(element, child_dict) for keeper in tuple(keepers))
+
+
+def notify(name, target, **args):
+
+    """
+    Calls the observers with the given operation.
+
+    Arguments
+    ---------
+    name : :class:`str`
+        The name of operation.
+    target : :class:`Gtk.Widget`
+        The widget on which the operation is made.
+    **args
+        The arguments of operation.
+    """
+
+    for observer in tuple(observers):
+        observer(name, target, **args)
+
+
+def remove_observer(observer):
+
+    """
+    Removes the given observer.
+
+    Arguments
+    ---------
+    observer : :class:`callable`
+        The observer added by :func:`add_observer`.
+
+    Raises
+    ------
+    ValueError
+        Raised when :obj:`observer` was not added.
+    """
+
+    observers.remove(observer)
+
+
+def remove_keeper(keeper):
+
+    """
+    Removes the given keeper.
+
+    Arguments
+    ---------
+    keeper : :class:`callable`
+        The keeper added by :func:`add_keeper`.
+
+    Raises
+    ------
+    ValueError
+        Raised when :obj:`keeper` was not added.
+    """
+
+    keepers.remove(keeper)
@@ -0,0 +1,368 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Plan is an interface dictionary compiled into a flat list of operations, that makes the same
+dictionary as ``Aduct.resolve_interface`` without walking it. A plan is compiled once with
+:meth:`Plan.compile`, linked to the factories and objects of the maps with :meth:`Plan.link` and
+then instantiated any number of times with :meth:`Plan.instantiate`.
+
+The operations are tuples of the following kinds, where ``slot`` is the index of the dictionary
+being made.
+
+.. code:: python
+
+   ("dict", slot, parent_slot, key, scalars, others)  # A dictionary with the given items.
+   ("list", slot, parent_slot, key, items)            # A list of given items.
+   ("create", slot, key, name)                         # A value made by creator_maps[key][name].
+   ("init", slot, key, name)                           # A value taken from init_maps[key][name].
+
+A dictionary or list is added to its parent at ``key`` (an index, when the parent is a list),
+except the root which has ``parent_slot`` -1. ``scalars`` are the items that can be shared while
+``others`` are copied on each instantiation. In ``items``, the dictionaries and lists are
+:obj:`None`, which are then filled by their own operations.
+An unlinked plan can be saved to a file and loaded back, and :func:`get_key` gives the key by
+which plans are cached. The plans cached in memory by ``Aduct.compile_interface`` are kept in
+:obj:`cache`, which holds at most :obj:`CACHE_SIZE` plans, dropping the least recently used one
+first.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from copy import deepcopy
+
+PLAN_VERSION = 2
+SCALARS = (str, int, float, bool, type(None))
+CACHE_SIZE = 32
+
+cache = OrderedDict()
+
+
+def _has_containers(value):
+
+    if not isinstance(value, (list,)):
+        return False
+    return any(isinstance(item, (dict, list)) for item in value)
+
+
+def add_to_cache(key, plan):
+
+    """
+    Adds the given plan to :obj:`cache`. When it holds more than :obj:`CACHE_SIZE` plans, the least
+    recently used ones are dropped.
+
+    Arguments
+    ---------
+    key : :class:`str`
+        The key of plan, given by :func:`get_key`.
+    plan : :mod:`.Plan`
+        The unlinked plan.
+    """
+
+    cache[key] = plan
+    cache.move_to_end(key)
+    while len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def get_cached(key):
+
+    """
+    Gets the plan of given key from :obj:`cache`, marking it as the most recently used.
+
+    Arguments
+    ---------
+    key : :class:`str`
+        The key of plan, given by :func:`get_key`.
+
+    Returns
+    -------
+    :mod:`.Plan`
+        The unlinked plan, :obj:`None` if it is not cached.
+    """
+
+    plan = cache.get(key)
+    if plan is not None:
+        cache.move_to_end(key)
+    return plan
+
+
+def get_key(interface_dict, creator_maps, init_maps, name=None):
+
+    """
+    Gets the key of the plan of given interface dictionary.
+
+    Hashing :obj:`interface_dict` serialises it as a whole, which costs about as much as walking
+    it. When :obj:`name` is given, it is hashed in its place.
+
+    Arguments
+    ---------
+    interface_dict: :class:`dict`
+        A dictionary that can be used to set interface.
+    creator_maps : :class:`dict`
+        A dictionary of format ``{key: (func, args, kwargs)}``.
+    init_maps : :class:`dict`
+        A dictionary of format ``{key: object}``.
+    name : :class:`str`
+        A name that stands for :obj:`interface_dict`, like the name of a saved layout. It has to
+        change whenever :obj:`interface_dict` changes. It is :obj:`None`, when not given.
+
+    Returns
+    -------
+    :class:`str`
+        A hexadecimal hash of :obj:`interface_dict` (or :obj:`name`) and the keys of maps.
+    """
+
+    content = {
+        "interface": interface_dict if name is None else None,
+        "name": name,
+        "creator_keys": sorted(creator_maps),
+        "init_keys": sorted(init_maps),
+    }
+    data = json.dumps(content, sort_keys=True, default=repr).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class Plan:
+    def __init__(self, ops, n_slots, linked=False):
+
+        """
+        Makes a plan from given operations. Plans are usually made by :meth:`compile`,
+        :meth:`link` or :meth:`load`.
+
+        Arguments
+        ---------
+        ops : :class:`list`
+            The operations of plan.
+        n_slots : :class:`int`
+            The number of dictionaries made by the plan.
+        linked : :class:`bool`
+            States whether the names in :obj:`ops` are already substituted with factories and
+            objects. Default is :obj:`False`.
+        """
+
+        self.ops = ops
+        self.n_slots = n_slots
+        self.linked = linked
+
+    @staticmethod
+    def compile(interface_dict, creator_maps, init_maps):
+
+        """
+        Compiles the given interface dictionary into a plan.
+
+        Only the keys of maps are used, so the plan can be linked to any maps having the same
+        keys. :obj:`interface_dict` is not modified.
+
+        Arguments
+        ---------
+        interface_dict: :class:`dict`
+            A dictionary that can be used to set interface.
+        creator_maps : :class:`dict`
+            A dictionary of format ``{key: (func, args, kwargs)}``.
+        init_maps : :class:`dict`
+            A dictionary of format ``{key: object}``.
+
+        Returns
+        -------
+        :mod:`.Plan`
+            The unlinked plan.
+        """
+
+        ops = []
+        n_slots = 0
+        stack = [(interface_dict, -1, None)]
+        while stack:
+            dic, parent_slot, parent_key = stack.pop()
+            slot = n_slots
+            n_slots += 1
+
+            if isinstance(dic, (list,)):
+                items = []
+                for idx, value in enumerate(dic):
+                    if isinstance(value, (dict, list)):
+                        stack.append((value, slot, idx))
+                        items.append(None)
+                    else:
+                        items.append(value)
+                ops.append(("list", slot, parent_slot, parent_key, items))
+                continue
+
+            scalars = {}
+            others = {}
+            resolves = []
+            for key, value in dic.items():
+                if key in creator_maps:
+                    resolves.append(("create", slot, key, value))
+                elif key in init_maps:
+                    resolves.append(("init", slot, key, value))
+                elif isinstance(value, (dict,)) or _has_containers(value):
+                    stack.append((value, slot, key))
+                elif isinstance(value, SCALARS):
+                    scalars[key] = value
+                else:
+                    others[key] = value
+
+            ops.append(("dict", slot, parent_slot, parent_key, scalars, others))
+            ops.extend(resolves)
+
+        return Plan(ops, n_slots)
+
+    def instantiate(self):
+
+        """
+        Makes the interface properties from :obj:`self`, like ``Aduct.resolve_interface``.
+
+        When a factory raises, the objects made so far that have a ``destroy`` method, like
+        widgets, are destroyed before the exception is passed on.
+
+        Returns
+        -------
+        :class:`dict`
+            The interface properties, with values substituted with objects.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`self` is not linked.
+        """
+
+        if not self.linked:
+            raise ValueError("Aduct.Plan has to be linked before it is instantiated")
+
+        slots = [None] * self.n_slots
+        made = []
+        try:
+            for op in self.ops:
+                kind = op[0]
+                if kind == "dict":
+                    _, slot, parent_slot, parent_key, scalars, others = op
+                    dic = {**scalars}
+                    if others:
+                        dic.update(deepcopy(others))
+                    slots[slot] = dic
+                    if parent_slot >= 0:
+                        slots[parent_slot][parent_key] = dic
+                elif kind == "list":
+                    _, slot, parent_slot, parent_key, items = op
+                    slots[slot] = deepcopy(items)
+                    if parent_slot >= 0:
+                        slots[parent_slot][parent_key] = slots[slot]
+                elif kind == "create":
+                    _, slot, key, func, args, kwargs = op
+                    slots[slot][key] = func(*args, **kwargs)
+                    made.append(slots[slot][key])
+                else:
+                    _, slot, key, obj = op
+                    slots[slot][key] = obj
+        except Exception:
+            # The caller gets no properties, so it can not dispose them.
+            for obj in made:
+                destroy = getattr(obj, "destroy", None)
+                if destroy is not None:
+                    destroy()
+            raise
+
+        return slots[0]
+
+    def link(self, creator_maps, init_maps):
+
+        """
+        Links :obj:`self` to the factories and objects of given maps.
+
+        Arguments
+        ---------
+        creator_maps : :class:`dict`
+            A dictionary of format ``{key: (func, args, kwargs)}``.
+        init_maps : :class:`dict`
+            A dictionary of format ``{key: object}``.
+
+        Returns
+        -------
+        :mod:`.Plan`
+            A new linked plan.
+        """
+
+        ops = []
+        for op in self.ops:
+            kind = op[0]
+            if kind == "create":
+                _, slot, key, name = op
+                func, args, kwargs = creator_maps[key][name]
+                ops.append((kind, slot, key, func, args, kwargs))
+            elif kind == "init":
+                _, slot, key, name = op
+                ops.append((kind, slot, key, init_maps[key][name]))
+            else:
+                ops.append(op)
+
+        return Plan(ops, self.n_slots, linked=True)
+
+    @staticmethod
+    def load(path):
+
+        """
+        Loads an unlinked plan from given file.
+
+        Arguments
+        ---------
+        path : :class:`str`
+            The path of file saved by :meth:`save`.
+
+        Returns
+        -------
+        :mod:`.Plan`
+            The unlinked plan.
+
+        Raises
+        ------
+        ValueError
+            Raised when the file is of a different version.
+        """
+
+        with open(path) as fp:
+            content = json.load(fp)
+
+        version = content["version"]
+        if version != PLAN_VERSION:
+            raise ValueError(f"Expected Aduct.Plan version {PLAN_VERSION}, but got {version}")
+        ops = [tuple(op) for op in content["ops"]]
+        return Plan(ops, content["n_slots"])
+
+    def save(self, path):
+
+        """
+        Saves :obj:`self` to given file.
+
+        Arguments
+        ---------
+        path : :class:`str`
+            The path of file.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`self` is linked.
+        """
+
+        if self.linked:
+            raise ValueError("Aduct.Plan can only be saved before it is linked")
+
+        content = {"version": PLAN_VERSION, "n_slots": self.n_slots, "ops": self.ops}
+        with open(path, "w") as fp:
+            json.dump(content, fp)
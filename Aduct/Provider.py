@@ -17,21 +17,165 @@
 
 """
 Provider acts as a producer of widgets that are placed as child in :mod:`.Element`.
+
+A provider can keep a pool of cleared children so that they can be handed back instead of building
+a new widget tree. The pool is disabled by default and is enabled by setting ``pool-size`` to a
+positive value, which is the number of children parked for each ``child_name``. When the pool of a
+name is full, the child that was parked first is evicted and cleared through
+:meth:`Provider.clear_child`. The number of children parked across all names can be capped by
+``max-pooled``. When it is crossed, the children of the name that was parked or taken least
+recently are evicted first.
+
+A provider that does blocking work to make a child (like reading a file) should override
+:meth:`Provider.get_a_child_async` and :meth:`Provider.get_child_from_props_async`, doing the work
+in a thread and building the widgets back in the main loop. By default, they build the child
+through their blocking counterparts when the main loop is idle.
+
+Building a child from interface properties can also be split into two phases.
+:meth:`Provider.prepare` does the slow work (I/O, parsing) and must be safe to call from any
+thread, while :meth:`Provider.build` makes the widgets from its result in the main loop.
+``Aduct.set_interface`` runs the :meth:`Provider.prepare` of all elements in a thread pool and
+builds them one after the other. By default, :meth:`Provider.prepare` returns the properties as
+such and :meth:`Provider.build` calls :meth:`Provider.get_child_from_props`.
+
+:meth:`Provider.get_a_child`, :meth:`Provider.get_child_from_props`, :meth:`Provider.prepare` and
+:meth:`Provider.build` can also be coroutine functions when an asyncio event loop runs on the GLib
+main context (see :mod:`.Coroutine`). The default :meth:`Provider.get_a_child_async` and
+:meth:`Provider.get_child_from_props_async` then await them, and cancel them when their cancellable
+is cancelled. ``Aduct.Coroutine.set_interface`` awaits them too, and a lazy or hibernated element
+requests its child without blocking. The blocking functions like ``Aduct.set_interface`` and
+``Aduct.change_child_at_element`` raise :class:`TypeError` for such providers.
+
+When the state of a child changes such that :meth:`Provider.get_child_props` would give different
+properties, the provider should emit ``child-props-changed`` with the child, so that the element
+holding it drops its cached properties and listeners of ``interface-changed`` like
+``Aduct.Autosave`` learn of the change.
 """
 
-from gi.repository import GObject
+import asyncio
+import inspect
+from collections import OrderedDict
+
+from gi.repository import GLib, GObject
 
 
 class Provider(GObject.Object):
+
+    __gsignals__ = {"child-props-changed": (2, None, (object,))}
+
+    max_pooled = GObject.Property(type=int, default=0)
+    pool_size = GObject.Property(type=int, default=0)
+
     def __init__(self, *args, **kwargs):
 
         """
         This a template that gives an idea of methods a :mod:`.Provider` must have.
         Unless otherwise stated, all the description of methods are generalised expected behavior of
         a :mod:`.Provider`.
+
+        Attributes
+        ----------
+        n_pooled : :class:`int`
+            The number of children parked in :obj:`pool`.
+        pool : :class:`collections.OrderedDict`
+            The parked children of :obj:`self`, as ``{child_name: [child_dict, ...]}``, from the
+            least to the most recently used name.
+        pool_hits : :class:`int`
+            The number of times a child was handed back from :obj:`pool`.
+        pool_misses : :class:`int`
+            The number of times :obj:`pool` had no child of the requested name.
+
+        Signals
+            child-props-changed
+                Emitted with a child, when the properties of child given by
+                :meth:`get_child_props` are changed.
         """
 
         GObject.Object.__init__(self, *args, **kwargs)
+        self.n_pooled = 0
+        self.pool = OrderedDict()
+        self.pool_hits = 0
+        self.pool_misses = 0
+
+    def __check_child__(self, result, method):
+
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise TypeError(
+                f"{type(self).__name__}.{method} is a coroutine function, so its child can only be "
+                "built through Aduct.Coroutine or the methods that do not block"
+            )
+        return result
+
+    def __hand_over__(self, get_child, cancellable, callback):
+
+        # A child that could not be made is handed over as None with the error, so that the
+        # request is finished instead of waiting forever.
+        try:
+            result = get_child()
+        except Exception as error:
+            callback(None, error)
+            return
+        if not inspect.isawaitable(result):
+            callback(result)
+            return
+
+        task = asyncio.ensure_future(result)
+        handler = cancellable.connect("cancelled", lambda cancellable: task.cancel())
+
+        def done(task):
+            cancellable.disconnect(handler)
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                callback(None, task.exception())
+            else:
+                callback(task.result())
+
+        task.add_done_callback(done)
+
+    def build(self, prepared):
+
+        """
+        Gets a child from the result of :meth:`prepare`. It is always called in the main loop.
+
+        Arguments
+        ---------
+        prepared : :class:`object`
+            The value returned by :meth:`prepare`.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with properties of child.
+        """
+
+        return self.get_child_from_props(prepared)
+
+    def can_hibernate(self, child_name, child):
+
+        """
+        Gets whether the given child can be released by hibernation of its :mod:`.Element`.
+
+        A child released by hibernation is built again from the properties given by
+        :meth:`get_child_props`, so providers whose children can not be rebuilt that way should
+        return :obj:`False`. By default, it is :obj:`True`.
+
+        Arguments
+        ---------
+        child_name : :class:`str`
+            The name of child.
+        child : :class:`Gtk.Widget`
+            The child produced by :obj:`self`.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if the child can be released, else :obj:`False`.
+        """
+
+        return True
 
     def clear_child(self, child_dict):
 
@@ -46,6 +190,19 @@ class Provider(GObject.Object):
 
         pass
 
+    def clear_pool(self):
+
+        """
+        Clears all the children parked in the pool of :obj:`self` through :meth:`clear_child`.
+        """
+
+        pool = self.pool
+        self.pool = OrderedDict()
+        self.n_pooled = 0
+        for child_dicts in pool.values():
+            for child_dict in child_dicts:
+                self.clear_child(child_dict)
+
     def get_a_child(self, child_name):
 
         """
@@ -64,6 +221,33 @@ class Provider(GObject.Object):
 
         pass
 
+    def get_a_child_async(self, child_name, cancellable, callback):
+
+        """
+        Gets a child with given name without blocking.
+
+        The child has to be built in the main loop and handed over by calling :obj:`callback`
+        with the dictionary of child. :obj:`callback` need not be called once :obj:`cancellable`
+        is cancelled.
+
+        Arguments
+        ---------
+        child_name : :class:`str`
+            The name of child to be retrieved.
+        cancellable : :class:`Gio.Cancellable`
+            The cancellable that is cancelled when the child is no longer needed.
+        callback : :class:`callable`
+            The function to be called with a dictionary with properties of child. When the child
+            could not be made, it is called with :obj:`None` and the raised exception instead.
+        """
+
+        def get_a_child():
+            if not cancellable.is_cancelled():
+                self.__hand_over__(lambda: self.get_a_child(child_name), cancellable, callback)
+            return False
+
+        GLib.idle_add(get_a_child)
+
     def get_child_props(self, child_name, child, header_child):
 
         """
@@ -104,6 +288,57 @@ class Provider(GObject.Object):
 
         pass
 
+    def get_child_from_props_async(self, props, cancellable, callback):
+
+        """
+        Gets a child based on given interface properties without blocking.
+
+        It is same as :meth:`get_a_child_async`, except that the child is built from
+        :obj:`props` like :meth:`get_child_from_props`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The interface properties for child.
+        cancellable : :class:`Gio.Cancellable`
+            The cancellable that is cancelled when the child is no longer needed.
+        callback : :class:`callable`
+            The function to be called with a dictionary with properties of child. When the child
+            could not be made, it is called with :obj:`None` and the raised exception instead.
+        """
+
+        def get_child_from_props():
+            if not cancellable.is_cancelled():
+                self.__hand_over__(
+                    lambda: self.get_child_from_props(props), cancellable, callback
+                )
+            return False
+
+        GLib.idle_add(get_child_from_props)
+
+    def get_child_cost(self, child_name, child):
+
+        """
+        Gets an estimate of the memory held by the given child.
+
+        The unit of estimate is chosen by the provider, but it should be the same for all
+        providers of an application. By default, it is 1 for every child.
+
+        Arguments
+        ---------
+        child_name : :class:`str`
+            The name of child.
+        child : :class:`Gtk.Widget`
+            The child produced by :obj:`self`.
+
+        Returns
+        -------
+        :class:`int`
+            The estimated cost of child.
+        """
+
+        return 1
+
     def get_name(self):
 
         """
@@ -116,3 +351,144 @@ class Provider(GObject.Object):
         """
 
         return self.get_property("name")
+
+    def get_pool_stats(self):
+
+        """
+        Gets the counters of the pool of :obj:`self`.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with keys ``hits``, ``misses``, ``size`` (the number of parked children)
+            and ``limit`` (the value of ``pool-size``).
+        """
+
+        stats = {
+            "hits": self.pool_hits,
+            "misses": self.pool_misses,
+            "size": self.n_pooled,
+            "limit": self.get_property("pool-size"),
+        }
+        return stats
+
+    def get_recycled_child(self, child_name):
+
+        """
+        Gets a parked child with given name.
+
+        The child that was parked last is taken out of the pool and passed through
+        :meth:`reset_child` before it is returned.
+
+        Arguments
+        ---------
+        child_name : :class:`str`
+            The name of child to be retrieved.
+
+        Returns
+        -------
+        :class:`dict` or :obj:`None`
+            A dictionary with properties of child or :obj:`None` if no child of that name is
+            parked.
+        """
+
+        child_dicts = self.pool.get(child_name)
+        if not child_dicts:
+            self.pool_misses += 1
+            return None
+
+        child_dict = child_dicts.pop()
+        self.n_pooled -= 1
+        if child_dicts:
+            self.pool.move_to_end(child_name)
+        else:
+            del self.pool[child_name]
+        self.pool_hits += 1
+        return self.reset_child(child_dict)
+
+    def prepare(self, props):
+
+        """
+        Does the work needed to build a child from given interface properties, except making
+        widgets.
+
+        It can be called from any thread, so it must neither touch widgets nor change state
+        shared with the main loop. The result is passed to :meth:`build`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The interface properties for child.
+
+        Returns
+        -------
+        :class:`object`
+            The value to be passed to :meth:`build`.
+        """
+
+        return props
+
+    def recycle_child(self, child_dict):
+
+        """
+        Parks the given child in the pool instead of clearing it.
+
+        Nothing is done when ``pool-size`` of :obj:`self` is not positive. When the pool of
+        ``child_name`` is full, the child parked first is evicted and cleared. When more than
+        ``max-pooled`` children are parked, the children of the least recently used name are
+        evicted and cleared.
+
+        Arguments
+        ---------
+        child_dict: :class:`dict`
+            A dictionary with properties of the child.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if the child was parked, else :obj:`False`.
+        """
+
+        limit = self.get_property("pool-size")
+        if limit <= 0:
+            return False
+
+        child_name = child_dict["child_name"]
+        child_dicts = self.pool.setdefault(child_name, [])
+        child_dicts.append(child_dict)
+        self.pool.move_to_end(child_name)
+        self.n_pooled += 1
+
+        while len(child_dicts) > limit:
+            self.clear_child(child_dicts.pop(0))
+            self.n_pooled -= 1
+
+        max_pooled = self.get_property("max-pooled")
+        while max_pooled > 0 and self.n_pooled > max_pooled:
+            name, oldest = next(iter(self.pool.items()))
+            self.clear_child(oldest.pop(0))
+            self.n_pooled -= 1
+            if not oldest:
+                del self.pool[name]
+        return True
+
+    def reset_child(self, child_dict):
+
+        """
+        Resets a parked child before it is handed back from the pool.
+
+        By default the child is returned as such. Providers whose children keep per-use state
+        should override it.
+
+        Arguments
+        ---------
+        child_dict: :class:`dict`
+            A dictionary with properties of the child.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with properties of the child, ready to be added to a :mod:`.Element`.
+        """
+
+        return child_dict
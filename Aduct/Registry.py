@@ -0,0 +1,266 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Registry keeps a live index of the views and elements, so that they can be found without walking
+the widget hierarchy. Every view and element is added when it is made and is given an id, unique
+among the live ones. Elements are also indexed by the name of their provider and the name of their
+child, which is kept up to date as their child changes. A widget leaves the index when it is
+destroyed.
+
+The index holds weak references, so it does not keep widgets alive.
+
+.. code:: python
+
+   for element in Aduct.find_elements(provider="Terminal"):
+       ...
+   element = Aduct.get_by_id(element_id)
+"""
+
+import uuid
+import weakref
+
+by_child_name = {}
+by_id = weakref.WeakValueDictionary()
+by_provider = {}
+by_type = {}
+
+
+def _discard(index, key, widget):
+
+    widgets = index.get(key)
+    if widgets is not None:
+        widgets.discard(widget)
+        if not widgets:
+            del index[key]
+
+
+def _get_provider_name(provider):
+
+    if provider is None or isinstance(provider, str):
+        return provider
+    return provider.get_name()
+
+
+def _handle_destroy(widget):
+
+    remove(widget)
+
+
+def _is_under(widget, top_level):
+
+    while widget is not None:
+        if widget is top_level:
+            return True
+        widget = widget.get_parent()
+    return False
+
+
+def add(widget):
+
+    """
+    Adds the given view or element to the index, with a new id.
+
+    Arguments
+    ---------
+    widget : :mod:`.View` or :mod:`.Element`
+        The widget to be added.
+    """
+
+    widget.id = uuid.uuid4().hex[:12]
+    widget.index_keys = (None, None)
+    by_id[widget.id] = widget
+    by_type.setdefault(widget.get_type(), weakref.WeakSet()).add(widget)
+    widget.connect("destroy", _handle_destroy)
+
+
+def find_elements(provider=None, child_name=None, predicate=None, top_level=None):
+
+    """
+    Finds the elements that match all the given conditions.
+
+    The elements are looked up by :obj:`provider` and :obj:`child_name` in the index, so the cost
+    depends on the number of matches and not the size of interface.
+
+    Arguments
+    ---------
+    provider : :mod:`.Provider` or :class:`str`
+        The provider of child of elements, or its name.
+    child_name : :class:`str`
+        The name of child of elements.
+    predicate : :class:`callable`
+        A function called as ``predicate(element)`` that returns whether the element matches.
+    top_level : :mod:`.View`
+        The view under which the elements have to be.
+
+    Returns
+    -------
+    :class:`list`
+        The matching elements, in no particular order.
+    """
+
+    candidates = []
+    if provider is not None:
+        candidates.append(by_provider.get(_get_provider_name(provider), ()))
+    if child_name is not None:
+        candidates.append(by_child_name.get(child_name, ()))
+    if not candidates:
+        candidates.append(by_type.get("element", ()))
+
+    candidates.sort(key=len)
+    elements = []
+    for element in list(candidates[0]):
+        if any(element not in others for others in candidates[1:]):
+            continue
+        if predicate is not None and not predicate(element):
+            continue
+        if top_level is not None and not _is_under(element, top_level):
+            continue
+        elements.append(element)
+    return elements
+
+
+def find_views(view_type=None, top_level=None):
+
+    """
+    Finds the views of given type.
+
+    Arguments
+    ---------
+    view_type : :class:`str`
+        The type of views, like ``notebook``. When not given, views of all types are found.
+    top_level : :mod:`.View`
+        The view under which the views have to be.
+
+    Returns
+    -------
+    :class:`list`
+        The matching views, in no particular order.
+    """
+
+    if view_type is None:
+        views = [view for key, views in by_type.items() if key != "element" for view in views]
+    else:
+        views = list(by_type.get(view_type, ()))
+    if top_level is not None:
+        views = [view for view in views if _is_under(view, top_level)]
+    return views
+
+
+def get_by_id(widget_id):
+
+    """
+    Gets the view or element of given id.
+
+    Arguments
+    ---------
+    widget_id : :class:`str`
+        The id of widget.
+
+    Returns
+    -------
+    :mod:`.View` or :mod:`.Element`
+        The widget of :obj:`widget_id`, :obj:`None` if there is no such widget.
+    """
+
+    return by_id.get(widget_id)
+
+
+def remove(widget):
+
+    """
+    Removes the given view or element from the index.
+
+    Arguments
+    ---------
+    widget : :mod:`.View` or :mod:`.Element`
+        The widget to be removed.
+    """
+
+    if by_id.get(widget.id) is widget:
+        del by_id[widget.id]
+    _discard(by_type, widget.get_type(), widget)
+    provider_name, child_name = widget.index_keys
+    _discard(by_provider, provider_name, widget)
+    _discard(by_child_name, child_name, widget)
+    widget.index_keys = (None, None)
+
+
+def set_id(widget, widget_id, replace=False):
+
+    """
+    Sets the id of given view or element.
+
+    Arguments
+    ---------
+    widget : :mod:`.View` or :mod:`.Element`
+        The widget whose id has to be set.
+    widget_id : :class:`str`
+        The new id.
+    replace : :class:`bool`
+        States whether to take :obj:`widget_id` from another live widget that has it, which is then
+        given a new id. Default is :obj:`False`.
+
+    Returns
+    -------
+    :mod:`.View` or :mod:`.Element`
+        The widget from which :obj:`widget_id` was taken, :obj:`None` if there is no such widget.
+
+    Raises
+    ------
+    ValueError
+        Raised when another live widget has :obj:`widget_id` and :obj:`replace` is :obj:`False`.
+    """
+
+    other = by_id.get(widget_id)
+    if other is widget:
+        return None
+    if other is not None:
+        if not replace:
+            raise ValueError(f"Id {widget_id} is already taken by another {other.get_type()}")
+        other.id = uuid.uuid4().hex[:12]
+        by_id[other.id] = other
+    if by_id.get(widget.id) is widget:
+        del by_id[widget.id]
+    widget.id = widget_id
+    by_id[widget_id] = widget
+    return other
+
+
+def update(element):
+
+    """
+    Indexes the given element again by its provider and the name of its child.
+
+    Arguments
+    ---------
+    element : :mod:`.Element`
+        The element whose child is changed.
+    """
+
+    keys = (_get_provider_name(element.provider), element.child_name)
+    provider_name, child_name = element.index_keys
+    if keys == element.index_keys:
+        return
+
+    _discard(by_provider, provider_name, element)
+    _discard(by_child_name, child_name, element)
+    element.index_keys = keys
+    if keys[0] is not None:
+        by_provider.setdefault(keys[0], weakref.WeakSet()).add(element)
+    if keys[1] is not None:
+        by_child_name.setdefault(keys[1], weakref.WeakSet()).add(element)
@@ -0,0 +1,177 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Schema converts interface dictionaries between the versions of their format.
+
+In version 1, a notebook holds its pages as ``element_0``, ``element_1``... along with
+``n_elements`` and a paned holds its panels as ``child_1`` and ``child_2``. A tiles holds its
+children as ``child_1``, ``child_2``... along with ``n_children``. In version 2, they are held as
+lists, ``elements`` and ``children`` respectively, and the root dictionary has a ``version`` key.
+A missing panel is an empty dictionary in both versions.
+
+.. code:: python
+
+   # Version 1
+   {"type": "paned", "child_1": {...}, "child_2": {}, "orientation": 0, "position": 120}
+   # Version 2
+   {"type": "paned", "children": [{...}, {}], "orientation": 0, "position": 120, "version": 2}
+
+``Aduct.get_interface`` gives version 2 by default and ``Aduct.set_interface`` accepts both.
+"""
+
+VERSION = 2
+
+
+def _convert(interface_dict, convert_node):
+
+    root = {}
+    stack = [(interface_dict, root)]
+    while stack:
+        dic, new_dic = stack.pop()
+        new_dic.update(dic)
+        if new_dic.get("type") == "element":
+            continue
+        for container, key in convert_node(new_dic):
+            child = container[key]
+            new_child = {}
+            container[key] = new_child
+            stack.append((child, new_child))
+    return root
+
+
+def _downgrade_node(props):
+
+    slots = []
+    elements = props.pop("elements", None)
+    if elements is not None:
+        for idx, element in enumerate(elements):
+            props[f"element_{idx}"] = element
+            slots.append((props, f"element_{idx}"))
+        props["n_elements"] = len(elements)
+
+    panels = props.pop("children", None)
+    if panels is not None:
+        for idx, panel in enumerate(panels):
+            props[f"child_{idx + 1}"] = panel
+            slots.append((props, f"child_{idx + 1}"))
+        if props.get("type") == "tiles":
+            props["n_children"] = len(panels)
+
+    if "child" in props:
+        slots.append((props, "child"))
+    return slots
+
+
+def _upgrade_node(props):
+
+    # The lists are made again, so that the given dictionary is not modified.
+    slots = []
+    n_elements = props.pop("n_elements", None)
+    if n_elements is not None:
+        props["elements"] = [props.pop(f"element_{idx}") for idx in range(n_elements)]
+    elif "elements" in props:
+        props["elements"] = list(props["elements"])
+    if "elements" in props:
+        slots.extend((props["elements"], idx) for idx in range(len(props["elements"])))
+
+    n_children = props.pop("n_children", None)
+    if n_children is not None:
+        props["children"] = [props.pop(f"child_{idx + 1}") for idx in range(n_children)]
+    elif "child_1" in props:
+        props["children"] = [props.pop("child_1"), props.pop("child_2")]
+    elif "children" in props:
+        props["children"] = list(props["children"])
+    if "children" in props:
+        slots.extend((props["children"], idx) for idx in range(len(props["children"])))
+
+    if "child" in props:
+        slots.append((props, "child"))
+    return slots
+
+
+def downgrade(interface_dict):
+
+    """
+    Converts the given interface dictionary to version 1.
+
+    Arguments
+    ---------
+    interface_dict : :class:`dict`
+        A dictionary that can be used to set interface, of version 2.
+
+    Returns
+    -------
+    :class:`dict`
+        A new dictionary of version 1. :obj:`interface_dict` is not modified.
+    """
+
+    props = _convert(interface_dict, _downgrade_node)
+    props.pop("version", None)
+    return props
+
+
+def get_version(interface_dict):
+
+    """
+    Gets the version of given interface dictionary.
+
+    Arguments
+    ---------
+    interface_dict : :class:`dict`
+        A dictionary that can be used to set interface.
+
+    Returns
+    -------
+    :class:`int`
+        The version, which is 1 when the dictionary has no ``version`` key.
+    """
+
+    return interface_dict.get("version", 1)
+
+
+def upgrade(interface_dict):
+
+    """
+    Converts the given interface dictionary to version 2.
+
+    Arguments
+    ---------
+    interface_dict : :class:`dict`
+        A dictionary that can be used to set interface, of version 1 or 2.
+
+    Returns
+    -------
+    :class:`dict`
+        A new dictionary of version 2, or :obj:`interface_dict` itself if it is already of version
+        2. A dictionary of version 1 is not modified.
+
+    Raises
+    ------
+    ValueError
+        Raised when :obj:`interface_dict` is of a newer version.
+    """
+
+    version = get_version(interface_dict)
+    if version == VERSION:
+        return interface_dict
+    if version > VERSION:
+        raise ValueError(f"Expected interface version {VERSION} or less, but got {version}")
+
+    props = _convert(interface_dict, _upgrade_node)
+    props["version"] = VERSION
+    return props
@@ -22,11 +22,14 @@ Bin is a view that can hold only one child. The child can be either an :mod:`.Vi
 
 from gi.repository import GObject, Gtk
 
+from .. import Registry
 from .View import View
 
 
 class Bin(View, Gtk.Bin):
 
+    __gsignals__ = {"interface-changed": (2, None, ())}
+
     type = GObject.Property(type=str, default="bin", flags=GObject.ParamFlags.READABLE)
 
     def __init__(self, **kwargs):
@@ -38,10 +41,15 @@ class Bin(View, Gtk.Bin):
         ---------
         **kwargs
             The keyword arguments to be passed to :class:`Gtk.Bin` from which :mod:`.Bin` is made.
+
+        Signals
+            interface-changed
+                Emitted when the interface of :obj:`self` or its children is changed.
         """
 
         Gtk.Bin.__init__(self, **kwargs)
         self.set_css_name("aduct-bin")
+        Registry.add(self)
 
     def add_child(self, child):
 
@@ -62,11 +70,70 @@ class Bin(View, Gtk.Bin):
         if self.get_child():
             raise ValueError("Aduct.Bin cannot have any more child")
         self.add(child)
+        self.mark_dirty()
+
+    def get_child_index(self, child):
+
+        """
+        Gets the index of given child, which is always 0.
+
+        Arguments
+        ---------
+        child : :mod:`.View` or :mod:`.Element`
+            The child of :obj:`self`.
+
+        Returns
+        -------
+        :class:`int`
+            The index of :obj:`child`.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
 
-    def get_props(self):
+        if child is not self.get_child():
+            raise ValueError("Child is not in Aduct.Bin")
+        return 0
+
+    def get_child_slots(self):
 
         """
-        Gets the interface properties.
+        Gets the slot of child.
+
+        Returns
+        -------
+        :class:`list`
+            A list with the child of :obj:`self`, :obj:`None` if there is no child.
+        """
+
+        return [self.get_child()]
+
+    def get_nth_child(self, index):
+
+        """
+        Gets the child at given index.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of child, which has to be 0.
+
+        Returns
+        -------
+        :mod:`.View` or :mod:`.Element`
+            The child of :obj:`self`, :obj:`None` if there is no child or :obj:`index` is not 0.
+        """
+
+        if index == 0:
+            return self.get_child()
+        return None
+
+    def get_own_props(self):
+
+        """
+        Gets the interface properties of :obj:`self` alone, without those of its child.
 
         Returns
         -------
@@ -74,14 +141,22 @@ class Bin(View, Gtk.Bin):
             A dictionary with interface properties.
         """
 
-        props = {"type": "bin"}
-        child = self.get_child()
-        if child:
-            child_props = child.get_props()
-            props["child"] = child_props
-        else:
-            props["child"] = {}
-        return props
+        return {"type": "bin", "id": self.id}
+
+    def join_props(self, props, children_props):
+
+        """
+        Adds the properties of child to the properties of :obj:`self`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The properties given by :meth:`get_own_props`.
+        children_props : :class:`list`
+            A list with the properties of child, an empty dictionary if there is no child.
+        """
+
+        props["child"] = children_props[0]
 
     def remove_child(self, child):
 
@@ -101,6 +176,7 @@ class Bin(View, Gtk.Bin):
 
         if child == self.get_child():
             self.remove(child)
+            self.mark_dirty()
         else:
             raise ValueError("Child is not in Aduct.Bin")
 
@@ -119,21 +195,31 @@ class Bin(View, Gtk.Bin):
 
         self.remove_child(old_child)
         self.add(new_child)
+        self.mark_dirty()
 
-    def set_from_props(self, props):
+    def set_own_props(self, props):
 
         """
-        Sets the interface from given properties.
+        Sets the properties of :obj:`self` alone from given properties.
 
         Arguments
         ---------
         props : :class:`dict`
             The dictionary containig properties of interface.
+
+        Returns
+        -------
+        :class:`list`
+            A list of ``(child, child_props)`` of the added child, whose properties have to be
+            set.
         """
 
+        if "id" in props:
+            self.set_id(props["id"], replace=True)
         child_props = props["child"]
         if not child_props:
-            return
+            return []
         child = child_props["type"]
         self.add(child)
-        child.set_from_props(child_props)
+        self.mark_dirty()
+        return [(child, child_props)]
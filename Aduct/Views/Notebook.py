@@ -22,12 +22,16 @@ restriction, there is no limitation in number of children it can hold.
 
 from gi.repository import GObject, Gtk
 
+from .. import Batch, Registry
 from .View import View
 
 
 class Notebook(View, Gtk.Notebook):
 
-    __gsignals__ = {"action-clicked": (2, None, (Gtk.Button, int))}
+    __gsignals__ = {
+        "action-clicked": (2, None, (Gtk.Button, int)),
+        "interface-changed": (2, None, ()),
+    }
 
     type = GObject.Property(type=str, default="notebook", flags=GObject.ParamFlags.READABLE)
 
@@ -45,10 +49,17 @@ class Notebook(View, Gtk.Notebook):
             action-clicked
                 Emitted with an integer when action button of :obj:`self` is
                 clicked. The integer is 1, 2, 3 for LMB, MMB, RMB respectively.
+            interface-changed
+                Emitted when the interface of :obj:`self` or its children is changed.
         """
 
         Gtk.Notebook.__init__(self, **kwargs)
         self.set_css_name("aduct-notebook")
+        Registry.add(self)
+        self.connect("notify::tab-pos", self.__handle_changed__)
+        self.connect("page-added", self.__handle_changed__)
+        self.connect("page-removed", self.__handle_changed__)
+        self.connect("page-reordered", self.__handle_changed__)
 
     def __handle_event__(self, button, event):
 
@@ -82,6 +93,31 @@ class Notebook(View, Gtk.Notebook):
         else:
             raise TypeError("Aduct.Notebook can only hold a child of type Aduct.Element")
 
+    def add_pages_from_props(self, elements_props):
+
+        """
+        Appends the elements of given properties as pages, see :meth:`set_own_props`.
+
+        Arguments
+        ---------
+        elements_props : :class:`list`
+            The properties of elements, in the order of pages.
+
+        Returns
+        -------
+        :class:`list`
+            A list of ``(element, element_props)`` of the added elements, whose properties have to
+            be set.
+        """
+
+        elements = []
+        for element_props in elements_props:
+            element = element_props["type"]
+            tab_label = self.get_tab(element)
+            self.append_page(element, tab_label)
+            elements.append((element, element_props))
+        return elements
+
     def change_child_label(self, child):
 
         """
@@ -90,7 +126,8 @@ class Notebook(View, Gtk.Notebook):
         The text for new label is taken as the name of child of :obj:`child`
         (``Aduct.Element.child_name``).
         It is set to `No child` when `child` has no name for its child
-        (``Aduct.Element.child_name is None``).
+        (``Aduct.Element.child_name is None``). Inside ``Aduct.batch``, the label is changed when
+        the batch is closed.
 
         Arguments
         ---------
@@ -98,6 +135,10 @@ class Notebook(View, Gtk.Notebook):
             The child whose tab label has to be changed.
         """
 
+        if Batch.depth:
+            Batch.labels[(self, child)] = None
+            return
+
         label = self.get_tab_label(child)
         if child.child_name:
             label.set_text(child.child_name)
@@ -166,10 +207,70 @@ class Notebook(View, Gtk.Notebook):
         child.connect("child-removed", self.change_child_label)
         return label
 
-    def get_props(self):
+    def get_child_index(self, child):
+
+        """
+        Gets the index of given child, which is its page number.
+
+        Arguments
+        ---------
+        child : :mod:`.Element`
+            The child of :obj:`self`.
+
+        Returns
+        -------
+        :class:`int`
+            The index of :obj:`child`.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
+
+        index = self.page_num(child)
+        if index < 0:
+            raise ValueError("Child not in Aduct.Notebook")
+        return index
+
+    def get_child_slots(self):
+
+        """
+        Gets the slots of elements, in the order of pages.
+
+        Returns
+        -------
+        :class:`list`
+            A list of elements of :obj:`self`.
+        """
+
+        return self.get_children()
+
+    def get_nth_child(self, index):
+
+        """
+        Gets the child at given index, which is its page number.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of child.
+
+        Returns
+        -------
+        :mod:`.Element`
+            The child at :obj:`index`, :obj:`None` if there is no such page.
+        """
+
+        if index < 0:
+            return None
+        return self.get_nth_page(index)
+
+    def get_own_props(self):
 
         """
-        Gets the interface properties.
+        Gets the interface properties of :obj:`self` alone, where the list of elements is left
+        empty.
 
         Returns
         -------
@@ -177,16 +278,9 @@ class Notebook(View, Gtk.Notebook):
             A dictionary with interface properties.
         """
 
-        props = {"type": "notebook", "tab_position": self.get_tab_pos()}
+        props = {"type": "notebook", "id": self.id, "tab_position": self.get_tab_pos()}
         props["n_action_button"] = self.get_number_of_action_buttons()
-        elements = self.get_children()
-        if elements:
-            for idx, element in enumerate(elements):
-                element_props = element.get_props()
-                props[f"element_{idx}"] = element_props
-            props["n_elements"] = idx + 1
-        else:
-            props["n_elements"] = 0
+        props["elements"] = []
         return props
 
     def get_number_of_action_buttons(self):
@@ -210,6 +304,21 @@ class Notebook(View, Gtk.Notebook):
 
         return valid
 
+    def join_props(self, props, children_props):
+
+        """
+        Adds the properties of elements to the properties of :obj:`self`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The properties given by :meth:`get_own_props`.
+        children_props : :class:`list`
+            The properties of elements, in the order of pages.
+        """
+
+        props["elements"].extend(children_props)
+
     def remove_child(self, child):
 
         """
@@ -229,6 +338,8 @@ class Notebook(View, Gtk.Notebook):
         if child in self.get_children():
             page_num = self.page_num(child)
             self.remove_page(page_num)
+            # The tab is gone, so its label is no longer changed with the child.
+            child.disconnect_by_func(self.change_child_label)
         else:
             raise ValueError("Child not in Aduct.Notebook")
 
@@ -279,17 +390,25 @@ class Notebook(View, Gtk.Notebook):
         action_button.connect("button-press-event", self.__handle_event__)
         self.set_action_widget(action_button, pack_type)
         action_button.show_all()
+        self.mark_dirty()
 
-    def set_from_props(self, props):
+    def set_own_props(self, props):
 
         """
-        Sets the interface from given properties.
+        Sets the properties of :obj:`self` alone from given properties. Properties of both
+        versions of interface (see :mod:`.Schema`) are accepted.
 
         Arguments
         ---------
         props : :class:`dict`
             The dictionary containig properties of interface.
 
+        Returns
+        -------
+        :class:`list`
+            A list of ``(element, element_props)`` of the added elements, whose properties have to
+            be set.
+
         Raises
         ------
         ValueError
@@ -321,12 +440,11 @@ class Notebook(View, Gtk.Notebook):
                 f"Number of action buttons n: 0 <= n <= 2; but got {n_action_button}"
             )
 
+        if "id" in props:
+            self.set_id(props["id"], replace=True)
         self.set_tab_pos(props["tab_position"])
-        n_elements = props["n_elements"]
-
-        for i in range(n_elements):
-            element_i_props = props[f"element_{i}"]
-            element = element_i_props["type"]
-            element.set_from_props(element_i_props)
-            tab_label = self.get_tab(element)
-            self.append_page(element, tab_label)
+        if "elements" in props:
+            elements_props = props["elements"]
+        else:
+            elements_props = [props[f"element_{i}"] for i in range(props["n_elements"])]
+        return self.add_pages_from_props(elements_props)
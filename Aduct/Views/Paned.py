@@ -18,16 +18,37 @@
 """
 Paned is a view that can hold two children. The two children can either be :mod:`.View` or
 :mod:`.Element`.
+
+When its handle is dragged, a paned allocates its children again at every move of pointer, which
+is slow when they hold heavy widgets. With the property ``resize-mode`` set to ``scale`` or
+``clip``, the children are drawn to images when a drag starts, and the images are scaled or clipped
+to the new sizes of panels while the pointer moves. The position is taken once a frame and the
+children are allocated only once, when the drag ends.
+
+``Operations.notify`` is called with ``set_position`` when the position is set or dragged, but not
+when it is moved by the allocation of paned, like when the window is resized.
+
+.. code:: python
+
+   paned = Aduct.Paned()
+   paned.set_property("resize-mode", "scale")
 """
 
+import cairo
 from gi.repository import GObject, Gtk
 
+from .. import Operations, Registry
 from .View import View
 
+RESIZE_MODES = ("live", "scale", "clip")
+
 
 class Paned(View, Gtk.Paned):
 
+    __gsignals__ = {"interface-changed": (2, None, ())}
+
     type = GObject.Property(type=str, default="paned", flags=GObject.ParamFlags.READABLE)
+    resize_mode = GObject.Property(type=str, default="live")
 
     def __init__(self, **kwargs):
 
@@ -39,10 +60,127 @@ class Paned(View, Gtk.Paned):
         **kwargs
             The keyword arguments to be passed to :class:`Gtk.Paned` from which :mod:`.Paned` is
             made.
+
+            ``resize-mode`` is how the children are resized while the handle is dragged, one of
+            ``live``, ``scale`` and ``clip``. Default is ``live``, where they are allocated at
+            every move. See :mod:`.Paned`.
+
+        Attributes
+        ----------
+        snapshot : :class:`dict`
+            The images of children and the position drawn while a drag is on, :obj:`None`
+            otherwise.
+
+        Signals
+            interface-changed
+                Emitted when the interface of :obj:`self` or its children is changed.
         """
 
         Gtk.Paned.__init__(self, **kwargs)
         self.set_name("aduct-paned")
+        Registry.add(self)
+        self.snapshot = None
+        self.allocating = False
+        self.drag_gesture = Gtk.GestureDrag.new(self)
+        # The drag is only watched, the handle is still moved by Gtk.Paned. The gesture never
+        # claims the sequence, so it does not take it from the gesture of Gtk.Paned. When the
+        # sequence is claimed elsewhere, it is cancelled and the snapshot is ended.
+        self.drag_gesture.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        self.drag_gesture.connect("begin", self.__handle_drag_begin__)
+        self.drag_gesture.connect("cancel", self.__handle_drag_end__)
+        self.drag_gesture.connect("end", self.__handle_drag_end__)
+        self.drag_position = self.get_position()
+        self.connect("notify::orientation", self.__handle_changed__)
+        self.connect("notify::position", self.__handle_position__)
+
+    def __get_areas__(self, position):
+
+        # Gets the areas of panel 1, handle and panel 2 as (x, y, width, height).
+        width = self.get_allocated_width()
+        height = self.get_allocated_height()
+        handle_size = self.snapshot["handle_size"]
+        end = position + handle_size
+        if self.get_orientation() == Gtk.Orientation.HORIZONTAL:
+            return (
+                (0, 0, position, height),
+                (position, 0, handle_size, height),
+                (end, 0, max(0, width - end), height),
+            )
+        return (
+            (0, 0, width, position),
+            (0, position, width, handle_size),
+            (0, end, width, max(0, height - end)),
+        )
+
+    def __get_handle_size__(self):
+
+        child_1 = self.get_child1()
+        child_2 = self.get_child2()
+        if child_1 is not None and child_2 is not None:
+            alloc_1 = child_1.get_allocation()
+            alloc_2 = child_2.get_allocation()
+            if self.get_orientation() == Gtk.Orientation.HORIZONTAL:
+                return max(0, alloc_2.x - alloc_1.x - alloc_1.width)
+            return max(0, alloc_2.y - alloc_1.y - alloc_1.height)
+        return self.style_get_property("handle-size")
+
+    def __handle_drag_begin__(self, gesture, sequence):
+
+        self.drag_position = self.get_position()
+
+    def __handle_drag_end__(self, gesture, sequence):
+
+        self.end_snapshot()
+
+    def __handle_draw__(self, paned, context):
+
+        # Connected only while a snapshot is on, so that a paned in live mode draws as Gtk.Paned
+        # does. The default handler, which draws the children, is stopped meanwhile.
+        style = self.get_style_context()
+        width = self.get_allocated_width()
+        height = self.get_allocated_height()
+        Gtk.render_background(style, context, 0, 0, width, height)
+        area_1, handle, area_2 = self.__get_areas__(self.snapshot["position"])
+        for surface, (x, y, width, height) in zip(self.snapshot["images"], (area_1, area_2)):
+            if surface is None or not width or not height:
+                continue
+            context.save()
+            context.rectangle(x, y, width, height)
+            context.clip()
+            context.translate(x, y)
+            if self.snapshot["mode"] == "scale":
+                context.scale(width / surface.get_width(), height / surface.get_height())
+            context.set_source_surface(surface, 0, 0)
+            context.paint()
+            context.restore()
+        Gtk.render_handle(style, context, *handle)
+        return True
+
+    def __handle_position__(self, paned, pspec):
+
+        if (
+            self.snapshot is None
+            and self.get_property("resize-mode") != "live"
+            and self.drag_gesture.is_active()
+        ):
+            # The position is already moved, but the children are not allocated yet.
+            if self.begin_snapshot():
+                self.snapshot["start"] = self.drag_position
+        if self.snapshot is not None:
+            # Notified once, when the drag ends.
+            return
+        self.__handle_changed__()
+        # A position moved by allocation, like when the window is resized, is not an operation.
+        if not self.allocating:
+            Operations.notify("set_position", self, position=self.get_position())
+
+    def __handle_tick__(self, paned, frame_clock):
+
+        position = self.get_position()
+        if position != self.snapshot["position"]:
+            self.snapshot["position"] = position
+            self.queue_draw()
+        return True
 
     def add_child(self, child, position=0):
 
@@ -79,11 +217,159 @@ class Paned(View, Gtk.Paned):
                     raise ValueError("Aduct.Paned can not have any more child")
                 self.add2(child)
             self.add1(child)
+        self.mark_dirty()
+
+    def get_child_index(self, child):
+
+        """
+        Gets the index of given child, 0 for panel 1 and 1 for panel 2.
+
+        Arguments
+        ---------
+        child : :mod:`.View` or :mod:`.Element`
+            The child of :obj:`self`.
+
+        Returns
+        -------
+        :class:`int`
+            The index of :obj:`child`.
 
-    def get_props(self):
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
+
+        if child is self.get_child1():
+            return 0
+        if child is self.get_child2():
+            return 1
+        raise ValueError("Child is not in Aduct.Paned")
+
+    def begin_snapshot(self):
 
         """
-        Gets the interface properties.
+        Draws the children to images, which are drawn in place of them till
+        :meth:`end_snapshot` is called. The children are not allocated meanwhile. It is called when
+        the handle is dragged and ``resize-mode`` is not ``live``.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if the snapshot is started, :obj:`False` if :obj:`self` is not mapped or
+            a snapshot is already on.
+
+        Raises
+        ------
+        ValueError
+            Raised when ``resize-mode`` is not a known mode.
+        """
+
+        mode = self.get_property("resize-mode")
+        if mode not in RESIZE_MODES:
+            raise ValueError(f"Unknown resize mode {mode!r} for Aduct.Paned")
+        if self.snapshot is not None or not self.get_mapped():
+            return False
+
+        images = []
+        for child in self.get_child_slots():
+            if child is None or not child.get_visible():
+                images.append(None)
+                continue
+            width = max(1, child.get_allocated_width())
+            height = max(1, child.get_allocated_height())
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+            child.draw(cairo.Context(surface))
+            images.append(surface)
+
+        position = self.get_position()
+        self.snapshot = {
+            "mode": "clip" if mode == "clip" else "scale",
+            "images": images,
+            "handle_size": self.__get_handle_size__(),
+            "start": position,
+            "position": position,
+        }
+        self.snapshot["tick"] = self.add_tick_callback(self.__handle_tick__)
+        self.snapshot["draw"] = self.connect("draw", self.__handle_draw__)
+        self.queue_draw()
+        return True
+
+    def do_size_allocate(self, allocation):
+
+        # It is the only override of Gtk.Paned, as the allocation has to be told apart from a
+        # position set by user, even in live mode.
+        if self.snapshot is None:
+            self.allocating = True
+            try:
+                Gtk.Paned.do_size_allocate(self, allocation)
+            finally:
+                self.allocating = False
+        else:
+            self.set_allocation(allocation)
+
+    def end_snapshot(self):
+
+        """
+        Stops drawing the images made by :meth:`begin_snapshot` and allocates the children to
+        the current position. ``Operations.notify`` is called with ``set_position`` if the
+        position is changed meanwhile. Nothing is done if there is no snapshot.
+        """
+
+        if self.snapshot is None:
+            return
+        snapshot = self.snapshot
+        self.snapshot = None
+        self.remove_tick_callback(snapshot["tick"])
+        self.disconnect(snapshot["draw"])
+        self.queue_resize()
+        self.queue_draw()
+
+        position = self.get_position()
+        if position != snapshot["start"]:
+            self.__handle_changed__()
+            Operations.notify("set_position", self, position=position)
+
+    def get_child_slots(self):
+
+        """
+        Gets the slots of children, of panel 1 and panel 2.
+
+        Returns
+        -------
+        :class:`list`
+            A list of children of :obj:`self`, :obj:`None` for an empty panel.
+        """
+
+        return [self.get_child1(), self.get_child2()]
+
+    def get_nth_child(self, index):
+
+        """
+        Gets the child at given index, 0 for panel 1 and 1 for panel 2.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of child.
+
+        Returns
+        -------
+        :mod:`.View` or :mod:`.Element`
+            The child at :obj:`index`, :obj:`None` if the panel is empty.
+        """
+
+        if index == 0:
+            return self.get_child1()
+        if index == 1:
+            return self.get_child2()
+        return None
+
+    def get_own_props(self):
+
+        """
+        Gets the interface properties of :obj:`self` alone, where the list of children is left
+        empty.
 
         Returns
         -------
@@ -91,21 +377,29 @@ class Paned(View, Gtk.Paned):
             A dictionary with interface properties.
         """
 
-        props = {"type": "paned"}
-        child_1 = self.get_child1()
-        child_2 = self.get_child2()
-        if child_1:
-            props["child_1"] = child_1.get_props()
-        else:
-            props["child_1"] = {}
-        if child_2:
-            props["child_2"] = child_2.get_props()
-        else:
-            props["child_2"] = {}
-        props["orientation"] = self.get_orientation()
-        props["position"] = self.get_position()
+        return {
+            "type": "paned",
+            "id": self.id,
+            "children": [],
+            "orientation": self.get_orientation(),
+            "position": self.get_position(),
+        }
+
+    def join_props(self, props, children_props):
+
+        """
+        Adds the properties of children to the properties of :obj:`self`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The properties given by :meth:`get_own_props`.
+        children_props : :class:`list`
+            The properties of children of panel 1 and panel 2. Those of an empty panel are an
+            empty dictionary.
+        """
 
-        return props
+        props["children"].extend(children_props)
 
     def remove_child(self, child):
 
@@ -125,6 +419,7 @@ class Paned(View, Gtk.Paned):
 
         if child in self.get_children():
             self.remove(child)
+            self.mark_dirty()
         else:
             raise ValueError("Child is not in Aduct.Paned")
 
@@ -156,30 +451,46 @@ class Paned(View, Gtk.Paned):
             self.add2(new_child)
         else:
             raise ValueError("Child is not in Aduct.Paned")
+        self.mark_dirty()
 
-    def set_from_props(self, props):
+    def set_own_props(self, props):
 
         """
-        Sets the interface from given properties.
+        Sets the properties of :obj:`self` alone from given properties. Properties of both
+        versions of interface (see :mod:`.Schema`) are accepted.
 
         Arguments
         ---------
         props : :class:`dict`
             The dictionary containig properties of interface.
+
+        Returns
+        -------
+        :class:`list`
+            A list of ``(child, child_props)`` of the added children, whose properties have to be
+            set.
         """
 
-        child_1_props = props["child_1"]
-        child_2_props = props["child_2"]
+        if "id" in props:
+            self.set_id(props["id"], replace=True)
+        children = []
+        if "children" in props:
+            child_1_props, child_2_props = props["children"]
+        else:
+            child_1_props = props["child_1"]
+            child_2_props = props["child_2"]
 
         if child_1_props:
             child_1 = child_1_props["type"]
-            child_1.set_from_props(child_1_props)
             self.add1(child_1)
+            children.append((child_1, child_1_props))
 
         if child_2_props:
             child_2 = child_2_props["type"]
-            child_2.set_from_props(child_2_props)
             self.add2(child_2)
+            children.append((child_2, child_2_props))
 
         self.set_orientation(props["orientation"])
         self.set_position(props["position"])
+        self.mark_dirty()
+        return children
@@ -0,0 +1,356 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tiles is a view that can hold any number of children side by side, along its orientation. The
+children can either be :mod:`.View` or :mod:`.Element`.
+
+Each child has a weight, and the space of tiles is shared by the children in proportion to their
+weights. Unlike a chain of :mod:`.Paned`, splitting a child of tiles with ``Aduct.add_to_tiles``
+adds a sibling, so the interface does not get deeper as it is split. The weights are changed by
+:meth:`Tiles.set_weights`, there are no handles to drag.
+"""
+
+from gi.repository import Gdk, GObject, Gtk
+
+from .. import Operations, Registry
+from .View import View
+
+
+class Tiles(View, Gtk.Box):
+
+    __gsignals__ = {"interface-changed": (2, None, ())}
+
+    type = GObject.Property(type=str, default="tiles", flags=GObject.ParamFlags.READABLE)
+
+    def __init__(self, **kwargs):
+
+        """
+        Makes a tiles based on given properties. Its default name is *aduct-tiles*
+
+        Arguments
+        ---------
+        **kwargs
+            The keyword arguments to be passed to :class:`Gtk.Box` from which :mod:`.Tiles` is
+            made.
+
+        Signals
+            interface-changed
+                Emitted when the interface of :obj:`self` or its children is changed.
+        """
+
+        Gtk.Box.__init__(self, **kwargs)
+        self.set_name("aduct-tiles")
+        Registry.add(self)
+        self.weights = {}
+        self.connect("notify::orientation", self.__handle_changed__)
+        self.connect("remove", self.__handle_remove__)
+
+    def __handle_remove__(self, tiles, child):
+
+        self.weights.pop(child, None)
+
+    def add_child(self, child, position=-1, weight=1.0):
+
+        """
+        Adds the child to tiles at given position.
+
+        Arguments
+        ---------
+        child : :mod:`.View` or :mod:`.Element`
+            The child to be added to :obj:`self`.
+        position : :class:`int`
+            The index at which :obj:`child` has to be inserted. When not provided, it takes up
+            value of -1, which adds :obj:`child` as the last tile.
+        weight : :class:`float`
+            The weight of :obj:`child`. Default is 1.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`weight` is not positive.
+        """
+
+        if weight <= 0:
+            raise ValueError(f"Weight of a tile has to be positive, but got {weight}")
+
+        self.pack_start(child, True, True, 0)
+        self.reorder_child(child, position)
+        self.weights[child] = weight
+        self.mark_dirty()
+        self.queue_resize()
+
+    def do_size_allocate(self, allocation):
+
+        self.set_allocation(allocation)
+        pairs = [
+            (child, self.weights.get(child, 1.0))
+            for child in self.get_children()
+            if child.get_visible()
+        ]
+        if not pairs:
+            return
+
+        horizontal = self.get_orientation() == Gtk.Orientation.HORIZONTAL
+        length = allocation.width if horizontal else allocation.height
+        spacing = self.get_spacing()
+        available = max(0, length - spacing * (len(pairs) - 1))
+        total = sum(weight for child, weight in pairs)
+
+        start = 0
+        used = 0
+        for idx, (child, weight) in enumerate(pairs):
+            used += weight
+            # The ends are rounded from the running sum, so that the sizes add up to available.
+            end = round(available * used / total)
+            rect = Gdk.Rectangle()
+            if horizontal:
+                rect.x = allocation.x + start + spacing * idx
+                rect.y = allocation.y
+                rect.width = end - start
+                rect.height = allocation.height
+            else:
+                rect.x = allocation.x
+                rect.y = allocation.y + start + spacing * idx
+                rect.width = allocation.width
+                rect.height = end - start
+            child.size_allocate(rect)
+            start = end
+
+    def get_child_index(self, child):
+
+        """
+        Gets the index of given child, in the order of tiles.
+
+        Arguments
+        ---------
+        child : :mod:`.View` or :mod:`.Element`
+            The child of :obj:`self`.
+
+        Returns
+        -------
+        :class:`int`
+            The index of :obj:`child`.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
+
+        children = self.get_children()
+        if child not in children:
+            raise ValueError("Child is not in Aduct.Tiles")
+        return children.index(child)
+
+    def get_child_slots(self):
+
+        """
+        Gets the slots of children, in the order of tiles.
+
+        Returns
+        -------
+        :class:`list`
+            A list of children of :obj:`self`.
+        """
+
+        return self.get_children()
+
+    def get_nth_child(self, index):
+
+        """
+        Gets the child at given index.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of child.
+
+        Returns
+        -------
+        :mod:`.View` or :mod:`.Element`
+            The child at :obj:`index`, :obj:`None` if there is no such child.
+        """
+
+        children = self.get_children()
+        if 0 <= index < len(children):
+            return children[index]
+        return None
+
+    def get_own_props(self):
+
+        """
+        Gets the interface properties of :obj:`self` alone, where the list of children is left
+        empty.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with interface properties.
+        """
+
+        return {
+            "type": "tiles",
+            "id": self.id,
+            "children": [],
+            "orientation": self.get_orientation(),
+            "weights": self.get_weights(),
+        }
+
+    def get_weights(self):
+
+        """
+        Gets the weights of children.
+
+        Returns
+        -------
+        :class:`list`
+            The weights of children, in the order of tiles.
+        """
+
+        return [self.weights.get(child, 1.0) for child in self.get_children()]
+
+    def join_props(self, props, children_props):
+
+        """
+        Adds the properties of children to the properties of :obj:`self`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The properties given by :meth:`get_own_props`.
+        children_props : :class:`list`
+            The properties of children, in the order of tiles.
+        """
+
+        props["children"].extend(children_props)
+
+    def remove_child(self, child):
+
+        """
+        Removes the given child from :obj:`self`.
+
+        Arguments
+        ---------
+        child : :mod:`.View` or :mod:`.Element`
+            The child which has to be removed from :obj:`self`.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
+
+        if child in self.get_children():
+            self.remove(child)
+            self.weights.pop(child, None)
+            self.mark_dirty()
+            self.queue_resize()
+        else:
+            raise ValueError("Child is not in Aduct.Tiles")
+
+    def replace_child(self, old_child, new_child):
+
+        """
+        Replaces the existing child with a new child, which takes the place and weight of
+        :obj:`old_child`.
+
+        Arguments
+        ---------
+        old_child : :mod:`.View` or :mod:`.Element`
+            The child present in :obj:`self` which has to be replaced.
+        new_child : :mod:`.View` or :mod:`.Element`
+            The child that will replace the given existing child of :obj:`self`.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`old_child` is not in :obj:`self`.
+        """
+
+        position = self.get_child_index(old_child)
+        weight = self.weights.get(old_child, 1.0)
+        self.remove_child(old_child)
+        self.add_child(new_child, position, weight)
+
+    def set_own_props(self, props):
+
+        """
+        Sets the properties of :obj:`self` alone from given properties. Properties of both
+        versions of interface (see :mod:`.Schema`) are accepted.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The dictionary containig properties of interface.
+
+        Returns
+        -------
+        :class:`list`
+            A list of ``(child, child_props)`` of the added children, whose properties have to be
+            set.
+        """
+
+        if "id" in props:
+            self.set_id(props["id"], replace=True)
+        self.set_orientation(props["orientation"])
+
+        if "children" in props:
+            children_props = props["children"]
+        else:
+            children_props = [props[f"child_{idx + 1}"] for idx in range(props["n_children"])]
+        weights = props.get("weights") or [1.0] * len(children_props)
+
+        added = []
+        for child_props, weight in zip(children_props, weights):
+            if not child_props:
+                continue
+            child = child_props["type"]
+            self.add_child(child, -1, weight)
+            added.append((child, child_props))
+        return added
+
+    def set_weights(self, weights):
+
+        """
+        Sets the weights of children. ``Operations.notify`` is called with ``set_weights`` after
+        they are set.
+
+        Arguments
+        ---------
+        weights : :class:`list`
+            The weights of children, in the order of tiles.
+
+        Raises
+        ------
+        ValueError
+            Raised when the number of weights is not the number of children, or a weight is not
+            positive.
+        """
+
+        children = self.get_children()
+        if len(weights) != len(children):
+            raise ValueError(
+                f"Expected {len(children)} weights for Aduct.Tiles, but got {len(weights)}"
+            )
+        if any(weight <= 0 for weight in weights):
+            raise ValueError(f"Weights of tiles have to be positive, but got {weights}")
+
+        self.weights = dict(zip(children, weights))
+        self.mark_dirty()
+        self.queue_resize()
+        Operations.notify("set_weights", self, weights=list(weights))
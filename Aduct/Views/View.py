@@ -18,10 +18,24 @@
 """
 View can hold children of type :mod:`.Element`. In some case, there is a
 restriction on number of children it can hold.
+
+A view can cache its interface properties, which are reused by ``get_props(use_cache=True)``
+till the view is marked dirty by :meth:`View.mark_dirty`. Marking a view dirty also marks all its
+ancestors dirty, so only the changed paths of interface are computed again. Each of them then emits
+``interface-changed``, so that listeners like ``Aduct.Autosave`` learn of changes made anywhere
+below them.
 """
 
+from gi.repository import GObject
+
+from .. import Batch, Registry, Walk
+
 
 class View:
+
+    id = None
+    props_cache = None
+
     def __init__(self, **kwargs):
 
         """
@@ -32,6 +46,10 @@ class View:
 
         pass
 
+    def __handle_changed__(self, *args):
+
+        self.mark_dirty()
+
     def add_child(self, child):
 
         """
@@ -58,10 +76,80 @@ class View:
 
         pass
 
-    def get_props(self):
+    def get_child_index(self, child):
 
         """
-        Gets the interface properties.
+        Gets the index of given child, as in the list of children of interface properties.
+
+        Arguments
+        ---------
+        child : :mod:`.View` or :mod:`.Element`
+            The child of :obj:`self`.
+
+        Returns
+        -------
+        :class:`int`
+            The index of :obj:`child`.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
+
+        pass
+
+    def get_child_slots(self):
+
+        """
+        Gets the slots of children, in the order of :meth:`get_nth_child`. An empty slot is
+        :obj:`None`.
+
+        Returns
+        -------
+        :class:`list`
+            A list of children of :obj:`self`, as in the interface properties.
+        """
+
+        pass
+
+    def get_id(self):
+
+        """
+        Gets the id of :obj:`self`, which is unique among the live views and elements. See
+        :mod:`.Registry`.
+
+        Returns
+        -------
+        :class:`str`
+            The id of :obj:`self`.
+        """
+
+        return self.id
+
+    def get_nth_child(self, index):
+
+        """
+        Gets the child at given index, as in the list of children of interface properties.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of child.
+
+        Returns
+        -------
+        :mod:`.View` or :mod:`.Element`
+            The child at :obj:`index`, :obj:`None` if there is no child.
+        """
+
+        pass
+
+    def get_own_props(self):
+
+        """
+        Gets the interface properties of :obj:`self` alone, without those of its children. They
+        are added by :meth:`join_props`.
 
         Returns
         -------
@@ -71,6 +159,26 @@ class View:
 
         pass
 
+    def get_props(self, use_cache=False):
+
+        """
+        Gets the interface properties.
+
+        Arguments
+        ---------
+        use_cache : :class:`bool`
+            States whether to reuse the properties cached when :obj:`self` and its children were
+            not changed. The returned dictionary is then shared and must not be modified. Default
+            is :obj:`False`.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with interface properties.
+        """
+
+        return Walk.get_props(self, use_cache)
+
     def get_type(self):
 
         """
@@ -84,6 +192,45 @@ class View:
 
         return self.get_property("type")
 
+    def join_props(self, props, children_props):
+
+        """
+        Adds the properties of children to the properties of :obj:`self`.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The properties given by :meth:`get_own_props`.
+        children_props : :class:`list`
+            The properties of children, in the order of :meth:`get_child_slots`. Those of an empty
+            slot are an empty dictionary.
+        """
+
+        pass
+
+    def mark_dirty(self):
+
+        """
+        Drops the cached properties of :obj:`self` and its ancestors, which then emit
+        ``interface-changed``. Inside ``Aduct.batch``, each of them emits it once when the batch is
+        closed.
+        """
+
+        widget = self
+        while isinstance(widget, View):
+            if Batch.depth:
+                # The ancestors of a widget already collected in this batch are collected too.
+                if widget.props_cache is None and widget in Batch.changed:
+                    break
+                widget.props_cache = None
+                Batch.changed[widget] = None
+            else:
+                widget.props_cache = None
+                # A view of the application may not have the signal.
+                if GObject.signal_lookup("interface-changed", type(widget)):
+                    widget.emit("interface-changed")
+            widget = widget.get_parent()
+
     def remove_child(self, child):
 
         """
@@ -128,4 +275,54 @@ class View:
             The dictionary containig properties of interface.
         """
 
+        Walk.set_props(self, props)
+
+    def set_id(self, widget_id, replace=False):
+
+        """
+        Sets the id of :obj:`self`. The id is kept in the interface properties of :obj:`self`.
+
+        Arguments
+        ---------
+        widget_id : :class:`str`
+            The new id of :obj:`self`.
+        replace : :class:`bool`
+            States whether to take :obj:`widget_id` from another live view or element that has it,
+            which is then given a new id. It is used when an interface is set from properties,
+            while the interface they were taken from is still alive. Default is :obj:`False`.
+
+        Raises
+        ------
+        ValueError
+            Raised when another live view or element has :obj:`widget_id` and :obj:`replace` is
+            :obj:`False`.
+        """
+
+        if widget_id == self.id:
+            return
+        other = Registry.set_id(self, widget_id, replace)
+        if other is not None:
+            other.mark_dirty()
+        self.mark_dirty()
+
+    def set_own_props(self, props):
+
+        """
+        Sets the properties of :obj:`self` alone from given properties.
+
+        The children given in :obj:`props` are added to :obj:`self`, but their properties are not
+        set.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The dictionary containig properties of interface.
+
+        Returns
+        -------
+        :class:`list`
+            A list of ``(child, child_props)`` of the added children, whose properties have to be
+            set.
+        """
+
         pass
@@ -0,0 +1,676 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+VirtualNotebook is a :mod:`.Notebook` that can hold thousands of pages. Only the current page and
+``window-size`` pages on either side of it are real pages, with a tab and a built child. The other
+pages are records of the child properties, the provider and the label of their elements, which
+are kept empty and out of the notebook. When the current page changes, the pages that come into the
+window are built from their records and those that leave it are turned back into records.
+
+The pages are counted and numbered as a whole, so :meth:`VirtualNotebook.get_n_pages`,
+:meth:`VirtualNotebook.get_nth_page`, :meth:`VirtualNotebook.page_num` and
+:meth:`VirtualNotebook.set_current_page` take the index of page among all pages, not only the real
+ones. Its interface properties are those of a notebook, so an interface saved with a virtual
+notebook can be set with a notebook and the other way round. Choose it through ``creator_maps``,
+
+.. code:: python
+
+   creator_maps = {"type": {"notebook": (Aduct.VirtualNotebook, (), {}), ...}}
+
+As only a few tabs are shown, the pages are found through a searchable list, shown by
+:meth:`VirtualNotebook.show_page_list`,
+
+.. code:: python
+
+   button = Gtk.Button(label="Pages")
+   button.connect("clicked", notebook.show_page_list)
+   notebook.set_action_button(button, Gtk.PackType.END)
+"""
+
+from gi.repository import GLib, GObject, Gtk
+
+from .. import Batch, Walk
+from .Notebook import Notebook
+
+
+class VirtualNotebook(Notebook):
+
+    window_size = GObject.Property(type=int, default=2)
+    max_results = GObject.Property(type=int, default=50)
+
+    def __init__(self, **kwargs):
+
+        """
+        Makes a virtual notebook based on given properties. Its CSS name is *aduct-notebook*.
+
+        Arguments
+        ---------
+        **kwargs
+            The values to be passed to :mod:`.Notebook`. ``window-size`` is the number of real
+            pages kept on either side of the current page, default is 2. ``max-results`` is the
+            number of pages listed by the searchable list, default is 50.
+
+        Attributes
+        ----------
+        pages : :class:`list`
+            The records of pages, in the order of pages. Each is a dictionary with keys
+            ``element``, ``props`` and ``label``. ``props`` is the dictionary with keys
+            ``provider`` and ``child`` of a page that is not real, :obj:`None` otherwise.
+        page_list : :class:`Gtk.ListBox`
+            The list of pages matching the text of :obj:`page_search`. Its name is
+            *aduct-notebook-page_list*.
+        page_search : :class:`Gtk.SearchEntry`
+            The entry to search the pages by their label. Its name is
+            *aduct-notebook-page_search*.
+        """
+
+        Notebook.__init__(self, **kwargs)
+        self.pages = []
+        self.busy = False
+        self.source = None
+
+        self.page_search = Gtk.SearchEntry(name="aduct-notebook-page_search")
+        self.page_list = Gtk.ListBox(name="aduct-notebook-page_list")
+        scrolled_window = Gtk.ScrolledWindow(min_content_height=300, propagate_natural_height=True)
+        scrolled_window.add(self.page_list)
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        box.pack_start(self.page_search, False, False, 0)
+        box.pack_start(scrolled_window, True, True, 0)
+        self.page_popover = Gtk.Popover()
+        self.page_popover.add(box)
+
+        self.page_search.connect("search-changed", self.__handle_search__)
+        self.page_list.connect("row-activated", self.__handle_row__)
+        self.connect("switch-page", self.__handle_switch__)
+        self.connect("destroy", self.__handle_destroy__)
+
+    def __get_real_position__(self, index):
+
+        # Gets the position of page among the real pages.
+        return sum(1 for record in self.pages[:index] if record["props"] is None)
+
+    def __handle_changed__(self, *args):
+
+        # Pages made real or not do not change the interface.
+        if not self.busy:
+            self.mark_dirty()
+
+    def __handle_destroy__(self, notebook):
+
+        if self.source is not None:
+            GLib.source_remove(self.source)
+            self.source = None
+        for record in self.pages:
+            if record["props"] is not None:
+                record["element"].destroy()
+        self.pages = []
+        self.page_popover.destroy()
+
+    def __handle_idle__(self):
+
+        self.source = None
+        self.update_window()
+        return False
+
+    def __handle_row__(self, page_list, row):
+
+        self.page_popover.popdown()
+        self.set_current_page(row.page_index)
+
+    def __handle_search__(self, entry):
+
+        self.update_page_list()
+
+    def __handle_switch__(self, notebook, page, page_num):
+
+        # The pages are changed once the switch is over.
+        if not self.busy:
+            self.__queue_update__()
+
+    def __queue_update__(self):
+
+        if self.source is None:
+            self.source = GLib.idle_add(self.__handle_idle__)
+
+    def add_child(self, child, position=-1):
+
+        """
+        Adds the child to :obj:`self` as a real page, see ``Notebook.add_child``.
+
+        Arguments
+        ---------
+        child : :mod:`.Element`
+            The child to be added to :obj:`self`.
+        position : :class:`int`
+            The index among all pages at which :obj:`child` has to be inserted. When not
+            provided, it takes up value of -1, which inserts the element as last page.
+
+        Raises
+        ------
+        TypeError
+            Raised when :obj:`child` is not a :mod:`.Element`.
+        """
+
+        if position < 0 or position > len(self.pages):
+            position = len(self.pages)
+        real_position = self.__get_real_position__(position)
+        Notebook.add_child(self, child, real_position)
+        self.pages.insert(position, {"element": child, "props": None, "label": None})
+        self.__queue_update__()
+
+    def add_pages_from_props(self, elements_props):
+
+        """
+        Appends the elements of given properties as pages. Only the pages in the window of first
+        page are real, the others are kept as records and their elements are left empty.
+
+        Arguments
+        ---------
+        elements_props : :class:`list`
+            The properties of elements, in the order of pages.
+
+        Returns
+        -------
+        :class:`list`
+            A list of ``(element, element_props)`` of the real pages, whose properties have to be
+            set.
+        """
+
+        window_size = self.get_property("window-size")
+        elements = []
+        for element_props in elements_props:
+            element = element_props["type"]
+            if len(self.pages) <= window_size:
+                elements.extend(Notebook.add_pages_from_props(self, [element_props]))
+                self.pages.append({"element": element, "props": None, "label": None})
+                continue
+            if "id" in element_props:
+                element.set_id(element_props["id"], replace=True)
+            child_props = element_props["child"]
+            props = {"provider": element_props["provider"], "child": child_props}
+            label = child_props.get("child_name") if props["provider"] else None
+            self.pages.append({"element": element, "props": props, "label": label})
+        return elements
+
+    def change_child_label(self, child):
+
+        """
+        Changes the tab label for existing child, see ``Notebook.change_child_label``. Nothing is
+        done if :obj:`child` is not a real page.
+
+        Arguments
+        ---------
+        child : :mod:`.Element`
+            The child whose tab label has to be changed.
+        """
+
+        if child.get_parent() is self:
+            Notebook.change_child_label(self, child)
+
+    def find_pages(self, text):
+
+        """
+        Finds the pages whose label has the given text, ignoring the case.
+
+        Arguments
+        ---------
+        text : :class:`str`
+            The text to be searched.
+
+        Returns
+        -------
+        :class:`list`
+            The indices of pages found, at most ``max-results`` of them.
+        """
+
+        text = text.casefold()
+        max_results = self.get_property("max-results")
+        indices = []
+        for index in range(len(self.pages)):
+            if len(indices) >= max_results:
+                break
+            if text in self.get_page_label(index).casefold():
+                indices.append(index)
+        return indices
+
+    def get_child_slots(self):
+
+        """
+        Gets the slots of pages, in the order of pages, like :meth:`get_nth_child`. The slot of a
+        page that is not real is :obj:`None` and its properties are added by :meth:`join_props`.
+
+        Returns
+        -------
+        :class:`list`
+            A list of elements of real pages of :obj:`self`, :obj:`None` for the other pages.
+        """
+
+        return [record["element"] if record["props"] is None else None for record in self.pages]
+
+    def get_current_page(self):
+
+        """
+        Gets the index of current page among all pages.
+
+        Returns
+        -------
+        :class:`int`
+            The index of current page, -1 if there is no page.
+        """
+
+        real_index = Gtk.Notebook.get_current_page(self)
+        if real_index < 0:
+            return -1
+        return self.page_num(Gtk.Notebook.get_nth_page(self, real_index))
+
+    def get_n_pages(self):
+
+        """
+        Gets the number of pages, including those that are not real.
+
+        Returns
+        -------
+        :class:`int`
+            The number of pages.
+        """
+
+        return len(self.pages)
+
+    def get_nth_child(self, index):
+
+        """
+        Gets the element at given index, same as :meth:`get_nth_page`. The page is not made real,
+        so the element is empty if the page is not real, see :meth:`realize_page`. Its properties
+        are given by :meth:`get_record_props`, which ``Aduct.get_interface`` uses for such a path.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page.
+
+        Returns
+        -------
+        :mod:`.Element`
+            The element at :obj:`index`, :obj:`None` if there is no such page.
+        """
+
+        return self.get_nth_page(index)
+
+    def get_nth_page(self, index):
+
+        """
+        Gets the element at given index, which is empty if the page is not real.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page.
+
+        Returns
+        -------
+        :mod:`.Element`
+            The element at :obj:`index`, :obj:`None` if there is no such page.
+        """
+
+        if not 0 <= index < len(self.pages):
+            return None
+        return self.pages[index]["element"]
+
+    def get_page_label(self, index):
+
+        """
+        Gets the label of page at given index, which is the name of child of its element.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page.
+
+        Returns
+        -------
+        :class:`str`
+            The label of page, *No child* when its element has no child.
+        """
+
+        record = self.pages[index]
+        if record["props"] is None:
+            label = record["element"].child_name
+        else:
+            label = record["label"]
+        return label or "No child"
+
+    def get_record_props(self, index):
+
+        """
+        Gets the interface properties of element at given index from its record, without making
+        the page real.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page, which is not real.
+
+        Returns
+        -------
+        :class:`dict`
+            A dictionary with interface properties of element.
+        """
+
+        record = self.pages[index]
+        provider = record["props"]["provider"]
+        return {
+            "type": "element",
+            "id": record["element"].id,
+            "provider": provider.get_name() if provider else None,
+            "child": Walk.copy_props(record["props"]["child"]) if provider else {},
+        }
+
+    def is_page_real(self, index):
+
+        """
+        Checks whether the page at given index is real.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if the page has a tab and its element is in :obj:`self`, else
+            :obj:`False`.
+        """
+
+        return self.pages[index]["props"] is None
+
+    def join_props(self, props, children_props):
+
+        """
+        Adds the properties of elements to the properties of :obj:`self`. The properties of pages
+        that are not real are made from their records.
+
+        Arguments
+        ---------
+        props : :class:`dict`
+            The properties given by :meth:`get_own_props`.
+        children_props : :class:`list`
+            The properties of elements, in the order of :meth:`get_child_slots`.
+        """
+
+        for index, child_props in enumerate(children_props):
+            if self.pages[index]["props"] is not None:
+                child_props = self.get_record_props(index)
+            props["elements"].append(child_props)
+
+    def page_num(self, child):
+
+        """
+        Gets the index of given element among all pages.
+
+        Arguments
+        ---------
+        child : :mod:`.Element`
+            The element of page.
+
+        Returns
+        -------
+        :class:`int`
+            The index of page, -1 if :obj:`child` is not in :obj:`self`.
+        """
+
+        for index, record in enumerate(self.pages):
+            if record["element"] is child:
+                return index
+        return -1
+
+    def realize_page(self, index):
+
+        """
+        Makes the page at given index real. Its element is added to :obj:`self` with a tab and its
+        child is built from the record. Nothing is done if the page is already real.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page.
+        """
+
+        record = self.pages[index]
+        props = record["props"]
+        if props is None:
+            return
+
+        element = record["element"]
+        # The child is built before the element is added, so the interface is not marked as
+        # changed.
+        if props["provider"]:
+            element.set_from_props(props)
+        real_position = self.__get_real_position__(index)
+        record["props"] = None
+        record["label"] = None
+        self.busy = True
+        try:
+            self.insert_page(element, self.get_tab(element), real_position)
+        finally:
+            self.busy = False
+        Batch.show_all(element)
+
+    def reorder_child(self, child, position):
+
+        """
+        Moves the given element to the given index among all pages, whether its page is real or
+        not.
+
+        Arguments
+        ---------
+        child : :mod:`.Element`
+            The element of page.
+        position : :class:`int`
+            The index at which the page has to be moved. When it is negative, the page is moved
+            to the end.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
+
+        index = self.page_num(child)
+        if index < 0:
+            raise ValueError("Child not in Aduct.Notebook")
+        record = self.pages.pop(index)
+        if position < 0 or position > len(self.pages):
+            position = len(self.pages)
+        self.pages.insert(position, record)
+        if record["props"] is None:
+            Gtk.Notebook.reorder_child(self, child, self.__get_real_position__(position))
+        else:
+            self.mark_dirty()
+        self.__queue_update__()
+
+    def remove_child(self, child):
+
+        """
+        Removes the given element from :obj:`self`, whether its page is real or not.
+
+        Arguments
+        ---------
+        child : :mod:`.Element`
+            The child which has to be removed from :obj:`self`.
+
+        Raises
+        ------
+        ValueError
+            Raised when :obj:`child` is not present in :obj:`self`.
+        """
+
+        index = self.page_num(child)
+        if index < 0:
+            raise ValueError("Child not in Aduct.Notebook")
+        if self.pages[index]["props"] is None:
+            # The tab is found among the real pages, as page_num counts all pages.
+            self.remove_page(Gtk.Notebook.page_num(self, child))
+            child.disconnect_by_func(self.change_child_label)
+        else:
+            self.mark_dirty()
+        self.pages.pop(index)
+        self.__queue_update__()
+
+    def set_current_page(self, index):
+
+        """
+        Switches to the page at given index, which is made real first.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page. When it is negative, the last page is switched to.
+        """
+
+        if not self.pages:
+            return
+        if index < 0 or index >= len(self.pages):
+            index = len(self.pages) - 1
+        self.realize_page(index)
+        element = self.pages[index]["element"]
+        Gtk.Notebook.set_current_page(self, Gtk.Notebook.page_num(self, element))
+
+    def set_page_props(self, index, props):
+
+        """
+        Sets the properties of element at given index. The child of a page that is not real is
+        not built, only its record is changed.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page.
+        props : :class:`dict`
+            The properties of element, whose ``provider`` is already substituted with an object.
+
+        Returns
+        -------
+        :class:`bool`
+            :obj:`True` if the properties are changed, else :obj:`False`.
+        """
+
+        record = self.pages[index]
+        element = record["element"]
+        if "id" in props:
+            element.set_id(props["id"], replace=True)
+        if record["props"] is None:
+            element.set_from_props(props)
+            return True
+
+        provider = props["provider"]
+        page_props = {"provider": provider, "child": props["child"] if provider else {}}
+        if page_props == record["props"]:
+            return False
+        record["props"] = page_props
+        record["label"] = page_props["child"].get("child_name") if provider else None
+        self.mark_dirty()
+        return True
+
+    def show_page_list(self, relative_to):
+
+        """
+        Shows the searchable list of pages in a popover.
+
+        Arguments
+        ---------
+        relative_to : :class:`Gtk.Widget`
+            The widget at which the popover points, like an action button.
+        """
+
+        self.page_popover.set_relative_to(relative_to)
+        self.update_page_list()
+        self.page_popover.show_all()
+        self.page_popover.popup()
+
+    def unrealize_page(self, index):
+
+        """
+        Turns the real page at given index into a record. The state of child is saved through
+        ``Provider.get_child_props``, the child is cleared and the element is taken out of
+        :obj:`self`. Nothing is done if the page is not real or is the current page.
+
+        Arguments
+        ---------
+        index : :class:`int`
+            The index of page.
+        """
+
+        record = self.pages[index]
+        element = record["element"]
+        if record["props"] is not None or index == self.get_current_page():
+            return
+
+        if element.child_name:
+            props = element.get_own_props()
+            props = {"provider": element.provider, "child": props["child"]}
+            label = element.child_name
+        else:
+            props = {"provider": None, "child": {}}
+            label = None
+
+        self.busy = True
+        try:
+            self.remove_page(Gtk.Notebook.page_num(self, element))
+        finally:
+            self.busy = False
+        element.disconnect_by_func(self.change_child_label)
+        if element.child_name:
+            element.clear_child()
+        record["props"] = props
+        record["label"] = label
+
+    def update_page_list(self):
+
+        """
+        Fills the list of pages with the pages whose label has the text of search entry.
+        """
+
+        for row in self.page_list.get_children():
+            self.page_list.remove(row)
+            row.destroy()
+        for index in self.find_pages(self.page_search.get_text()):
+            row = Gtk.ListBoxRow()
+            row.page_index = index
+            row.add(Gtk.Label(label=self.get_page_label(index), xalign=0))
+            self.page_list.insert(row, -1)
+        self.page_list.show_all()
+
+    def update_window(self):
+
+        """
+        Makes the pages in the window of current page real and the other pages records. It is
+        called when the main loop is idle after the current page changes.
+        """
+
+        current = self.get_current_page()
+        if current < 0:
+            return
+        window_size = self.get_property("window-size")
+        start = max(0, current - window_size)
+        end = min(len(self.pages), current + window_size + 1)
+        for index, record in enumerate(self.pages):
+            if record["props"] is None and not start <= index < end:
+                self.unrealize_page(index)
+        for index in range(start, end):
+            self.realize_page(index)
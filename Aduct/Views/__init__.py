@@ -19,3 +19,5 @@ from .View import View
 from .Bin import Bin
 from .Notebook import Notebook
 from .Paned import Paned
+from .Tiles import Tiles
+from .VirtualNotebook import VirtualNotebook
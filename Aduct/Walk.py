@@ -0,0 +1,206 @@
+# Package : Aduct
+# Author : J Arun Mani
+# Copyright (C) 2020  J Arun Mani; Atornel
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Walk goes through the views and elements of an interface without recursion, so that interfaces
+nested deeper than the recursion limit of Python, like a paned split a thousand times, can be read
+and set. The interface properties of such interfaces are copied without recursion too.
+
+Each widget is given along with its depth below the root and its path, the indices of children
+(see ``View.get_nth_child``) that lead to it from the root. The path can be given to
+``Aduct.get_widget_at_path``.
+
+A view whose ``View.get_child_slots`` gives :obj:`None`, like a custom view made before the slots,
+is not gone through. Its properties are taken by its ``get_props`` and set by its
+``set_from_props``, which then have to be overridden.
+
+.. code:: python
+
+   for widget, depth, path in Aduct.walk(top_level):
+       print("  " * depth, widget.get_type(), path)
+"""
+
+from . import Batch
+
+
+def copy_props(props):
+
+    """
+    Copies the given interface properties, like :func:`copy.deepcopy`. Only the dictionaries and
+    lists are copied, other values are shared with :obj:`props`.
+
+    Arguments
+    ---------
+    props : :class:`dict`
+        The dictionary containig properties of interface.
+
+    Returns
+    -------
+    :class:`dict`
+        A copy of :obj:`props`.
+    """
+
+    new_props = {}
+    stack = [(props, new_props)]
+    while stack:
+        value, new_value = stack.pop()
+        if isinstance(value, (dict,)):
+            items = value.items()
+        else:
+            items = enumerate(value)
+            new_value.extend([None] * len(value))
+        for key, item in items:
+            if isinstance(item, (dict,)):
+                new_item = {}
+                stack.append((item, new_item))
+            elif isinstance(item, (list,)):
+                new_item = []
+                stack.append((item, new_item))
+            else:
+                new_item = item
+            new_value[key] = new_item
+    return new_props
+
+
+def get_props(root, use_cache=False):
+
+    """
+    Gets the interface properties of the given view or element and its children.
+
+    Arguments
+    ---------
+    root : :mod:`.View` or :mod:`.Element`
+        The widget whose properties are needed.
+    use_cache : :class:`bool`
+        States whether to reuse the cached properties, see ``View.get_props``. Default is
+        :obj:`False`.
+
+    Returns
+    -------
+    :class:`dict`
+        A dictionary with interface properties.
+    """
+
+    def descend(widget):
+        return not use_cache or widget.props_cache is None
+
+    # The properties of children are made before those of their parent, which takes them out.
+    done = {}
+    for widget, depth, path in walk(root, "post", descend, paths=False):
+        if use_cache and widget.props_cache is not None:
+            done[widget] = widget.props_cache
+            continue
+
+        slots = widget.get_child_slots()
+        if slots is None:
+            done[widget] = widget.get_props(use_cache)
+            continue
+        props = widget.get_own_props()
+        if slots:
+            children_props = [{} if child is None else done.pop(child) for child in slots]
+            widget.join_props(props, children_props)
+        if use_cache:
+            widget.props_cache = props
+        done[widget] = props
+
+    return done[root]
+
+
+def set_props(root, props):
+
+    """
+    Sets the interface of the given view or element and its children from given properties.
+
+    Arguments
+    ---------
+    root : :mod:`.View` or :mod:`.Element`
+        The widget whose interface has to be set.
+    props : :class:`dict`
+        The dictionary containig properties of interface.
+    """
+
+    # In a batch, the ancestors are marked dirty once and not for each child added below them.
+    Batch.begin(root)
+    try:
+        stack = [(root, props)]
+        while stack:
+            widget, widget_props = stack.pop()
+            if widget.get_child_slots() is None:
+                widget.set_from_props(widget_props)
+                continue
+            # Reversed, so that the children are set in their order.
+            stack.extend(reversed(widget.set_own_props(widget_props)))
+    finally:
+        Batch.end()
+
+
+def walk(root, order="pre", descend=None, paths=True):
+
+    """
+    Goes through the given view or element and the views and elements below it.
+
+    Arguments
+    ---------
+    root : :mod:`.View` or :mod:`.Element`
+        The widget from which to start.
+    order : :class:`str`
+        ``pre`` to give a widget before its children, ``post`` to give it after them. Default is
+        ``pre``.
+    descend : :class:`callable`
+        A function called as ``descend(widget)`` that returns whether to go through the children
+        of widget. By default, all the children are gone through.
+    paths : :class:`bool`
+        States whether to give the paths of widgets. Making them costs more as the interface gets
+        deeper, so it can be avoided when they are not needed. Default is :obj:`True`.
+
+    Yields
+    ------
+    :class:`tuple`
+        ``(widget, depth, path)``, where :obj:`depth` is 0 for :obj:`root` and :obj:`path` is a
+        :class:`tuple` of indices of children that lead from :obj:`root` to :obj:`widget`, or
+        :obj:`None` when :obj:`paths` is :obj:`False`.
+
+    Raises
+    ------
+    ValueError
+        Raised when :obj:`order` is neither ``pre`` nor ``post``.
+    """
+
+    if order not in ("pre", "post"):
+        raise ValueError(f"Invalid order {order}")
+
+    post = order == "post"
+    stack = [(root, 0, () if paths else None, False)]
+    while stack:
+        widget, depth, path, visited = stack.pop()
+        if visited:
+            yield widget, depth, path
+            continue
+
+        if not post:
+            yield widget, depth, path
+        else:
+            stack.append((widget, depth, path, True))
+
+        if descend is not None and not descend(widget):
+            continue
+        slots = widget.get_child_slots() or ()
+        for index in range(len(slots) - 1, -1, -1):
+            child = slots[index]
+            if child is not None:
+                child_path = path + (index,) if paths else None
+                stack.append((child, depth + 1, child_path, False))
@@ -15,14 +15,36 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import inspect
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
-from .Element import Element
+from . import Batch, Codec, Operations, Schema, Walk
+from .Budget import Budget
+from .Element import Element, _clear_child_dict
+from .Plan import Plan, get_key as get_plan_key
+from .Plan import add_to_cache as cache_plan, get_cached as get_cached_plan
 from .Provider import Provider
-from .Views import Bin, Paned, Notebook, View
+from .Registry import find_elements, find_views, get_by_id
+from .Views import Bin, Paned, Notebook, Tiles, View, VirtualNotebook
+from .Walk import walk
+from .Normalize import normalize
+
+
+# The umask can only be read by setting it, which is not safe once the saving threads run.
+_umask = os.umask(0o022)
+os.umask(_umask)
 
 
 def add_to_notebook(element, notebook, position=-1):
@@ -57,11 +79,12 @@ def add_to_notebook(element, notebook, position=-1):
     if type_ != "element":
         raise TypeError(Notebook.INVALID_CHILD)
 
+    Operations.notify("add_to_notebook", element, notebook=notebook, position=position)
     parent = element.get_parent()
     if parent:
         parent.replace_child(element, notebook)
         notebook.add_child(element, position)
-        parent.show_all()
+        Batch.show_all(parent)
     else:
         notebook.add_child(element, position)
 
@@ -90,6 +113,7 @@ def add_to_paned(child1, child2, paned, position):
         An integer value that is either 1 or 2. The complement of 1 is 2 and vice-versa.
     """
 
+    Operations.notify("add_to_paned", child1, child2=child2, paned=paned, position=position)
     parent = child1.get_parent()
     if parent:
         parent.replace_child(child1, paned)
@@ -100,7 +124,68 @@ def add_to_paned(child1, child2, paned, position):
         paned.add1(child2)
         paned.add2(child1)
 
-    parent.show_all()
+    Batch.show_all(parent)
+
+
+def add_to_tiles(child1, child2, tiles, position):
+
+    """
+    Adds the child beside the other child in tiles.
+
+    When the parent of :obj:`child1` is a :mod:`.Tiles` of the same orientation as :obj:`tiles`,
+    :obj:`child2` is inserted in it beside :obj:`child1` and :obj:`tiles` is not used. Else,
+    :obj:`child1` is replaced by :obj:`tiles` in its parent, if any, and both the children are added
+    to :obj:`tiles`. So splitting a child again and again adds siblings instead of nesting views.
+    The space of :obj:`child1` is shared equally by both the children.
+
+    Arguments
+    ---------
+    child1 : :class:`Gtk.Widget`
+        The main child beside which :obj:`child2` has to be added.
+    child2 : :class:`Gtk.Widget`
+        The other child which has to be added. It has to be an orphan.
+    tiles : :mod:`.Tiles`
+        The tiles to which the children has to be added, when :obj:`child1` is not already in
+        one.
+    position : :class:`int`
+        An integer value that is either 1 or 2. :obj:`child1` comes before :obj:`child2` when it is
+        1 and after when it is 2.
+
+    Returns
+    -------
+    :mod:`.Tiles`
+        The tiles that holds both the children.
+
+    Raises
+    ------
+    ValueError
+        Raised when :obj:`position` is neither 1 nor 2.
+    """
+
+    if position not in (1, 2):
+        raise ValueError(f"Expected position 1 or 2, but got {position}")
+
+    Operations.notify("add_to_tiles", child1, child2=child2, tiles=tiles, position=position)
+    parent = child1.get_parent()
+    if isinstance(parent, Tiles) and parent.get_orientation() == tiles.get_orientation():
+        index = parent.get_child_index(child1)
+        weights = parent.get_weights()
+        weights[index : index + 1] = [weights[index] / 2] * 2
+        parent.add_child(child2, index + 1 if position == 1 else index)
+        parent.set_weights(weights)
+        Batch.show_all(parent)
+        return parent
+
+    if parent:
+        parent.replace_child(child1, tiles)
+    if position == 1:
+        tiles.add_child(child1)
+        tiles.add_child(child2)
+    else:
+        tiles.add_child(child2)
+        tiles.add_child(child1)
+    Batch.show_all(parent or tiles)
+    return tiles
 
 
 def add_to_view(child, view):
@@ -132,7 +217,37 @@ def add_to_view(child, view):
     """
 
     view.add_child(child)
-    view.show_all()
+    Batch.show_all(view)
+
+
+@contextmanager
+def batch(top_level):
+
+    """
+    Makes a context in which the changes made to interface under the given top level are batched.
+
+    Inside the context, the widgets are not shown and the top level is not drawn or resized. The
+    views emit ``interface-changed`` and the notebooks change their tab labels only when the
+    context is left. Then the widgets are shown in a single pass and the top level is resized once.
+    So rearranging many elements costs one layout, instead of one for every change.
+
+    .. code:: python
+
+       with Aduct.batch(top_level):
+           for element in elements:
+               Aduct.add_to_notebook(element, notebook)
+
+    Arguments
+    ---------
+    top_level : :mod:`.View`
+        A view which acts as the root widget.
+    """
+
+    Batch.begin(top_level)
+    try:
+        yield top_level
+    finally:
+        Batch.end()
 
 
 def change_child_at_element(element, provider, child_name):
@@ -140,7 +255,9 @@ def change_child_at_element(element, provider, child_name):
     """
     Changes the child at given element with a child of given name provided by provider.
 
-    The previous child at :obj:`element` is cleared, after which the new child is added.
+    The previous child at :obj:`element` is cleared, after which the new child is added. The new
+    child is taken from the pool of :obj:`provider` when it has one parked, else it is made by
+    :obj:`provider`.
 
     Arguments
     ---------
@@ -152,50 +269,406 @@ def change_child_at_element(element, provider, child_name):
         The name of child to be added to :obj:`element`.
     """
 
-    child_dict = provider.get_a_child(child_name)
+    Operations.notify("change_child", element, provider=provider, child_name=child_name)
+    if element.get_child_name():
+        _clear_element(element)
+
+    child_dict = provider.get_recycled_child(child_name)
+    if child_dict is None:
+        child_dict = provider.get_a_child(child_name)
+        provider.__check_child__(child_dict, "get_a_child")
     child_dict["child_name"] = child_name
     child_dict["provider"] = provider
     element.set_child(child_dict)
 
 
-def get_interface(top_level):
+def change_child_at_element_async(element, provider, child_name):
+
+    """
+    Changes the child at given element with a child of given name, without blocking.
+
+    It is same as :func:`change_child_at_element`, except that when :obj:`provider` has no child
+    parked, the child is requested through ``Provider.get_a_child_async`` and a placeholder is
+    shown at :obj:`element` till it arrives. A request still in flight at :obj:`element` is
+    cancelled, so only the latest child lands.
+
+    Arguments
+    ---------
+    element : :mod:`.Element`
+        The element whose child has to be changed.
+    provider : :mod:`.Provider`
+        The provider that acts as source of child.
+    child_name  : :class:`str`
+        The name of child to be added to :obj:`element`.
+    """
+
+    Operations.notify("change_child", element, provider=provider, child_name=child_name)
+    if element.get_child_name():
+        _clear_element(element)
+
+    child_dict = provider.get_recycled_child(child_name)
+    if child_dict is None:
+        element.set_child_async(provider, child_name)
+    else:
+        child_dict["child_name"] = child_name
+        child_dict["provider"] = provider
+        element.set_child(child_dict)
+
+
+def compile_interface(interface_dict, creator_maps, init_maps, cache_dir=None, name=None):
 
     """
-    Gets the interface starting from the given top level.
+    Compiles the given interface dictionary into a linked :mod:`.Plan`.
+
+    Compiled plans are cached in memory by the key given by ``Plan.get_key``, dropping the least
+    recently used ones (see :mod:`.Plan`). When :obj:`cache_dir` is given, they are also cached on
+    disk as ``<key>.json`` in that directory. :obj:`interface_dict` is not modified.
+
+    Arguments
+    ---------
+    interface_dict: :class:`dict`
+        A dictionary that can be used to set interface.
+    creator_maps : :class:`dict`
+        A dictionary of format ``{key: (func, args, kwargs)}``. See :func:`set_interface`.
+    init_maps : :class:`dict`
+        A dictionary of format ``{key: object}``. See :func:`set_interface`.
+    cache_dir : :class:`str`
+        The directory in which plans are cached on disk. It is :obj:`None`, when not given.
+    name : :class:`str`
+        A name that stands for :obj:`interface_dict` in the key, so that it is not serialised to
+        find a cached plan. It has to change whenever :obj:`interface_dict` changes. See
+        ``Plan.get_key``.
+
+    Returns
+    -------
+    :mod:`.Plan`
+        The plan, linked to :obj:`creator_maps` and :obj:`init_maps`.
+    """
+
+    key = get_plan_key(interface_dict, creator_maps, init_maps, name)
+    plan = get_cached_plan(key)
+
+    if plan is None and cache_dir:
+        path = os.path.join(cache_dir, f"{key}.json")
+        try:
+            plan = Plan.load(path)
+        except (OSError, ValueError):
+            # A missing, corrupt or outdated plan is compiled again.
+            plan = Plan.compile(Schema.upgrade(interface_dict), creator_maps, init_maps)
+            os.makedirs(cache_dir, exist_ok=True)
+            plan.save(path)
+    elif plan is None:
+        plan = Plan.compile(Schema.upgrade(interface_dict), creator_maps, init_maps)
+
+    cache_plan(key, plan)
+    return plan.link(creator_maps, init_maps)
+
+
+def get_interface(top_level, use_cache=False, version=Schema.VERSION, path=None):
+
+    """
+    Gets the interface starting from the given top level, or from the view or element at given
+    path under it.
+
+    With :obj:`use_cache`, only the views and elements marked dirty since the last call are
+    asked for their properties again (see ``View.mark_dirty``). The nested dictionaries are then
+    shared with the cache and must not be modified.
 
     Arguments
     ---------
     top_level : :mod:`.View` 
         A view which acts as the root widget.
+    use_cache : :class:`bool`
+        States whether to reuse the cached properties of unchanged views and elements. Default is
+        :obj:`False`.
+    version : :class:`int`
+        The version of interface dictionary, 1 or 2 (see :mod:`.Schema`). Version 1 is meant for
+        older readers. Default is 2.
+    path : :class:`list` or :class:`str`
+        The path of view or element whose interface is required, see :func:`get_widget_at_path`.
+        Only the widgets along the path and under the found one are visited.
 
     Returns
     -------
     :class:`dict`
         A dictionary with properties to build interface.
+
+    Raises
+    ------
+    ValueError
+        Raised when there is no widget at :obj:`path`.
+    """
+
+    widget = top_level
+    view = index = None
+    if path is not None:
+        widget, view, index = _find_at_path(top_level, path)
+        if widget is None:
+            raise ValueError(f"No view or element at path {path!r}")
+    if isinstance(view, VirtualNotebook) and not view.is_page_real(index):
+        # The element of such a page is empty, its properties are in the record.
+        interface_props = view.get_record_props(index)
+    else:
+        interface_props = widget.get_props(use_cache)
+    if version == 1:
+        return Schema.downgrade(interface_props)
+    if version != Schema.VERSION:
+        raise ValueError(f"Interface version has to be 1 or 2, but got {version}")
+    return {**interface_props, "version": version}
+
+
+def _check_interface(interface_props):
+
+    root = interface_props["type"]
+    if root.get_parent() is not None:
+        raise ValueError("The root of interface is already added to a container")
+
+    stack = [interface_props]
+    while stack:
+        props = stack.pop()
+        widget = props.get("type")
+        if widget is not root and widget.get_parent() is None:
+            raise ValueError(f"The {widget.get_type()} of interface was not added to its parent")
+        if isinstance(widget, Element):
+            continue
+        for value in props.values():
+            if isinstance(value, (dict,)) and value:
+                stack.append(value)
+            elif isinstance(value, (list,)):
+                stack.extend(item for item in value if isinstance(item, (dict,)) and item)
+
+
+def _clear_element(element):
+
+    # The child is offered to the keepers of Operations, like History, before it is cleared.
+    child_dict = element.take_child()
+    if not Operations.keep_child(element, child_dict):
+        _clear_child_dict(child_dict)
+        element.emit("child-cleared")
+
+
+def _count_children(view):
+
+    # The pages of a virtual notebook that are not real are not its Gtk children, but count.
+    if view.get_type() == "notebook":
+        return view.get_n_pages()
+    return len(view.get_children())
+
+
+def _dispose(widget):
+
+    for child, depth, path in walk(widget, paths=False):
+        if isinstance(child, Element) and child.get_child_name():
+            child.clear_child()
+    widget.destroy()
+
+
+def _dispose_interface(interface_props):
+
+    # The widgets not added to any parent are the roots of parts built so far.
+    orphans = []
+    stack = [interface_props]
+    while stack:
+        props = stack.pop()
+        widget = props.get("type")
+        if isinstance(widget, (Element, View)) and widget.get_parent() is None:
+            orphans.append(widget)
+        if isinstance(widget, Element):
+            continue
+        for value in props.values():
+            if isinstance(value, (dict,)):
+                stack.append(value)
+            elif isinstance(value, (list,)):
+                stack.extend(item for item in value if isinstance(item, (dict,)))
+
+    for widget in orphans:
+        _dispose(widget)
+
+
+def _encode_interface(interface_props, codec="json"):
+
+    if codec == "json":
+        try:
+            return json.dumps(interface_props, indent=2).encode()
+        except RecursionError:
+            # Too deep for json, which recurses. load_interface detects the binary by its magic.
+            return Codec.dumps(interface_props)
+    if codec == "binary":
+        return Codec.dumps(interface_props)
+    raise ValueError(f"Codec has to be either 'json' or 'binary', but got {codec!r}")
+
+
+def _write_interface(path, data):
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".aduct-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            # The file keeps the mode of the file it replaces, else it gets the default of umask,
+            # as mkstemp makes it readable only by the owner.
+            try:
+                mode = os.stat(path).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = 0o666 & ~_umask
+            os.chmod(temp_path, mode)
+            fp.write(data)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _get_props_to_build(interface_props):
+
+    to_build = []
+    stack = [interface_props]
+    while stack:
+        props = stack.pop()
+        element = props.get("type")
+        if isinstance(element, Element):
+            if props.get("provider") and not element.lazy:
+                to_build.append(props)
+            continue
+        for value in props.values():
+            if isinstance(value, (dict,)):
+                stack.append(value)
+            elif isinstance(value, (list,)):
+                stack.extend(item for item in value if isinstance(item, (dict,)))
+    return to_build
+
+
+def _get_props_to_prepare(interface_props):
+
+    return [
+        props
+        for props in _get_props_to_build(interface_props)
+        if "prepared" not in props and type(props["provider"]).prepare is not Provider.prepare
+    ]
+
+
+def get_path(widget, top_level):
+
     """
+    Gets the path of given widget from the top level.
 
-    interface_props = {**top_level.get_props()}
-    return interface_props
+    The path is a list of indices (see ``View.get_nth_child``), starting from the child of
+    :obj:`top_level`. The path of :obj:`top_level` itself is an empty list.
 
+    Arguments
+    ---------
+    widget : :mod:`.View` or :mod:`.Element`
+        The widget whose path is required.
+    top_level : :mod:`.View`
+        A view which acts as the root widget.
+
+    Returns
+    -------
+    :class:`list`
+        The path of :obj:`widget`, :obj:`None` if it is not under :obj:`top_level`.
+    """
+
+    path = []
+    while widget is not top_level:
+        parent = widget.get_parent() if widget else None
+        if not isinstance(parent, View):
+            return None
+        path.append(parent.get_child_index(widget))
+        widget = parent
+    path.reverse()
+    return path
 
-def set_interface(interface_dict, top_level, creator_maps, init_maps):
+
+def get_widget_at_path(top_level, path):
 
     """
-    Sets the interface starting from given the top level.
+    Gets the widget at given path from the top level.
+
+    The path is either a list of indices as given by :func:`get_path`, or a string of steps
+    separated by ``/``. A step is one of the following.
+
+    * An index, like ``3``.
+    * A key of interface properties, that is ``child`` of a bin, ``child_1`` or ``child_2`` of a
+      paned, ``child_3`` of a tiles and ``element_3`` of a notebook.
+    * A type, like ``notebook``, which only checks that the widget reached so far is of that type.
+    * An id prefixed with ``#``, like ``#2f09c6aa41b7``, which jumps to the view or element of that
+      id (see :mod:`.Registry`), when it is under :obj:`top_level`.
+
+    So, ``paned/child_2/notebook/3`` is the fourth page of the notebook at second panel of
+    :obj:`top_level`, which is a paned.
 
     Arguments
     ---------
-    interface_dict: :class:`dict`
-        A dictionary that can be used to set interface.
-    top_level: :mod:`.View` 
+    top_level : :mod:`.View`
+        A view which acts as the root widget.
+    path : :class:`list` or :class:`str`
+        The path of widget.
+
+    Returns
+    -------
+    :mod:`.View` or :mod:`.Element`
+        The widget at :obj:`path`, :obj:`None` if there is no such widget.
+    """
+
+    return _find_at_path(top_level, path)[0]
+
+
+def _find_at_path(top_level, path):
+
+    # Gets the widget at path, along with the view and index it was last reached through.
+    if isinstance(path, str):
+        path = [step for step in path.split("/") if step]
+
+    widget = top_level
+    view = index = None
+    for step in path:
+        if isinstance(step, int):
+            index = step
+        elif step.startswith("#"):
+            widget = get_by_id(step[1:])
+            if widget is None or get_path(widget, top_level) is None:
+                return None, None, None
+            view = index = None
+            continue
+        elif step == "child":
+            index = 0
+        elif step.startswith("child_") and step[6:].isdigit():
+            index = int(step[6:]) - 1
+        elif step.isdigit():
+            index = int(step)
+        elif step.startswith("element_") and step[8:].isdigit():
+            index = int(step[8:])
+        elif widget.get_type() == step:
+            continue
+        else:
+            return None, None, None
+
+        view = widget
+        widget = widget.get_nth_child(index)
+        if widget is None:
+            return None, None, None
+    return widget, view, index
+
+
+def load_interface(path, top_level, creator_maps, init_maps, **kwargs):
+
+    """
+    Loads the interface saved by :func:`save_interface` and sets it starting from the given top
+    level. The codec of file is detected from its content.
+
+    Arguments
+    ---------
+    path : :class:`str`
+        The path of file from which the interface has to be loaded.
+    top_level: :mod:`.View`
         The root widget from which the interface has to be set.
     creator_maps : :class:`dict`
-        A dictionary of format ``{key: (func, args, kwargs)}``, that is used to create the required
-        object. The object is then created using ``func(*args, **kwargs)`` and is substitued as
-        value in :obj:`interface_dict` which has key ``key``.
+        A dictionary of format ``{key: (func, args, kwargs)}``. See :func:`set_interface`.
     init_maps : :class:`dict`
-        A dictionary of format ``{key: object}`` already initialized objects. The occurences of
-        ``key`` in :obj:`inerface_dict` is then replaced with ``object``.
+        A dictionary of format ``{key: object}``. See :func:`set_interface`.
+    **kwargs
+        The values to be passed to :func:`set_interface`.
 
     Returns
     -------
@@ -204,8 +677,275 @@ def set_interface(interface_dict, top_level, creator_maps, init_maps):
         no child.
     """
 
-    def recursive_replace(dic):
+    with open(path, "rb") as fp:
+        binary = fp.read(len(Codec.MAGIC)) == Codec.MAGIC
+        fp.seek(0)
+        if binary:
+            interface_dict = Codec.load(fp)
+        else:
+            interface_dict = json.load(fp)
+    return set_interface(interface_dict, top_level, creator_maps, init_maps, **kwargs)
+
+
+def patch_interface(interface_dict, top_level, creator_maps, init_maps):
+
+    """
+    Sets the interface starting from given the top level, reusing the existing widgets.
+
+    The existing interface is compared with :obj:`interface_dict` from the top, slot by slot (the
+    child of a bin, the panels of a paned, the pages of a notebook). The pages of a notebook and
+    the tiles of a tiles are matched by their ``id`` and moved to their new position, so
+    inserting or removing one of them does not rebuild the others. A view of the same type is
+    kept and only its own properties are updated, while a view of different type is replaced by a
+    new one built from :obj:`interface_dict`. An element is kept as such when its provider and
+    child properties already match, else its child is set again. Widgets that are no longer
+    needed are destroyed, after their elements are cleared.
+
+    Unlike :func:`set_interface`, :obj:`interface_dict` is not modified.
+
+    Arguments
+    ---------
+    interface_dict: :class:`dict`
+        A dictionary that can be used to set interface, as given by :func:`get_interface` of the
+        child of :obj:`top_level`.
+    top_level: :mod:`.View`
+        The root widget from which the interface has to be set.
+    creator_maps : :class:`dict`
+        A dictionary of format ``{key: (func, args, kwargs)}``. See :func:`set_interface`.
+    init_maps : :class:`dict`
+        A dictionary of format ``{key: object}``. See :func:`set_interface`.
+
+    Returns
+    -------
+    :class:`dict`
+        A dictionary with keys ``kept``, ``updated``, ``built`` and ``removed``, counting the
+        elements kept as such, the views and elements updated in place, the subtrees built and
+        the subtrees removed.
+    """
+
+    stats = {"kept": 0, "updated": 0, "built": 0, "removed": 0}
+    interface_dict = {**Schema.upgrade(interface_dict)}
+    interface_dict.pop("version", None)
+    Operations.notify("set_interface", top_level)
+
+    def build(props):
+        new_props = resolve_interface(Walk.copy_props(props), creator_maps, init_maps)
+        new_child = new_props["type"]
+        new_child.set_from_props(new_props)
+        Batch.show_all(new_child)
+        stats["built"] += 1
+        return new_child
+
+    def resolve_own(props, widget):
+        own_props = {key: value for key, value in props.items() if key != "type"}
+        own_props = resolve_interface(Walk.copy_props(own_props), creator_maps, init_maps)
+        own_props["type"] = widget
+        return own_props
+
+    def match_slots(children, slots_props):
+        # Pairs the slots with the existing children. A child is matched by its id, so that
+        # inserting a slot does not rebuild the ones after it. A slot whose id is not found takes
+        # the child at its position, unless that child is matched by another slot.
+        by_id = {child.get_id(): child for child in children}
+        claimed = {props.get("id") for props in slots_props if props and props.get("id") in by_id}
+        matched = []
+        for idx, props in enumerate(slots_props):
+            child = by_id.get(props.get("id")) if props else None
+            if child is None and props and idx < len(children):
+                if children[idx].get_id() not in claimed:
+                    child = children[idx]
+            matched.append(child)
+        return matched
+
+    def remove_unmatched(view, children, matched):
+        matched = set(child for child in matched if child)
+        for child in children:
+            if child not in matched:
+                view.remove_child(child)
+                _dispose(child)
+                stats["removed"] += 1
+
+    def patch_slot(view, child, props, add_child):
+        # Returns the pairs of (child, props) whose subtrees have to be patched further.
+        if not props:
+            if child:
+                view.remove_child(child)
+                _dispose(child)
+                stats["removed"] += 1
+            return []
+        if not child:
+            add_child(build(props))
+            return []
+        if child.get_type() != props["type"]:
+            view.replace_child(child, build(props))
+            _dispose(child)
+            return []
+        return [(child, props)]
+
+    def patch_element(element, props):
+        own_props = element.get_props()
+        own_props.pop("id")
+        if own_props == {key: value for key, value in props.items() if key != "id"}:
+            stats["kept"] += 1
+            return
+        if props["provider"] is None:
+            element.clear_child()
+        else:
+            element.set_from_props(resolve_own(props, element))
+        stats["updated"] += 1
+
+    def patch_notebook(notebook, props):
+        if notebook.get_tab_pos() != props["tab_position"]:
+            notebook.set_tab_pos(props["tab_position"])
+        stats["updated"] += 1
+
+        to_patch = []
+        pages = [notebook.get_nth_page(idx) for idx in range(notebook.get_n_pages())]
+        matched = match_slots(pages, props["elements"])
+        remove_unmatched(notebook, pages, matched)
+        for idx, (element, element_props) in enumerate(zip(matched, props["elements"])):
+            if element and notebook.get_nth_page(idx) is not element:
+                notebook.reorder_child(element, idx)
+            if (
+                isinstance(notebook, VirtualNotebook)
+                and element
+                and element_props
+                and not notebook.is_page_real(idx)
+            ):
+                # A page that is not real is patched in its record, its child is not built.
+                changed = notebook.set_page_props(idx, resolve_own(element_props, element))
+                stats["updated" if changed else "kept"] += 1
+                continue
+            add_child = lambda child, idx=idx: notebook.add_child(child, idx)
+            to_patch.extend(patch_slot(notebook, element, element_props, add_child))
+        return to_patch
+
+    def patch_paned(paned, props):
+        to_patch = []
+        children = (paned.get_child1(), paned.get_child2())
+        for idx, child_props in enumerate(props["children"]):
+            add_child = lambda child, position=idx + 1: paned.add_child(child, position)
+            to_patch.extend(patch_slot(paned, children[idx], child_props, add_child))
+
+        if paned.get_orientation() != props["orientation"]:
+            paned.set_orientation(props["orientation"])
+        if paned.get_position() != props["position"]:
+            paned.set_position(props["position"])
+        stats["updated"] += 1
+        return to_patch
+
+    def patch_tiles(tiles, props):
+        to_patch = []
+        children = tiles.get_children()
+        matched = match_slots(children, props["children"])
+        remove_unmatched(tiles, children, matched)
+        for idx, (child, child_props) in enumerate(zip(matched, props["children"])):
+            if child and tiles.get_nth_child(idx) is not child:
+                tiles.reorder_child(child, idx)
+                tiles.mark_dirty()
+            add_child = lambda child, idx=idx: tiles.add_child(child, idx)
+            to_patch.extend(patch_slot(tiles, child, child_props, add_child))
+
+        if tiles.get_orientation() != props["orientation"]:
+            tiles.set_orientation(props["orientation"])
+        weights = props.get("weights") or [1.0] * len(tiles.get_children())
+        if tiles.get_weights() != weights:
+            tiles.set_weights(weights)
+        stats["updated"] += 1
+        return to_patch
+
+    def patch_bin(bin_, props):
+        stats["updated"] += 1
+        return patch_slot(bin_, bin_.get_child(), props["child"], bin_.add_child)
+
+    patchers = {
+        "bin": patch_bin,
+        "notebook": patch_notebook,
+        "paned": patch_paned,
+        "tiles": patch_tiles,
+    }
+    stack = patch_slot(top_level, top_level.get_child(), interface_dict, top_level.add_child)
+    while stack:
+        widget, props = stack.pop()
+        if "id" in props:
+            widget.set_id(props["id"], replace=True)
+        if widget.get_type() == "element":
+            patch_element(widget, props)
+        else:
+            stack.extend(patchers[widget.get_type()](widget, props))
+
+    return stats
+
+
+def prepare_interface(interface_props, max_workers=None):
+
+    """
+    Runs ``Provider.prepare`` for the elements of given interface properties in a thread pool.
+
+    Only the providers that override ``Provider.prepare`` are run, and lazy elements or elements
+    that are already prepared are skipped. The result of each is stored at the ``prepared`` key of
+    properties of its element, which is taken out by ``Element.set_from_props``.
+
+    Arguments
+    ---------
+    interface_props : :class:`dict`
+        The interface properties, whose ``type`` and ``provider`` values are already substituted
+        with objects.
+    max_workers : :class:`int`
+        The maximum number of threads. When not provided, the default of
+        :class:`concurrent.futures.ThreadPoolExecutor` is used.
+
+    Raises
+    ------
+    :class:`TypeError`
+        Raised when ``Provider.prepare`` of an element is a coroutine function. Such interfaces
+        are set through ``Aduct.Coroutine.set_interface``.
+    """
+
+    to_prepare = _get_props_to_prepare(interface_props)
+    if not to_prepare:
+        return
+    for props in to_prepare:
+        if inspect.iscoroutinefunction(props["provider"].prepare):
+            raise TypeError(
+                f"{type(props['provider']).__name__}.prepare is a coroutine function, so the "
+                "interface can only be set through Aduct.Coroutine.set_interface"
+            )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(props["provider"].prepare, props["child"]) for props in to_prepare
+        ]
+        for props, future in zip(to_prepare, futures):
+            props["prepared"] = future.result()
+
+
+def resolve_interface(interface_dict, creator_maps, init_maps):
+
+    """
+    Substitutes the values of given interface dictionary with objects, in place. A dictionary of
+    version 1 is first converted to version 2 (see :mod:`.Schema`), which is then substituted.
+
+    Arguments
+    ---------
+    interface_dict: :class:`dict`
+        A dictionary that can be used to set interface.
+    creator_maps : :class:`dict`
+        A dictionary of format ``{key: (func, args, kwargs)}``. See :func:`set_interface`.
+    init_maps : :class:`dict`
+        A dictionary of format ``{key: object}``. See :func:`set_interface`.
+
+    Returns
+    -------
+    :class:`dict`
+        The given or converted :obj:`interface_dict`, with its values substituted.
+    """
 
+    interface_dict = Schema.upgrade(interface_dict)
+    stack = [interface_dict]
+    while stack:
+        dic = stack.pop()
+        nested = []
         for key in dic:
 
             if key in creator_maps:
@@ -220,23 +960,328 @@ def set_interface(interface_dict, top_level, creator_maps, init_maps):
 
             new_dic = dic[key]
             if isinstance(new_dic, (dict,)):
-                recursive_replace(new_dic)
+                nested.append(new_dic)
+            elif isinstance(new_dic, (list,)):
+                nested.extend(item for item in new_dic if isinstance(item, (dict,)))
 
-        return dic
+        # Reversed, so that the nested dictionaries are substituted in their order.
+        stack.extend(reversed(nested))
 
-    interface_props = recursive_replace(interface_dict)
+    return interface_dict
 
-    new_child = interface_props["type"]
-    new_child.set_from_props(interface_props)
 
+def save_interface(top_level, path, callback=None, codec="json"):
+
+    """
+    Saves the interface starting from the given top level to a file, without blocking.
+
+    The interface is taken on the main thread by :func:`get_interface`, without the cached
+    properties, so the content of children that changed without ``child-props-changed`` being
+    emitted is saved too. It is encoded and written in a thread, first to a temporary file in the
+    same directory, which is then synced to disk and renamed to :obj:`path`. So :obj:`path` always
+    holds either the old or the new interface, even if the process dies. The file keeps the mode
+    of the file it replaces.
+
+    Arguments
+    ---------
+    top_level : :mod:`.View`
+        A view which acts as the root widget.
+    path : :class:`str`
+        The path of file to which the interface has to be saved.
+    callback : :class:`callable`
+        The function called in the main loop after saving, with the raised exception or
+        :obj:`None` on success. When it is not given, the exception is raised in the thread.
+    codec : :class:`str`
+        The format of file, either ``json`` (indented, human readable) or ``binary`` (compact, see
+        :mod:`.Codec`). Default is ``json``. An interface nested deeper than json can encode,
+        like a paned split a thousand times, is written as ``binary`` anyway.
+
+    Returns
+    -------
+    :class:`threading.Thread`
+        The thread that writes the file.
+    """
+
+    interface_props = get_interface(top_level)
+
+    def save():
+        try:
+            _write_interface(path, _encode_interface(interface_props, codec))
+        except Exception as err:
+            if callback is None:
+                raise
+            GLib.idle_add(callback, err)
+        else:
+            if callback is not None:
+                GLib.idle_add(callback, None)
+
+    thread = Thread(target=save)
+    thread.start()
+    return thread
+
+
+def set_interface(
+    interface_dict,
+    top_level,
+    creator_maps,
+    init_maps,
+    max_workers=None,
+    compiled=False,
+    cache_dir=None,
+    atomic=False,
+    path=None,
+    plan_name=None,
+):
+
+    """
+    Sets the interface starting from given the top level.
+
+    With :obj:`path`, the view or element at that path under :obj:`top_level` is replaced by the
+    interface instead, through :func:`replace_child`. The rest of interface is not visited.
+
+    The slow work of building elements is done in a thread pool before the widgets are made, see
+    :func:`prepare_interface`.
+
+    With :obj:`atomic`, the new interface is checked to be fully built before it is swapped in and
+    the swap is made inside :func:`batch`, so the new widgets are shown and laid out in one pass.
+    When building fails, the widgets made so far are destroyed and the child of :obj:`top_level`
+    is left untouched.
+
+    Arguments
+    ---------
+    interface_dict: :class:`dict`
+        A dictionary that can be used to set interface.
+    top_level: :mod:`.View` 
+        The root widget from which the interface has to be set.
+    creator_maps : :class:`dict`
+        A dictionary of format ``{key: (func, args, kwargs)}``, that is used to create the required
+        object. The object is then created using ``func(*args, **kwargs)`` and is substitued as
+        value in :obj:`interface_dict` which has key ``key``.
+    init_maps : :class:`dict`
+        A dictionary of format ``{key: object}`` already initialized objects. The occurences of
+        ``key`` in :obj:`inerface_dict` is then replaced with ``object``.
+    max_workers : :class:`int`
+        The maximum number of threads used to run ``Provider.prepare`` of elements. See
+        :func:`prepare_interface`.
+    compiled : :class:`bool`
+        States whether to set the interface through a plan compiled by :func:`compile_interface`,
+        which leaves :obj:`interface_dict` unmodified. Default is :obj:`False`.
+    cache_dir : :class:`str`
+        The directory in which compiled plans are cached on disk, used when :obj:`compiled` is
+        :obj:`True`.
+    atomic : :class:`bool`
+        States whether to build the interface fully before swapping it in, as explained above.
+        Default is :obj:`False`.
+    path : :class:`list` or :class:`str`
+        The path of view or element to be replaced, see :func:`get_widget_at_path`.
+    plan_name : :class:`str`
+        The name by which the compiled plan is cached, used when :obj:`compiled` is :obj:`True`.
+        See :func:`compile_interface`.
+
+    Returns
+    -------
+    :class:`Gtk.Widget`
+        The widget that was previous child of :obj:`top_level`, :obj:`None` if :obj:`top_level` has
+        no child. With :obj:`path`, it is the replaced widget.
+
+    Raises
+    ------
+    ValueError
+        Raised with :obj:`atomic`, when a view or element of the interface was not added to it.
+        Also raised when there is no widget at :obj:`path` other than :obj:`top_level`.
+    """
+
+    old_child = None
+    if path is not None:
+        old_child = get_widget_at_path(top_level, path)
+        if old_child is None or old_child is top_level:
+            raise ValueError(f"No view or element under the top level at path {path!r}")
+
+    interface_props = None
+    try:
+        if compiled:
+            plan = compile_interface(interface_dict, creator_maps, init_maps, cache_dir, plan_name)
+            interface_props = plan.instantiate()
+        else:
+            if atomic:
+                # It is then resolved in place, so the widgets made before a failure are known.
+                interface_dict = Schema.upgrade(interface_dict)
+            interface_props = resolve_interface(interface_dict, creator_maps, init_maps)
+        prepare_interface(interface_props, max_workers)
+
+        new_child = interface_props["type"]
+        new_child.set_from_props(interface_props)
+        if atomic:
+            _check_interface(interface_props)
+    except Exception:
+        if atomic and interface_props is not None:
+            _dispose_interface(interface_props)
+        elif atomic and not compiled:
+            _dispose_interface(interface_dict)
+        # A plan destroys by itself the widgets it made before failing.
+        raise
+
+    if not atomic:
+        return _swap_interface(top_level, new_child, old_child)
+    with batch(top_level):
+        return _swap_interface(top_level, new_child, old_child)
+
+
+def _swap_interface(top_level, new_child, old_child):
+
+    if old_child is not None:
+        replace_child(old_child.get_parent(), old_child, new_child)
+        Batch.show_all(new_child)
+        return old_child
+
+    Operations.notify("set_interface", top_level, child=new_child)
     old_child = top_level.get_child()
     if old_child:
         top_level.replace_child(old_child, new_child)
+    else:
+        top_level.add_child(new_child)
 
-    new_child.show_all()
+    Batch.show_all(new_child)
     return old_child
 
 
+def set_interface_incremental(
+    interface_dict,
+    top_level,
+    creator_maps,
+    init_maps,
+    frame_budget=8,
+    progress_callback=None,
+    complete_callback=None,
+    error_callback=None,
+):
+
+    """
+    Sets the interface starting from given the top level, a bounded amount of work at a time.
+
+    The work is done in idle callbacks of the main loop, so the window keeps drawing while the
+    interface is being built. Each callback runs for at most :obj:`frame_budget` milliseconds
+    (and at least one step). The root view is added to :obj:`top_level` first, then all the views
+    are set from top to bottom and finally the elements are set.
+
+    ``Operations.notify`` is called with ``set_interface`` once the interface is built, with the
+    replaced child as ``old_child``, so that observers like :mod:`.Journal` do not take the half
+    built interface.
+
+    Arguments
+    ---------
+    interface_dict: :class:`dict`
+        A dictionary that can be used to set interface.
+    top_level: :mod:`.View`
+        The root widget from which the interface has to be set.
+    creator_maps : :class:`dict`
+        A dictionary of format ``{key: (func, args, kwargs)}``. See :func:`set_interface`.
+    init_maps : :class:`dict`
+        A dictionary of format ``{key: object}``. See :func:`set_interface`.
+    frame_budget : :class:`int`
+        The number of milliseconds of work done in each idle callback. Default is 8.
+    progress_callback : :class:`callable`
+        The function called as ``progress_callback(n_done, n_total)`` after each idle callback,
+        where the numbers count views and elements.
+    complete_callback : :class:`callable`
+        The function called as ``complete_callback(old_child)`` when the interface is set, where
+        ``old_child`` is the widget that was previous child of :obj:`top_level` or :obj:`None`.
+    error_callback : :class:`callable`
+        The function called as ``error_callback(error)`` when setting a view or an element raises
+        an exception. Building stops there, the previous child is put back at :obj:`top_level`
+        and the part already built is destroyed. When it is not given, the exception is raised in
+        the main loop.
+
+    Returns
+    -------
+    :class:`int`
+        The id of idle source, which can be removed by ``GLib.source_remove`` to stop building.
+    """
+
+    interface_props = resolve_interface(interface_dict, creator_maps, init_maps)
+
+    n_total = 0
+    stack = [interface_props]
+    while stack:
+        props = stack.pop()
+        if not isinstance(props.get("type"), Element):
+            for value in props.values():
+                if isinstance(value, (dict,)) and value:
+                    stack.append(value)
+                elif isinstance(value, (list,)):
+                    stack.extend(item for item in value if isinstance(item, (dict,)) and item)
+        n_total += 1
+
+    root = interface_props["type"]
+    views = deque([(root, interface_props)])
+    elements = deque()
+    state = {"n_done": 0, "old_child": None, "attached": False}
+
+    def attach_root():
+        old_child = top_level.get_child()
+        if old_child:
+            top_level.replace_child(old_child, root)
+        else:
+            top_level.add_child(root)
+        root.show()
+        state["old_child"] = old_child
+        state["attached"] = True
+
+    def step():
+        if views:
+            view, props = views.popleft()
+            if isinstance(view, Element):
+                elements.append((view, props))
+                return
+            children = view.set_own_props(props)
+            for child, child_props in children:
+                if isinstance(child, Element):
+                    elements.append((child, child_props))
+                else:
+                    views.append((child, child_props))
+            view.show_all()
+        else:
+            element, props = elements.popleft()
+            element.set_from_props(props)
+            element.show_all()
+        state["n_done"] += 1
+
+    def run_steps():
+        deadline = time.monotonic() + frame_budget / 1000
+        try:
+            if not state["attached"]:
+                attach_root()
+            step()
+            while (views or elements) and time.monotonic() < deadline:
+                step()
+        except Exception as error:
+            views.clear()
+            elements.clear()
+            if state["attached"]:
+                old_child = state["old_child"]
+                if old_child:
+                    top_level.replace_child(root, old_child)
+                else:
+                    top_level.remove_child(root)
+            _dispose_interface(interface_props)
+            if error_callback is None:
+                raise
+            error_callback(error)
+            return False
+
+        if progress_callback:
+            progress_callback(state["n_done"], n_total)
+        if views or elements:
+            return True
+
+        Operations.notify("set_interface", top_level, child=root, old_child=state["old_child"])
+        if complete_callback:
+            complete_callback(state["old_child"])
+        return False
+
+    return GLib.idle_add(run_steps, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+
 def remove_element(element, view):
 
     """
@@ -254,20 +1299,26 @@ def remove_element(element, view):
         The view from which :obj:`element` has to be removed.
     """
 
+    Operations.notify("remove_element", element, view=view)
     if view.get_type() == "bin":
-        element.clear_child()
+        if element.get_child_name():
+            _clear_element(element)
 
     else:
         view.remove_child(element)
-        children = view.get_children()
-        if len(children) == 1:
+        if _count_children(view) == 1:
             parent = view.get_parent()
             try:
-                parent.get_type() in ("bin", "notebook", "paned")
+                parent.get_type() in ("bin", "notebook", "paned", "tiles")
             except AttributeError:
                 pass
             else:
-                other_child = children[0]
+                if isinstance(view, VirtualNotebook):
+                    view.realize_page(0)
+                if view.get_type() == "notebook":
+                    other_child = view.get_nth_child(0)
+                else:
+                    other_child = view.get_children()[0]
                 view.remove_child(other_child)
                 parent.replace_child(view, other_child)
 
@@ -296,4 +1347,5 @@ def replace_child(view, child1, child2):
         type_ = view.get_type()
     except AttributeError:
         raise TypeError(f"Expected a Aduct.View but got {view}")
+    Operations.notify("replace_child", child1, view=view, child2=child2)
     view.replace_child(child1, child2)
@@ -0,0 +1,96 @@
+"""
+Compares the binary codec of Aduct with json on synthetic interfaces.
+
+Usage: python benchmarks/bench_codec.py [n_elements ...]
+"""
+
+import json
+import os
+import sys
+import time
+
+# The repository is put first on the path, so that it runs without installing Aduct.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Aduct import Codec
+
+
+def make_element(idx):
+    child = {"child_name": f"Child {idx % 7}", "text": f"Text of child {idx}", "line": idx}
+    return {"type": "element", "provider": f"Provider {idx % 3}", "child": child}
+
+
+def make_notebook(start, n_elements):
+    props = {"type": "notebook", "tab_position": 2, "n_action_button": 1}
+    for idx in range(n_elements):
+        props[f"element_{idx}"] = make_element(start + idx)
+    props["n_elements"] = n_elements
+    return props
+
+
+def make_interface(n_elements, per_notebook=20):
+    """Makes a balanced tree of paneds over notebooks holding n_elements elements."""
+
+    children = [
+        make_notebook(start, min(per_notebook, n_elements - start))
+        for start in range(0, n_elements, per_notebook)
+    ]
+    orientation = 0
+    while len(children) > 1:
+        paneds = []
+        for idx in range(0, len(children) - 1, 2):
+            paned = {
+                "type": "paned",
+                "child_1": children[idx],
+                "child_2": children[idx + 1],
+                "orientation": orientation,
+                "position": 250,
+            }
+            paneds.append(paned)
+        if len(children) % 2:
+            paneds.append(children[-1])
+        children = paneds
+        orientation = 1 - orientation
+    return {"type": "bin", "child": children[0]}
+
+
+def measure(encode, decode, interface, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        data = encode(interface)
+    encode_time = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decoded = decode(data)
+    decode_time = (time.perf_counter() - start) / repeat
+
+    assert decoded == interface
+    return len(data), encode_time, decode_time
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]
+    codecs = {
+        "json (indent=2)": (lambda obj: json.dumps(obj, indent=2).encode(), json.loads),
+        "json (compact)": (
+            lambda obj: json.dumps(obj, separators=(",", ":")).encode(),
+            json.loads,
+        ),
+        "Aduct.Codec": (Codec.dumps, Codec.loads),
+    }
+
+    print(f"{'elements':>8}  {'codec':<16} {'size (KiB)':>11} {'encode (ms)':>12} {'decode (ms)':>12}")
+    for n_elements in sizes:
+        interface = make_interface(n_elements)
+        repeat = max(1, 20000 // n_elements)
+        for name, (encode, decode) in codecs.items():
+            size, encode_time, decode_time = measure(encode, decode, interface, repeat)
+            print(
+                f"{n_elements:>8}  {name:<16} {size / 1024:>11.1f} "
+                f"{encode_time * 1000:>12.2f} {decode_time * 1000:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
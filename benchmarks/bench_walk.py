@@ -0,0 +1,88 @@
+"""
+Measures reading and setting interfaces of deeply nested paneds, as made by splitting a panel again
+and again.
+
+Usage: python benchmarks/bench_walk.py [depth ...]
+"""
+
+import os
+import sys
+import time
+
+# The repository is put first on the path, so that it runs without installing Aduct.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Aduct
+from Aduct import Walk
+
+CREATOR_MAPS = {
+    "type": {
+        "element": (Aduct.Element, (), {}),
+        "paned": (Aduct.Paned, (), {}),
+    }
+}
+INIT_MAPS = {"provider": {None: None}}
+
+
+def make_deep(depth):
+    """Makes a chain of depth paneds, each holding an element and the paned below it."""
+
+    child = Aduct.Element()
+    leaf = child
+    for _ in range(depth):
+        paned = Aduct.Paned()
+        paned.add_child(Aduct.Element(), 1)
+        paned.add_child(child, 2)
+        child = paned
+    return child, leaf
+
+
+def measure(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    depths = [int(arg) for arg in sys.argv[1:]] or [1000, 2000, 5000]
+
+    print(
+        f"{'depth':>6} {'walk (ms)':>10} {'get_props (ms)':>15} {'cached (ms)':>12} "
+        f"{'resolve (ms)':>13} {'set_from_props (ms)':>20}"
+    )
+    for depth in depths:
+        top_level = Aduct.Bin()
+        root, leaf = make_deep(depth)
+        top_level.add_child(root)
+        repeat = max(1, 20000 // depth)
+
+        walk = lambda: sum(1 for item in Aduct.walk(top_level, paths=False))
+        _, walk_time = measure(walk, repeat)
+        props, props_time = measure(lambda: top_level.get_props(), repeat)
+
+        def get_cached():
+            # Only the path from the changed leaf to the top level is made again.
+            leaf.mark_dirty()
+            return top_level.get_props(use_cache=True)
+
+        top_level.get_props(use_cache=True)
+        _, cached_time = measure(get_cached, repeat)
+
+        def resolve():
+            interface_dict = {**Walk.copy_props(props["child"]), "version": 2}
+            return Aduct.resolve_interface(interface_dict, CREATOR_MAPS, INIT_MAPS)
+
+        resolved, resolve_time = measure(resolve, 1)
+        _, set_time = measure(lambda: resolved["type"].set_from_props(resolved), 1)
+
+        print(
+            f"{depth:>6} {walk_time * 1000:>10.2f} {props_time * 1000:>15.2f} "
+            f"{cached_time * 1000:>12.2f} {resolve_time * 1000:>13.2f} {set_time * 1000:>20.2f}"
+        )
+        resolved["type"].destroy()
+        top_level.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ class ButtonProvider(Aduct.Provider):
     name = GObject.Property(type=str, default="ButtonProvider", flags=GObject.ParamFlags.READABLE)
 
     def __init__(self):
-        Aduct.Provider.__init__(self)
+        Aduct.Provider.__init__(self, pool_size=2)
         self.icon_names = [
             "list-add-symbolic",
             "document-new-symbolic",
@@ -111,30 +111,22 @@ def change_child_at_element(wid, prov, child_name):
 
 
 def save_interface(wid):
-    from json import dump
-
-    with open("aduct.ui", "w") as fp:
-        ui_dict = Aduct.get_interface(top_level)
-        dump(ui_dict, fp, indent=2)
+    Aduct.save_interface(top_level, "aduct.ui")
 
 
 def load_interface(wid):
-    from json import load
-
-    with open("aduct.ui") as fp:
-        ui_dict = load(fp)
-        creator_maps = {
-            "type": {
-                "element": (new_element, (), {}),
-                "bin": (new_bin, (), {}),
-                "notebook": (new_notebook, (), {}),
-                "paned": (new_paned, (), {}),
-            }
-        }
-        init_maps = {
-            "provider": {"Provider A": A, "Provider B": B, "Provider C": C, None: None}
+    creator_maps = {
+        "type": {
+            "element": (new_element, (), {}),
+            "bin": (new_bin, (), {}),
+            "notebook": (new_notebook, (), {}),
+            "paned": (new_paned, (), {}),
         }
-        Aduct.set_interface(ui_dict, top_level, creator_maps, init_maps)
+    }
+    init_maps = {
+        "provider": {"Provider A": A, "Provider B": B, "Provider C": C, None: None}
+    }
+    Aduct.load_interface("aduct.ui", top_level, creator_maps, init_maps)
 
 
 provs = [
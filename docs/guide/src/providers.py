@@ -1,6 +1,8 @@
+from threading import Thread
+
 import gi
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GObject
+from gi.repository import GLib, Gtk, GObject
 
 import Aduct
 
@@ -22,6 +24,9 @@ class Provider_A(Aduct.Provider):
         self.text = entry.get_text()
         for entry in self.entries:
             entry.set_text(self.text)
+        # So that the elements drop their cached properties and the change is autosaved.
+        for entry in self.entries:
+            self.emit("child-props-changed", entry)
 
     def clear_child(self, child_props):
 
@@ -78,6 +83,18 @@ class Provider_A(Aduct.Provider):
             toggle.set_active(self.editable)
         for entry in self.entries:
             entry.set_editable(self.editable)
+            self.emit("child-props-changed", entry)
+
+
+def read_text(path):
+
+    # Returns the text of file at path and the error, if any, that occurred while reading it.
+
+    try:
+        with open(path) as fp:
+            return fp.read(), None
+    except (OSError, UnicodeDecodeError) as error:
+        return None, error
 
 
 class Provider_B(Aduct.Provider):
@@ -87,26 +104,43 @@ class Provider_B(Aduct.Provider):
     def __init__(self):
 
         Aduct.Provider.__init__(self)
+        self.children = []
         self.file_choosers = []
         self.buffer = Gtk.TextBuffer()
         self.path = None
 
     def clear_child(self, child_props):
 
+        self.children.remove(child_props["child"])
         self.file_choosers.remove(child_props["header_child"])
         del child_props
 
     def change_text_at_buffer(self, fp_but):
 
+        # The file is read in a thread, so that a large or slow file does not block the window.
+
         path = fp_but.get_filename()
-        self.path = path
-        fp = open(path)
-        text = fp.read()
-        self.buffer.set_text(text)
-        fp.close()
 
-        for fp_chooser in self.file_choosers:
-            fp_chooser.set_filename(self.path)
+        def read_file():
+            text, error = read_text(path)
+            GLib.idle_add(set_text, text, error)
+
+        def set_text(text, error):
+            if error is None:
+                self.path = path
+                self.buffer.set_text(text)
+            else:
+                self.buffer.set_text(f"Could not read {path}: {error}")
+            for fp_chooser in self.file_choosers:
+                if self.path:
+                    fp_chooser.set_filename(self.path)
+                else:
+                    fp_chooser.unselect_all()
+            for child in self.children:
+                self.emit("child-props-changed", child)
+            return False
+
+        Thread(target=read_file, daemon=True).start()
 
     def get_a_child(self, child_name):
 
@@ -122,6 +156,7 @@ class Provider_B(Aduct.Provider):
             fp_but.set_filename(self.path)
 
         fp_but.connect("file-set", self.change_text_at_buffer)
+        self.children.append(scrolled)
         self.file_choosers.append(fp_but)
 
         child_props = {
@@ -151,6 +186,52 @@ class Provider_B(Aduct.Provider):
 
         return self.get_a_child(props["child_name"])
 
+    def prepare(self, props):
+
+        # Runs in a thread while restoring an interface; only reads the file.
+
+        text = None
+        if props["path"]:
+            with open(props["path"]) as fp:
+                text = fp.read()
+        return props, text
+
+    def build(self, prepared):
+
+        props, text = prepared
+        self.path = props["path"]
+        if text is not None:
+            self.buffer.set_text(text)
+        for fp_chooser in self.file_choosers:
+            fp_chooser.set_filename(self.path)
+        return self.get_a_child(props["child_name"])
+
+    def get_child_from_props_async(self, props, cancellable, callback):
+
+        # The file is read in a thread and the widgets are built back in the main loop.
+
+        def read_file():
+            text, error = None, None
+            if props["path"]:
+                text, error = read_text(props["path"])
+            GLib.idle_add(build_child, text, error)
+
+        def build_child(text, error):
+            # The child is handed over even when the file could not be read, else the
+            # placeholder would stay forever.
+            if not cancellable.is_cancelled():
+                self.path = props["path"] if error is None else None
+                if error is not None:
+                    self.buffer.set_text(f"Could not read {props['path']}: {error}")
+                elif text is not None:
+                    self.buffer.set_text(text)
+                for fp_chooser in self.file_choosers:
+                    fp_chooser.set_filename(self.path)
+                callback(self.get_a_child(props["child_name"]))
+            return False
+
+        Thread(target=read_file, daemon=True).start()
+
 
 class Provider_C(Aduct.Provider):
 
@@ -0,0 +1,157 @@
+import os
+import tempfile
+import unittest
+
+import Aduct
+from Aduct import GLib
+from Aduct.Autosave import Autosave
+from tests.TestElement import TestProvider
+from tests.TestWalk import make_deep
+
+
+def run_pending():
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+
+class TestAutosave(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "aduct.ui")
+        self.bin_ = Aduct.Bin()
+        self.autosave = Autosave(self.bin_, self.path)
+
+    def tearDown(self):
+
+        self.autosave.stop()
+        self.bin_.destroy()
+        self.directory.cleanup()
+        self.autosave = None
+        self.bin_ = None
+
+    def test_flush(self):
+
+        self.bin_.add_child(Aduct.Element())
+        self.autosave.flush()
+        run_pending()
+        self.assertEqual(self.autosave.get_stats(), {"writes": 1, "skips": 0})
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_flush_in_flight(self):
+
+        self.autosave.save()
+        element = Aduct.Element()
+        self.bin_.add_child(element)
+        # A save is in progress, so this one waits behind it.
+        self.autosave.save()
+        self.assertTrue(self.autosave.pending)
+        self.autosave.flush()
+
+        self.assertIsNone(self.autosave.thread)
+        self.assertFalse(self.autosave.pending)
+        with open(self.path) as fp:
+            self.assertIn(element.get_id(), fp.read())
+        run_pending()
+        self.assertEqual(self.autosave.get_stats(), {"writes": 2, "skips": 0})
+
+    def test_save_unchanged(self):
+
+        self.autosave.save()
+        self.autosave.thread.join()
+        run_pending()
+        self.autosave.save()
+        self.autosave.thread.join()
+        run_pending()
+        self.assertEqual(self.autosave.get_stats(), {"writes": 1, "skips": 1})
+
+    def test_save_content(self):
+
+        prov = TestProvider()
+        element = Aduct.Element()
+        self.bin_.add_child(element)
+        Aduct.change_child_at_element(element, prov, "Child")
+        self.autosave.flush()
+        run_pending()
+
+        # A change of content made known by the provider is saved.
+        element.get_child().set_text("Changed")
+        prov.emit("child-props-changed", element.get_child())
+        self.assertIsNotNone(self.autosave.source)
+        self.autosave.flush()
+        run_pending()
+        with open(self.path) as fp:
+            self.assertIn("Changed", fp.read())
+
+        # A save writes the latest content, even if the provider did not tell of it.
+        self.bin_.get_props(use_cache=True)
+        element.get_child().set_text("Changed again")
+        Aduct.save_interface(self.bin_, self.path).join()
+        with open(self.path) as fp:
+            self.assertIn("Changed again", fp.read())
+
+    def test_save_interface(self):
+
+        self.bin_.add_child(Aduct.Element())
+        Aduct.save_interface(self.bin_, self.path).join()
+        props = self.bin_.get_props()
+
+        creator_maps = {
+            "type": {"bin": (Aduct.Bin, (), {}), "element": (Aduct.Element, (), {})}
+        }
+        init_maps = {"provider": {None: None}}
+        bin_ = Aduct.Bin()
+        bin_.add_child(Aduct.Element())
+        Aduct.load_interface(self.path, bin_, creator_maps, init_maps)
+        self.assertEqual(bin_.get_props()["child"], props)
+        bin_.destroy()
+
+    def test_save_interface_binary(self):
+
+        self.bin_.add_child(Aduct.Element())
+        Aduct.save_interface(self.bin_, self.path, codec="binary").join()
+
+        with open(self.path, "rb") as fp:
+            self.assertEqual(Aduct.Codec.load(fp), Aduct.get_interface(self.bin_))
+
+    def test_save_interface_deep(self):
+
+        self.bin_.add_child(make_deep(1500))
+        Aduct.save_interface(self.bin_, self.path).join()
+        with open(self.path, "rb") as fp:
+            self.assertEqual(fp.read(len(Aduct.Codec.MAGIC)), Aduct.Codec.MAGIC)
+            fp.seek(0)
+            saved = Aduct.Codec.load(fp)
+        saved.pop("version")
+
+        creator_maps = {
+            "type": {
+                "bin": (Aduct.Bin, (), {}),
+                "element": (Aduct.Element, (), {}),
+                "paned": (Aduct.Paned, (), {}),
+            }
+        }
+        init_maps = {"provider": {None: None}}
+        bin_ = Aduct.Bin()
+        Aduct.load_interface(self.path, bin_, creator_maps, init_maps)
+        # Comparing the dictionaries directly recurses, so their encodings are compared.
+        props = Aduct.Codec.dumps(bin_.get_props()["child"])
+        self.assertEqual(props, Aduct.Codec.dumps(saved))
+        bin_.destroy()
+
+    def test_save_interface_mode(self):
+
+        umask = os.umask(0o022)
+        os.umask(umask)
+        Aduct.save_interface(self.bin_, self.path).join()
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o666 & ~umask)
+
+        os.chmod(self.path, 0o640)
+        Aduct.save_interface(self.bin_, self.path).join()
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+
+if __name__ == "__main__":
+    unittest.main()
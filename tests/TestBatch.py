@@ -0,0 +1,79 @@
+import unittest
+
+import Aduct
+from Aduct import Batch
+from tests.TestElement import TestProvider
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+
+        self.prov = TestProvider()
+        self.top_level = Aduct.Bin()
+        self.notebook = Aduct.Notebook()
+        self.top_level.add_child(self.notebook)
+        self.n_changed = 0
+        self.top_level.connect("interface-changed", self.__handle_changed__)
+
+    def tearDown(self):
+
+        self.top_level.destroy()
+        self.top_level = None
+
+    def __handle_changed__(self, top_level):
+
+        self.n_changed += 1
+
+    def test_batch(self):
+
+        elements = [Aduct.Element() for i in range(5)]
+        with Aduct.batch(self.top_level):
+            for element in elements:
+                Aduct.add_to_notebook(element, self.notebook)
+                Aduct.change_child_at_element(element, self.prov, "Test Child")
+            self.assertEqual(self.n_changed, 0)
+            self.assertFalse(elements[0].get_visible())
+            self.assertEqual(self.notebook.get_tab_label(elements[0]).get_text(), "No child")
+
+        self.assertEqual(self.n_changed, 1)
+        self.assertTrue(elements[0].get_visible())
+        self.assertEqual(self.notebook.get_tab_label(elements[0]).get_text(), "Test Child")
+
+    def test_nested(self):
+
+        with Aduct.batch(self.top_level):
+            with Aduct.batch(self.top_level):
+                Aduct.add_to_notebook(Aduct.Element(), self.notebook)
+            self.assertEqual(self.n_changed, 0)
+        self.assertEqual(self.n_changed, 1)
+
+    def test_orphan(self):
+
+        # The parent of an orphan child is None, which is not shown.
+        paned = Aduct.Paned()
+        with Aduct.batch(self.top_level):
+            Aduct.add_to_paned(Aduct.Element(), Aduct.Element(), paned, 1)
+        self.assertIsNone(paned.get_parent())
+        paned.destroy()
+
+    def test_raise(self):
+
+        def change_child_label(child):
+            raise RuntimeError("Test")
+
+        element = Aduct.Element()
+        self.notebook.change_child_label = change_child_label
+        with self.assertRaises(RuntimeError):
+            with Aduct.batch(self.top_level):
+                Aduct.add_to_notebook(element, self.notebook)
+                Aduct.change_child_at_element(element, self.prov, "Test Child")
+
+        # Nothing is left for the next batch.
+        self.assertEqual(Batch.depth, 0)
+        self.assertEqual((Batch.changed, Batch.labels), ({}, {}))
+        self.assertEqual((Batch.to_show, Batch.top_levels), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
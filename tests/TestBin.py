@@ -1,6 +1,12 @@
+import importlib
+import os
+import tempfile
 import unittest
 import Aduct
 
+# Aduct.Plan is the class, so the module is taken from the import system.
+Plan = importlib.import_module("Aduct.Plan")
+
 
 def new_element():
 
@@ -33,22 +39,200 @@ class TestBin(unittest.TestCase):
         element_2 = new_element()
         self.assertRaises(ValueError, self.bin_.add_child, element_2)
 
+    def test_compile_interface(self):
+
+        creator_maps = {"type": {"bin": (Aduct.Bin, (), {}), "element": (new_element, (), {})}}
+        init_maps = {"provider": {None: None}}
+        element_props = {"type": "element", "provider": None, "child": {}}
+        interface_dict = {"type": "bin", "child": element_props}
+        Plan.cache.clear()
+
+        plan_1 = Aduct.compile_interface(interface_dict, creator_maps, init_maps)
+        plan_2 = Aduct.compile_interface(interface_dict, creator_maps, init_maps)
+        self.assertTrue(plan_1.linked)
+        self.assertEqual(plan_1.ops, plan_2.ops)
+        self.assertEqual(len(Plan.cache), 1)
+
+        # A name stands for the dictionary, which is then not looked at.
+        key = Plan.get_key(interface_dict, creator_maps, init_maps, "layout")
+        self.assertEqual(key, Plan.get_key({}, creator_maps, init_maps, "layout"))
+        Aduct.compile_interface(interface_dict, creator_maps, init_maps, name="layout")
+        self.assertIn(key, Plan.cache)
+
+        for idx in range(Plan.CACHE_SIZE):
+            Aduct.compile_interface({**interface_dict, "id": f"bin-{idx}"}, creator_maps, {})
+        self.assertEqual(len(Plan.cache), Plan.CACHE_SIZE)
+        self.assertNotIn(key, Plan.cache)
+        Plan.cache.clear()
+
+    def test_compile_interface_cache_dir(self):
+
+        creator_maps = {"type": {"bin": (Aduct.Bin, (), {}), "element": (new_element, (), {})}}
+        init_maps = {"provider": {None: None}}
+        element_props = {"type": "element", "provider": None, "child": {}}
+        interface_dict = {"type": "bin", "child": element_props}
+        Plan.cache.clear()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            plan = Aduct.compile_interface(interface_dict, creator_maps, init_maps, cache_dir)
+            key = Plan.get_key(interface_dict, creator_maps, init_maps)
+            path = os.path.join(cache_dir, f"{key}.json")
+            self.assertTrue(os.path.exists(path))
+
+            Plan.cache.clear()
+            loaded = Aduct.compile_interface(interface_dict, creator_maps, init_maps, cache_dir)
+            self.assertEqual(loaded.n_slots, plan.n_slots)
+
+            # A corrupt plan on disk is compiled again.
+            Plan.cache.clear()
+            with open(path, "w") as fp:
+                fp.write("{")
+            Aduct.compile_interface(interface_dict, creator_maps, init_maps, cache_dir)
+            self.assertEqual(Aduct.Plan.load(path).n_slots, plan.n_slots)
+        Plan.cache.clear()
+
     def test_get_props(self):
 
         self.bin_.add(self.element)
         obs_props = self.bin_.get_props()
-        exp_props = {
-            "type": "bin",
-            "child": {"type": "element", "provider": None, "child": {}},
-        }
+        element_props = {"type": "element", "id": self.element.get_id(), "provider": None}
+        element_props["child"] = {}
+        exp_props = {"type": "bin", "id": self.bin_.get_id(), "child": element_props}
         self.assertEqual(obs_props, exp_props)
 
     def test_get_props_empty(self):
 
         obs_props = self.bin_.get_props()
-        exp_props = {"type": "bin", "child": {}}
+        exp_props = {"type": "bin", "id": self.bin_.get_id(), "child": {}}
         self.assertEqual(obs_props, exp_props)
 
+    def test_patch_interface(self):
+
+        self.bin_.add_child(self.element)
+        creator_maps = {"type": {"element": (new_element, (), {})}}
+        init_maps = {"provider": {None: None}}
+        props = {"type": "element", "provider": None, "child": {}}
+
+        stats = Aduct.patch_interface(props, self.bin_, creator_maps, init_maps)
+        self.assertEqual(self.bin_.get_child(), self.element)
+        self.assertEqual(stats["kept"], 1)
+
+    def test_plan(self):
+
+        creator_maps = {"type": {"bin": (Aduct.Bin, (), {}), "element": (new_element, (), {})}}
+        init_maps = {"provider": {None: None}}
+        interface_dict = {
+            "type": "bin",
+            "child": {"type": "element", "provider": None, "child": {}},
+        }
+
+        plan = Aduct.Plan.compile(interface_dict, creator_maps, init_maps)
+        self.assertRaises(ValueError, plan.instantiate)
+        plan = plan.link(creator_maps, init_maps)
+        props_1 = plan.instantiate()
+        props_2 = plan.instantiate()
+        self.assertIsInstance(props_1["child"]["type"], Aduct.Element)
+        self.assertIsNot(props_1["child"]["type"], props_2["child"]["type"])
+        self.assertEqual(interface_dict["child"]["type"], "element")
+
+    def test_set_interface_atomic(self):
+
+        self.bin_.add_child(self.element)
+        made = []
+        destroyed = []
+
+        def new_view(view_type):
+            view = view_type()
+            made.append(view)
+            view.connect("destroy", destroyed.append)
+            return view
+
+        creator_maps = {
+            "type": {
+                "element": (new_element, (), {}),
+                "notebook": (new_view, (Aduct.Notebook,), {}),
+                "paned": (new_view, (Aduct.Paned,), {}),
+            }
+        }
+        init_maps = {"provider": {None: None}}
+        element_props = {"type": "element", "provider": None, "child": {}}
+        # The notebook has no action button, so setting its properties fails.
+        notebook_props = {
+            "type": "notebook",
+            "tab_position": 2,
+            "n_action_button": 1,
+            "elements": [element_props],
+        }
+        interface_dict = {
+            "type": "paned",
+            "children": [notebook_props, {}],
+            "orientation": 0,
+            "position": 100,
+            "version": 2,
+        }
+
+        self.assertRaises(
+            ValueError,
+            Aduct.set_interface,
+            interface_dict,
+            self.bin_,
+            creator_maps,
+            init_maps,
+            atomic=True,
+        )
+        self.assertIs(self.bin_.get_child(), self.element)
+        self.assertEqual(destroyed, made)
+
+    def test_set_interface_compiled_atomic(self):
+
+        self.bin_.add_child(self.element)
+        made = []
+        destroyed = []
+
+        def new_view(view_type):
+            if made:
+                raise ValueError("Test")
+            view = view_type()
+            made.append(view)
+            view.connect("destroy", destroyed.append)
+            return view
+
+        creator_maps = {"type": {"bin": (new_view, (Aduct.Bin,), {})}}
+        init_maps = {"provider": {None: None}}
+        interface_dict = {"type": "bin", "child": {"type": "bin", "child": {}}}
+
+        # The bin made before the failure is destroyed by the plan.
+        self.assertRaises(
+            ValueError,
+            Aduct.set_interface,
+            interface_dict,
+            self.bin_,
+            creator_maps,
+            init_maps,
+            atomic=True,
+            compiled=True,
+        )
+        self.assertIs(self.bin_.get_child(), self.element)
+        self.assertEqual(len(made), 1)
+        self.assertEqual(destroyed, made)
+
+    def test_set_interface_compiled(self):
+
+        creator_maps = {"type": {"bin": (Aduct.Bin, (), {}), "element": (new_element, (), {})}}
+        init_maps = {"provider": {None: None}}
+        element_props = {"type": "element", "provider": None, "child": {}}
+        interface_dict = {"type": "bin", "child": element_props}
+        Plan.cache.clear()
+
+        for _ in range(2):
+            Aduct.set_interface(interface_dict, self.bin_, creator_maps, init_maps, compiled=True)
+            child = self.bin_.get_child()
+            self.assertIsInstance(child, Aduct.Bin)
+            self.assertIsInstance(child.get_child(), Aduct.Element)
+        self.assertEqual(interface_dict["child"]["type"], "element")
+        self.assertEqual(len(Plan.cache), 1)
+        Plan.cache.clear()
+
     def test_remove_child(self):
 
         self.bin_.add_child(self.element)
@@ -0,0 +1,64 @@
+import unittest
+
+import Aduct
+from tests.TestElement import TestProvider
+
+
+class TestBudget(unittest.TestCase):
+
+    def setUp(self):
+
+        self.prov = TestProvider()
+        self.budget = Aduct.Budget(max_children=1)
+        self.element_1 = Aduct.Element(budget=self.budget)
+        self.element_2 = Aduct.Element(budget=self.budget)
+
+    def tearDown(self):
+
+        self.element_1.destroy()
+        self.element_2.destroy()
+        self.element_1 = None
+        self.element_2 = None
+        self.budget = None
+
+    def test_default(self):
+
+        default = Aduct.Budget.get_default()
+        element = Aduct.Element()
+        self.assertIs(element.budget, default)
+        self.assertNotIn(self.element_1, default.handlers)
+
+        element.set_child(self.prov.get_a_child("Test Child"))
+        self.assertIn(element, default.elements)
+        element.destroy()
+        self.assertNotIn(element, default.handlers)
+
+        element = Aduct.Element(budget=False)
+        self.assertIsNone(element.budget)
+        self.assertNotIn(element, default.handlers)
+        element.destroy()
+
+    def test_enforce(self):
+
+        self.element_1.set_child(self.prov.get_a_child("Test Child"))
+        self.element_2.set_child(self.prov.get_a_child("Test Child"))
+
+        self.assertEqual(self.budget.enforce(), 1)
+        self.assertTrue(self.element_1.is_child_pending())
+        self.assertFalse(self.element_2.is_child_pending())
+
+    def test_get_stats(self):
+
+        self.element_1.set_child(self.prov.get_a_child("Test Child"))
+        exp_stats = {"children": 1, "cost": 1, "evictions": 0}
+        self.assertEqual(self.budget.get_stats(), exp_stats)
+
+    def test_remove_element(self):
+
+        self.element_1.set_child(self.prov.get_a_child("Test Child"))
+        self.budget.remove_element(self.element_1)
+        self.assertEqual(self.budget.get_stats()["children"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
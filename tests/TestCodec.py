@@ -0,0 +1,64 @@
+import io
+import unittest
+
+from Aduct import Codec
+
+
+class TestCodec(unittest.TestCase):
+
+    def test_dumps(self):
+
+        props = {
+            "type": "notebook",
+            "tab_position": 2,
+            "n_action_button": 0,
+            "element_0": {"type": "element", "provider": None, "child": {}},
+            "element_1": {"type": "element", "provider": "Test Provider", "child": {"x": -1.5}},
+            "n_elements": 2,
+        }
+        self.assertEqual(Codec.loads(Codec.dumps(props)), props)
+
+    def test_dump_deep(self):
+
+        props = child_props = {}
+        for _ in range(5000):
+            child_props["child"] = {}
+            child_props = child_props["child"]
+
+        fp = io.BytesIO()
+        Codec.dump(props, fp)
+        fp.seek(0)
+        obs_props = Codec.load(fp)
+        depth = 0
+        while obs_props:
+            obs_props = obs_props["child"]
+            depth += 1
+        self.assertEqual(depth, 5000)
+
+    def test_dumps_err(self):
+
+        self.assertRaises(TypeError, Codec.dumps, {1: "one"})
+        self.assertRaises(TypeError, Codec.dumps, {"one": object()})
+
+    def test_load_short_reads(self):
+
+        class ShortReader(io.RawIOBase):
+            # Gives at most 3 bytes at a time, like a pipe.
+            def __init__(self, data):
+                self.data = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self.data.read(min(size, 3) if size >= 0 else 3)
+
+        props = {"type": "element", "provider": "Test Provider", "child": {"text": "x" * 100}}
+        self.assertEqual(Codec.load(ShortReader(Codec.dumps(props))), props)
+
+    def test_loads_err(self):
+
+        self.assertRaises(ValueError, Codec.loads, b'{"type": "bin"}')
+        self.assertRaises(ValueError, Codec.loads, Codec.dumps({"type": "bin"})[:-2])
+        self.assertRaises(ValueError, Codec.loads, Codec.dumps({"type": "bin"}) + b"\x00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,12 @@
+import asyncio
 import unittest
 
 import gi
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GObject
+from gi.repository import GLib, Gtk, GObject
 
 import Aduct
+from Aduct import Coroutine
 
 
 class TestProvider(Aduct.Provider):
@@ -54,9 +56,45 @@ class TestProvider(Aduct.Provider):
         return child_dict
 
 
+class TwoPhaseProvider(TestProvider):
+
+    def prepare(self, props):
+
+        return {**props, "child_label": props["child_label"].upper()}
+
+    def build(self, prepared):
+
+        return self.get_child_from_props(prepared)
+
+
+class CoroutineProvider(TestProvider):
+
+    async def get_child_from_props(self, props):
+
+        await asyncio.sleep(0)
+        return TestProvider.get_child_from_props(self, props)
+
+
+class FailingProvider(TestProvider):
+
+    async def get_child_from_props(self, props):
+
+        await asyncio.sleep(0)
+        raise RuntimeError("Test Error")
+
+
 prov = TestProvider()
 
 
+async def finish_request(element):
+
+    context = GLib.MainContext.default()
+    while element.request is not None:
+        while context.pending():
+            context.iteration(False)
+        await asyncio.sleep(0)
+
+
 class TestElement(unittest.TestCase):
 
     def setUp(self):
@@ -76,6 +114,92 @@ class TestElement(unittest.TestCase):
         self.element.clear_child()
         self.assertIsNone(self.element.get_child())
 
+    def test_coroutine_provider(self):
+
+        props = {
+            "type": self.element,
+            "provider": CoroutineProvider(),
+            "child": {
+                "child_name": "Test Child",
+                "child_label": "Test Label",
+                "header_label": "Test Header",
+            },
+        }
+        self.assertRaises(TypeError, self.element.set_from_props, dict(props))
+        self.assertIsNone(self.element.get_child())
+
+        asyncio.run(Coroutine.build_interface(props))
+        self.assertIn("built", props)
+        self.element.set_from_props(props)
+        self.assertNotIn("built", props)
+        self.assertEqual(self.element.get_child().get_text(), "Test Label")
+
+    def test_coroutine_provider_error(self):
+
+        errors = []
+        self.element.connect("child-failed", lambda element, error: errors.append(error))
+        props = {
+            "type": self.element,
+            "provider": FailingProvider(),
+            "child": {
+                "child_name": "Test Child",
+                "child_label": "Test Label",
+                "header_label": "Test Header",
+            },
+        }
+
+        async def set_from_props():
+            self.element.set_from_props_async(props)
+            await finish_request(self.element)
+
+        # The placeholder is removed and the error is reported.
+        asyncio.run(set_from_props())
+        self.assertIsNone(self.element.get_child_at(0, 1))
+        self.assertIsNone(self.element.child_name)
+        self.assertIsInstance(errors.pop(), RuntimeError)
+
+        # A deferred child that could not be built stays deferred.
+        element = Aduct.Element(lazy=True)
+        element.connect("child-failed", lambda element, error: errors.append(error))
+        element.set_from_props(props)
+        exp_props = element.get_props()
+
+        async def realize_child():
+            element.realize_child()
+            await finish_request(element)
+
+        asyncio.run(realize_child())
+        self.assertTrue(element.is_child_pending())
+        self.assertEqual(element.get_props(), exp_props)
+        self.assertIsInstance(errors.pop(), RuntimeError)
+        element.destroy()
+
+    def test_coroutine_realize_child(self):
+
+        element = Aduct.Element(lazy=True)
+        element.set_from_props({
+            "provider": CoroutineProvider(),
+            "child": {
+                "child_name": "Test Child",
+                "child_label": "Test Label",
+                "header_label": "Test Header",
+            },
+        })
+        exp_props = element.get_props()
+
+        async def realize_child():
+            element.realize_child()
+            # The deferred child is reported as it is till the built child lands.
+            self.assertIsNotNone(element.request)
+            self.assertEqual(element.get_props(), exp_props)
+            await asyncio.gather(Coroutine.wait_for_request(element), finish_request(element))
+
+        asyncio.run(realize_child())
+        self.assertFalse(element.is_child_pending())
+        self.assertEqual(element.get_child().get_text(), "Test Label")
+        self.assertEqual(element.get_props(), exp_props)
+        element.destroy()
+
     def test_get_props(self):
 
         child_dict = prov.get_a_child("Test Child")
@@ -83,6 +207,7 @@ class TestElement(unittest.TestCase):
 
         exp_props = {
             "type": "element",
+            "id": self.element.get_id(),
             "provider": "Test Provider",
             "child": {
                 "child_name": "Test Child",
@@ -93,6 +218,154 @@ class TestElement(unittest.TestCase):
         obs_props = self.element.get_props()
         self.assertEqual(obs_props, exp_props)
 
+    def test_get_props_cache(self):
+
+        child_dict = prov.get_a_child("Test Child")
+        self.element.set_child(child_dict)
+
+        props = self.element.get_props(use_cache=True)
+        self.assertIs(self.element.get_props(use_cache=True), props)
+        prov.emit("child-props-changed", self.element.get_child())
+        self.assertIsNot(self.element.get_props(use_cache=True), props)
+
+        props = self.element.get_props(use_cache=True)
+        self.element.clear_child()
+        obs_props = self.element.get_props(use_cache=True)
+        exp_props = {"type": "element", "id": self.element.get_id(), "provider": None, "child": {}}
+        self.assertEqual(obs_props, exp_props)
+
+    def test_hibernate(self):
+
+        child_dict = prov.get_a_child("Test Child")
+        self.element.set_child(child_dict)
+        exp_props = self.element.get_props()
+        stats = Aduct.Element.get_hibernation_stats()
+
+        self.assertTrue(self.element.hibernate())
+        self.assertTrue(self.element.is_child_pending())
+        self.assertEqual(self.element.get_props(), exp_props)
+        obs_stats = Aduct.Element.get_hibernation_stats()
+        self.assertEqual(obs_stats["reclaimed"], stats["reclaimed"] + 1)
+
+        self.element.realize_child()
+        self.assertEqual(self.element.get_props(), exp_props)
+        obs_stats = Aduct.Element.get_hibernation_stats()
+        self.assertEqual(obs_stats["restored"], stats["restored"] + 1)
+        self.assertEqual(obs_stats["reclaimed"], stats["reclaimed"])
+
+        self.assertTrue(self.element.hibernate())
+        self.element.destroy()
+        obs_stats = Aduct.Element.get_hibernation_stats()
+        self.assertEqual(obs_stats["reclaimed"], stats["reclaimed"])
+
+    def test_lazy_set_from_props(self):
+
+        element = Aduct.Element(lazy=True)
+        props = {
+            "type": element,
+            "provider": prov,
+            "child": {
+                "child_name": "Test Child",
+                "child_label": "Test Label",
+                "header_label": "Test Header",
+            },
+        }
+        element.set_from_props(props)
+        self.assertTrue(element.is_child_pending())
+        self.assertIsNone(element.get_child())
+        self.assertEqual(element.get_props()["child"], props["child"])
+        # Changing the given properties does not change the deferred child.
+        element.get_props()["child"]["child_label"] = "Changed Label"
+
+        element.realize_child()
+        self.assertFalse(element.is_child_pending())
+        self.assertEqual(element.get_child().get_text(), "Test Label")
+        element.destroy()
+
+    def test_lazy_realize_error(self):
+
+        element = Aduct.Element(lazy=True)
+        element.set_from_props({
+            "provider": prov,
+            "child": {"child_name": "Test Child", "header_label": "Test Header"},
+        })
+        exp_props = element.get_props()
+
+        # The provider raises as the label is missing, and the deferred child is kept.
+        self.assertRaises(KeyError, element.realize_child)
+        self.assertTrue(element.is_child_pending())
+        self.assertIsNotNone(element.get_child_at(0, 1))
+        self.assertEqual(element.get_props(), exp_props)
+        element.destroy()
+
+    def test_mark_dirty(self):
+
+        class PlainView(Aduct.View, Gtk.Box):
+            # A view of an application, without the interface-changed signal.
+            def __init__(self):
+                Gtk.Box.__init__(self)
+                Aduct.View.__init__(self)
+
+        view = PlainView()
+        view.add(self.element)
+        changes = []
+        self.element.connect("interface-changed", changes.append)
+        self.element.mark_dirty()
+        self.assertEqual(changes, [self.element])
+        view.remove(self.element)
+        view.destroy()
+
+    def test_prepare_interface(self):
+
+        props = {
+            "type": self.element,
+            "provider": TwoPhaseProvider(),
+            "child": {
+                "child_name": "Test Child",
+                "child_label": "Test Label",
+                "header_label": "Test Header",
+            },
+        }
+        Aduct.prepare_interface(props)
+        self.element.set_from_props(props)
+        self.assertNotIn("prepared", props)
+        self.assertEqual(self.element.get_child().get_text(), "TEST LABEL")
+
+    def test_recycle_child(self):
+
+        pool_prov = TestProvider(pool_size=1)
+        child_dict = pool_prov.get_a_child("Test Child")
+        child = child_dict["child"]
+        self.element.set_child(child_dict)
+
+        Aduct.change_child_at_element(self.element, pool_prov, "Test Child")
+        self.assertIs(self.element.get_child(), child)
+
+        exp_stats = {"hits": 1, "misses": 0, "size": 0, "limit": 1}
+        self.assertEqual(pool_prov.get_pool_stats(), exp_stats)
+
+    def test_recycle_child_evict(self):
+
+        pool_prov = TestProvider(pool_size=1)
+        for _ in range(2):
+            element = Aduct.Element()
+            element.set_child(pool_prov.get_a_child("Test Child"))
+            element.clear_child()
+
+        self.assertEqual(pool_prov.get_pool_stats()["size"], 1)
+
+    def test_recycle_child_max_pooled(self):
+
+        pool_prov = TestProvider(pool_size=2, max_pooled=2)
+        for child_name in ("Child 1", "Child 2", "Child 1", "Child 3"):
+            pool_prov.recycle_child(pool_prov.get_a_child(child_name))
+
+        # Child 2 is the least recently used name, so it is evicted first.
+        self.assertEqual(list(pool_prov.pool), ["Child 1", "Child 3"])
+        self.assertEqual(pool_prov.get_pool_stats()["size"], 2)
+        self.assertIsNotNone(pool_prov.get_recycled_child("Child 1"))
+        self.assertEqual(list(pool_prov.pool), ["Child 3"])
+
     def test_remove_child(self):
 
         child_dict = prov.get_a_child("Test Child")
@@ -115,6 +388,19 @@ class TestElement(unittest.TestCase):
         }
         self.assertEqual(obs_dict, child_dict)
 
+    def test_set_child_async(self):
+
+        self.element.set_child_async(prov, "Test Child 1")
+        self.element.set_child_async(prov, "Test Child 2")
+        self.assertIsNone(self.element.get_child())
+
+        context = GLib.MainContext.default()
+        while context.pending():
+            context.iteration(False)
+
+        self.assertEqual(self.element.get_child_name(), "Test Child 2")
+        self.assertIsNone(self.element.request)
+
     def test_set_from_props(self):
 
         props = {
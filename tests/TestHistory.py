@@ -0,0 +1,158 @@
+import unittest
+
+import Aduct
+from Aduct.History import History
+from tests.TestElement import TestProvider
+
+
+class TestHistory(unittest.TestCase):
+
+    def setUp(self):
+
+        self.prov = TestProvider()
+        self.top_level = Aduct.Bin()
+        self.root = Aduct.Bin()
+        self.element = Aduct.Element()
+        self.root.add_child(self.element)
+        self.top_level.add_child(self.root)
+        self.history = History(self.root)
+
+    def tearDown(self):
+
+        self.history.stop()
+        self.top_level.destroy()
+        self.history = None
+        self.top_level = None
+
+    def test_add_to_paned(self):
+
+        props = self.root.get_props()
+        paned = Aduct.Paned()
+        element = Aduct.Element()
+        Aduct.add_to_paned(self.element, element, paned, 1)
+        split_props = self.root.get_props()
+
+        self.assertTrue(self.history.undo())
+        self.assertEqual(self.root.get_props(), props)
+        self.assertIsNone(paned.get_parent())
+        self.assertEqual(self.history.n_kept, 2)
+
+        self.assertTrue(self.history.redo())
+        self.assertEqual(self.root.get_props(), split_props)
+        self.assertIs(paned.get_child2(), element)
+        self.assertEqual(self.history.n_kept, 0)
+        self.assertFalse(self.history.can_redo())
+
+    def test_max_depth(self):
+
+        self.history.set_property("max-depth", 2)
+        for child_name in ("Child 1", "Child 2", "Child 3"):
+            Aduct.change_child_at_element(self.element, self.prov, child_name)
+
+        self.assertTrue(self.history.undo())
+        self.assertTrue(self.history.undo())
+        self.assertFalse(self.history.undo())
+        self.assertEqual(self.element.get_child_name(), "Child 1")
+
+    def test_change_child(self):
+
+        Aduct.change_child_at_element(self.element, self.prov, "Child 1")
+        label = self.element.get_child()
+        label.set_text("Edited")
+        Aduct.change_child_at_element(self.element, self.prov, "Child 2")
+        self.assertEqual(self.history.n_kept, 1)
+
+        # The old child comes back with its state, not as a new one.
+        self.assertTrue(self.history.undo())
+        self.assertIs(self.element.get_child(), label)
+        self.assertEqual(label.get_text(), "Edited")
+        self.assertTrue(self.history.redo())
+        self.assertEqual(self.element.get_child_name(), "Child 2")
+        self.assertTrue(self.history.undo())
+        self.assertIs(self.element.get_child(), label)
+
+        # The kept children are cleared with the history.
+        cleared = []
+        self.prov.clear_child = lambda child_dict: cleared.append(child_dict["child_name"])
+        self.history.clear()
+        self.assertEqual(cleared, ["Child 2"])
+        self.assertEqual(self.history.n_kept, 0)
+
+    def test_max_kept(self):
+
+        self.history.set_property("max-kept", 1)
+        element_1 = Aduct.Element()
+        element_2 = Aduct.Element()
+        Aduct.replace_child(self.root, self.element, element_1)
+        Aduct.replace_child(self.root, element_1, element_2)
+
+        # Keeping both replaced elements crosses the limit, so the first replace is forgotten.
+        self.assertEqual(self.history.n_kept, 1)
+        self.assertTrue(self.history.undo())
+        self.assertFalse(self.history.undo())
+        self.assertIs(self.root.get_child(), element_1)
+
+    def test_remove_element(self):
+
+        paned = Aduct.Paned()
+        element = Aduct.Element()
+        Aduct.add_to_paned(self.element, element, paned, 2)
+        props = self.root.get_props()
+        Aduct.remove_element(element, paned)
+
+        self.assertIs(self.root.get_child(), self.element)
+        self.assertEqual(self.history.n_kept, 2)
+        self.history.undo()
+        self.assertEqual(self.root.get_props(), props)
+        self.assertIs(paned.get_child1(), element)
+
+    def test_remove_element_bin(self):
+
+        Aduct.change_child_at_element(self.element, self.prov, "Child")
+        label = self.element.get_child()
+        Aduct.remove_element(self.element, self.root)
+        self.assertIsNone(self.element.get_child_name())
+
+        self.assertTrue(self.history.undo())
+        self.assertIs(self.element.get_child(), label)
+        self.assertTrue(self.history.redo())
+        self.assertIsNone(self.element.get_child_name())
+        self.assertEqual(self.history.n_kept, 1)
+
+    def test_remove_element_lazy(self):
+
+        element = Aduct.Element(lazy=True)
+        Aduct.replace_child(self.root, self.element, element)
+        element.set_from_props({
+            "provider": self.prov,
+            "child": {"child_name": "Child", "child_label": "Label", "header_label": "Header"},
+        })
+        props = element.get_props()
+        n_kept = self.history.n_kept
+
+        # The observers after History see the element as it was, and nothing is built.
+        seen = []
+
+        def observer(name, target, **args):
+            seen.append(target.get_props())
+
+        Aduct.Operations.add_observer(observer)
+        try:
+            Aduct.remove_element(element, self.root)
+        finally:
+            Aduct.Operations.remove_observer(observer)
+        self.assertEqual(seen, [props])
+        self.assertIsNone(element.get_child_name())
+        self.assertEqual(self.history.n_kept, n_kept + 1)
+
+        # The deferred child comes back deferred.
+        self.assertTrue(self.history.undo())
+        self.assertTrue(element.is_child_pending())
+        self.assertEqual(element.get_props(), props)
+        self.assertTrue(self.history.redo())
+        self.history.clear()
+        self.assertEqual(self.history.n_kept, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+from gi.repository import Gdk
+
+import Aduct
+from Aduct import GLib
+from Aduct.Journal import Journal
+from tests.TestElement import TestProvider
+
+
+def run_pending():
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "aduct.journal")
+        self.prov = TestProvider()
+        self.creator_maps = {
+            "type": {
+                "bin": (Aduct.Bin, (), {}),
+                "element": (Aduct.Element, (), {}),
+                "notebook": (Aduct.Notebook, (), {}),
+                "paned": (Aduct.Paned, (), {}),
+            }
+        }
+        self.init_maps = {"provider": {"Test Provider": self.prov, None: None}}
+
+        self.top_level = Aduct.Bin()
+        self.root = Aduct.Bin()
+        self.element = Aduct.Element()
+        self.root.add_child(self.element)
+        self.top_level.add_child(self.root)
+        self.journal = Journal(self.root, self.path)
+
+    def tearDown(self):
+
+        self.journal.stop()
+        self.top_level.destroy()
+        self.directory.cleanup()
+        self.journal = None
+        self.top_level = None
+
+    def test_compact(self):
+
+        self.journal.set_property("max-ops", 2)
+        paned = Aduct.Paned()
+        Aduct.add_to_paned(self.element, Aduct.Element(), paned, 1)
+        paned.set_position(40)
+        run_pending()
+        # Waits for the snapshot written in a thread.
+        self.journal.flush()
+
+        self.assertEqual(self.journal.n_ops, 0)
+        with open(self.path) as fp:
+            self.assertEqual(len(fp.readlines()), 1)
+
+    def test_destroy(self):
+
+        journal = Journal(self.element, os.path.join(self.directory.name, "element.journal"))
+        self.element.destroy()
+        self.assertIsNone(journal.fp)
+        # Stopping it again does nothing.
+        journal.stop()
+
+    def test_other_top_level(self):
+
+        # A change it can not follow, but made under another top level, is not snapshotted.
+        top_level = Aduct.Bin()
+        Aduct.Operations.notify("normalize", top_level)
+        self.assertIsNone(self.journal.compact_source)
+        top_level.destroy()
+
+        Aduct.Operations.notify("normalize", self.top_level)
+        self.assertIsNotNone(self.journal.compact_source)
+
+    def test_resize(self):
+
+        paned = Aduct.Paned()
+        Aduct.add_to_paned(self.element, Aduct.Element(), paned, 1)
+        paned.set_position(500)
+        self.journal.flush()
+        n_ops = self.journal.n_ops
+
+        allocation = Gdk.Rectangle()
+        allocation.width = allocation.height = 100
+        paned.size_allocate(allocation)
+        self.assertEqual(self.journal.n_ops, n_ops)
+        self.assertEqual(self.journal.records, [])
+
+    def test_restore(self):
+
+        paned = Aduct.Paned()
+        Aduct.add_to_paned(self.element, Aduct.Element(), paned, 1)
+        paned.set_position(40)
+        paned.set_position(60)
+        Aduct.change_child_at_element(self.element, self.prov, "Test Child")
+        # The state of child is restored as it is when appended.
+        self.element.get_child().set_text("Edited")
+        self.journal.flush()
+
+        with open(self.path) as fp:
+            ops = [line for line in fp.readlines()]
+        self.assertEqual(len(ops), 4)
+
+        # The restored widgets take over the ids of the live ones.
+        props = self.root.get_props()
+        top_level = Aduct.Bin()
+        root = Journal.restore(self.path, top_level, self.creator_maps, self.init_maps)
+        self.assertEqual(root.get_props(), props)
+        top_level.destroy()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+
+from gi.repository import Gdk
+
+import Aduct
+from Aduct import GLib
+from Aduct.History import History
+from Aduct.Normalize import Normalizer
+from tests.TestElement import TestProvider
+
+
+def run_pending():
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+
+def set_width(widget, width):
+    allocation = Gdk.Rectangle()
+    allocation.x, allocation.y, allocation.width, allocation.height = 0, 0, width, 100
+    widget.size_allocate(allocation)
+
+
+class TestNormalize(unittest.TestCase):
+
+    def setUp(self):
+
+        self.prov = TestProvider()
+        self.top_level = Aduct.Bin()
+        self.elements = [Aduct.Element() for idx in range(3)]
+
+    def tearDown(self):
+
+        self.top_level.destroy()
+        self.top_level = None
+
+    def test_merge_paneds(self):
+
+        # Splitting a panel twice makes two nested paneds of the same orientation.
+        outer = Aduct.Paned()
+        inner = Aduct.Paned()
+        inner.add_child(self.elements[1], 1)
+        inner.add_child(self.elements[2], 2)
+        outer.add_child(self.elements[0], 1)
+        outer.add_child(inner, 2)
+        self.top_level.add_child(outer)
+        self.top_level.map()
+        for element, width in zip(self.elements, (100, 200, 100)):
+            set_width(element, width)
+
+        self.assertEqual(Aduct.normalize(self.top_level), {"removed": 0, "added": 0})
+        stats = Aduct.normalize(self.top_level, merge_paneds=True)
+        self.assertEqual(stats, {"removed": 2, "added": 1})
+        tiles = self.top_level.get_child()
+        self.assertEqual(tiles.get_type(), "tiles")
+        self.assertEqual(tiles.get_children(), self.elements)
+        self.assertEqual(tiles.get_weights(), [100, 200, 100])
+
+    def test_normalize(self):
+
+        element = self.elements[0]
+        Aduct.change_child_at_element(element, self.prov, "Test Child")
+        child = element.get_child()
+        bin_ = Aduct.Bin()
+        paned = Aduct.Paned()
+        notebook = Aduct.Notebook()
+        notebook.add_child(element)
+        paned.add_child(notebook, 1)
+        bin_.add_child(paned)
+        self.top_level.add_child(bin_)
+
+        self.assertEqual(Aduct.normalize(self.top_level, keep=[bin_])["removed"], 2)
+        self.assertIs(bin_.get_child(), element)
+        self.assertEqual(Aduct.normalize(self.top_level), {"removed": 1, "added": 0})
+        self.assertIs(self.top_level.get_child(), element)
+        # The element is moved, its child is not built again.
+        self.assertIs(element.get_child(), child)
+
+    def test_normalizer(self):
+
+        root = Aduct.Bin()
+        root.add_child(self.elements[0])
+        self.top_level.add_child(root)
+        history = History(root)
+        normalizer = Normalizer(self.top_level, keep=[root])
+
+        Aduct.change_child_at_element(self.elements[0], self.prov, "Test Child")
+        run_pending()
+        # Nothing is removed, so the history is not cleared.
+        self.assertEqual(normalizer.removed, 0)
+        self.assertTrue(history.can_undo())
+
+        paned = Aduct.Paned()
+        Aduct.add_to_paned(self.elements[0], self.elements[1], paned, 1)
+        Aduct.remove_element(self.elements[1], paned)
+        tiles = Aduct.Tiles()
+        Aduct.replace_child(root, self.elements[0], tiles)
+        tiles.add_child(self.elements[0])
+        run_pending()
+        self.assertEqual(normalizer.removed, 1)
+        self.assertIs(root.get_child(), self.elements[0])
+        self.assertFalse(history.can_undo())
+
+        normalizer.stop()
+        history.stop()
+
+    def test_tiles(self):
+
+        outer = Aduct.Tiles()
+        inner = Aduct.Tiles()
+        inner.add_child(self.elements[1], -1, 1)
+        inner.add_child(self.elements[2], -1, 3)
+        outer.add_child(self.elements[0])
+        outer.add_child(inner, -1, 2)
+        self.top_level.add_child(outer)
+
+        self.assertEqual(Aduct.normalize(self.top_level)["removed"], 1)
+        self.assertEqual(outer.get_children(), self.elements)
+        self.assertEqual(outer.get_weights(), [1.0, 0.5, 1.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
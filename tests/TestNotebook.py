@@ -1,6 +1,7 @@
 import unittest
 import Aduct
-from Aduct import Gtk
+from Aduct import Gtk, Walk
+from tests.TestElement import TestProvider
 
 
 def new_element():
@@ -70,19 +71,73 @@ class TestNotebook(unittest.TestCase):
 
     def test_get_props(self):
 
+        element_2 = new_element()
         self.notebook.add_child(self.element)
-        self.notebook.add_child(new_element())
+        self.notebook.add_child(element_2)
         exp_props = {
             "type": "notebook",
+            "id": self.notebook.get_id(),
             "tab_position": 2,
             "n_action_button": 0,
-            "element_0": {"type": "element", "provider": None, "child": {}},
-            "element_1": {"type": "element", "provider": None, "child": {}},
-            "n_elements": 2,
+            "elements": [
+                {"type": "element", "id": self.element.get_id(), "provider": None, "child": {}},
+                {"type": "element", "id": element_2.get_id(), "provider": None, "child": {}},
+            ],
         }
         obs_props = self.notebook.get_props()
         self.assertEqual(exp_props, obs_props)
 
+    def test_patch_interface(self):
+
+        def page(idx, label="Label"):
+            child = {"child_name": f"Page {idx}", "child_label": label, "header_label": "Header"}
+            props = {"type": "element", "id": f"page-{idx}", "provider": "Test Provider"}
+            return {**props, "child": child}
+
+        creator_maps = {
+            "type": {
+                "bin": (Aduct.Bin, (), {}),
+                "element": (new_element, (), {}),
+                "notebook": (Aduct.Notebook, (), {}),
+            }
+        }
+        init_maps = {"provider": {"Test Provider": TestProvider()}}
+        props = {
+            "version": 2,
+            "type": "notebook",
+            "id": "pages",
+            "tab_position": 2,
+            "n_action_button": 0,
+            "elements": [page(idx) for idx in range(5)],
+        }
+        top_level = Aduct.Bin()
+        Aduct.set_interface(Walk.copy_props(props), top_level, creator_maps, init_maps)
+        notebook = top_level.get_child()
+        pages = [notebook.get_nth_page(idx) for idx in range(5)]
+
+        # A page is inserted at the front, one is removed and one is changed.
+        props["elements"] = [page(5), page(0), page(1), page(3, "Changed"), page(4)]
+        stats = Aduct.patch_interface(props, top_level, creator_maps, init_maps)
+        self.assertEqual(stats, {"kept": 3, "updated": 2, "built": 1, "removed": 1})
+        self.assertIs(top_level.get_child(), notebook)
+        obs_pages = [notebook.get_nth_page(idx) for idx in range(1, 5)]
+        self.assertEqual(obs_pages, [pages[0], pages[1], pages[3], pages[4]])
+        self.assertEqual(pages[3].get_child().get_text(), "Changed")
+        self.assertEqual(Aduct.get_interface(notebook), props)
+
+        # The pages are moved, not rebuilt.
+        props["elements"].reverse()
+        stats = Aduct.patch_interface(props, top_level, creator_maps, init_maps)
+        self.assertEqual(stats, {"kept": 5, "updated": 1, "built": 0, "removed": 0})
+        self.assertEqual(notebook.get_nth_page(0), pages[4])
+        self.assertEqual(Aduct.get_interface(notebook), props)
+
+        # A view of other type replaces the notebook.
+        stats = Aduct.patch_interface({"type": "bin", "child": {}}, top_level, creator_maps, {})
+        self.assertEqual(stats, {"kept": 0, "updated": 0, "built": 1, "removed": 0})
+        self.assertIsInstance(top_level.get_child(), Aduct.Bin)
+        top_level.destroy()
+
     def test_remove_child(self):
 
         self.notebook.add_child(self.element)
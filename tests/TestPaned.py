@@ -1,6 +1,11 @@
 import unittest
+
+import cairo
+from gi.repository import Gdk
+
 import Aduct
-from Aduct import Gtk
+from Aduct import GLib, Gtk, Operations
+from tests.TestElement import TestProvider
 
 
 def new_element():
@@ -48,8 +53,11 @@ class TestPaned(unittest.TestCase):
 
         exp_props = {
             "type": "paned",
-            "child_1": {"type": "element", "provider": None, "child": {}},
-            "child_2": {"type": "element", "provider": None, "child": {}},
+            "id": self.paned.get_id(),
+            "children": [
+                {"type": "element", "id": self.element_1.get_id(), "provider": None, "child": {}},
+                {"type": "element", "id": self.element_2.get_id(), "provider": None, "child": {}},
+            ],
             "orientation": 0,
             "position": self.paned.get_position(),
         }
@@ -57,6 +65,42 @@ class TestPaned(unittest.TestCase):
 
         self.assertEqual(exp_props, obs_props)
 
+    def test_get_props_cache(self):
+
+        self.paned.add_child(self.element_1, 1)
+        self.paned.add_child(self.element_2, 2)
+
+        props = self.paned.get_props(use_cache=True)
+        self.assertIs(self.paned.get_props(use_cache=True), props)
+        self.element_2.mark_dirty()
+        obs_props = self.paned.get_props(use_cache=True)
+        self.assertIsNot(obs_props, props)
+        self.assertIs(obs_props["children"][0], props["children"][0])
+
+    def test_interface_path(self):
+
+        self.paned.add_child(self.element_1)
+        self.paned.add_child(self.element_2)
+        element_props = {**self.element_2.get_props(), "version": 2}
+        self.assertEqual(Aduct.get_interface(self.paned, path="paned/child_2"), element_props)
+        self.assertEqual(Aduct.get_interface(self.paned, path=[1]), element_props)
+        path = f"#{self.element_2.get_id()}"
+        self.assertIs(Aduct.get_widget_at_path(self.paned, path), self.element_2)
+        self.assertIsNone(Aduct.get_widget_at_path(self.paned, "notebook/child_2"))
+
+        creator_maps = {"type": {"element": (new_element, (), {})}}
+        init_maps = {"provider": {None: None}}
+        old_child = Aduct.set_interface(
+            element_props, self.paned, creator_maps, init_maps, path="child_2"
+        )
+        self.assertIs(old_child, self.element_2)
+        self.assertIsNot(self.paned.get_child2(), self.element_2)
+        self.assertEqual(self.paned.get_child2().get_id(), element_props["id"])
+        self.assertRaises(
+            ValueError, Aduct.set_interface, element_props, self.paned, creator_maps, init_maps,
+            path=""
+        )
+
     def test_remove_child(self):
 
         self.paned.add_child(self.element_1)
@@ -94,6 +138,155 @@ class TestPaned(unittest.TestCase):
             ValueError, self.paned.replace_child, self.element_2, n_element
         )
 
+    def test_snapshot(self):
+
+        window = Gtk.OffscreenWindow()
+        window.add(self.paned)
+        self.paned.add_child(self.element_1, 1)
+        self.paned.add_child(self.element_2, 2)
+        self.paned.set_position(100)
+        window.show_all()
+        allocation = Gdk.Rectangle()
+        allocation.x, allocation.y, allocation.width, allocation.height = 0, 0, 405, 100
+        self.paned.size_allocate(allocation)
+        ops = []
+        observer = lambda name, target, **args: ops.append((name, args))
+        Operations.add_observer(observer)
+
+        # Without a snapshot, the children are moved at once.
+        self.paned.set_position(150)
+        self.assertEqual(ops, [("set_position", {"position": 150})])
+        self.paned.size_allocate(allocation)
+
+        ops.clear()
+        self.paned.set_property("resize-mode", "scale")
+        self.assertTrue(self.paned.begin_snapshot())
+        self.assertFalse(self.paned.begin_snapshot())
+        for position in (200, 250, 300):
+            self.paned.set_position(position)
+        self.paned.size_allocate(allocation)
+        # The children keep their size and are drawn as images, till the snapshot ends.
+        self.assertEqual(self.element_1.get_allocated_width(), 150)
+        # The position is taken once a frame.
+        self.assertEqual(self.paned.snapshot["position"], 150)
+        context = GLib.MainContext.default()
+        for idx in range(100):
+            if self.paned.snapshot["position"] == 300:
+                break
+            context.iteration(True)
+        self.assertEqual(self.paned.snapshot["position"], 300)
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 405, 100)
+        self.assertTrue(self.paned.__handle_draw__(self.paned, cairo.Context(surface)))
+        self.assertEqual(ops, [])
+
+        self.paned.end_snapshot()
+        self.assertIsNone(self.paned.snapshot)
+        self.assertEqual(ops, [("set_position", {"position": 300})])
+        self.paned.size_allocate(allocation)
+        self.assertEqual(self.element_1.get_allocated_width(), 300)
+
+        self.paned.set_property("resize-mode", "stretch")
+        self.assertRaises(ValueError, self.paned.begin_snapshot)
+        Operations.remove_observer(observer)
+        window.remove(self.paned)
+        window.destroy()
+
+    def test_set_interface_incremental(self):
+
+        class BrokenProvider(TestProvider):
+            def get_child_from_props(self, props):
+                raise RuntimeError("Broken child")
+
+        creator_maps = {"type": {"paned": (Aduct.Paned, (), {}), "element": (new_element, (), {})}}
+        init_maps = {"provider": {"Test": TestProvider(), "Broken": BrokenProvider()}}
+        element_props = {
+            "type": "element",
+            "provider": "Test",
+            "child": {"child_name": "Child", "child_label": "Label", "header_label": "Header"},
+        }
+        paned_props = {"type": "paned", "orientation": 0, "position": 20}
+        interface_dict = {
+            **paned_props,
+            "child_1": element_props,
+            "child_2": {**paned_props, "child_1": element_props, "child_2": element_props},
+        }
+        top_level = Aduct.Bin()
+        progress, results, ops = [], [], []
+
+        def observer(name, target, **args):
+            if name != "set_position":
+                ops.append((name, args, top_level.get_child()))
+
+        Operations.add_observer(observer)
+
+        Aduct.set_interface_incremental(
+            interface_dict,
+            top_level,
+            creator_maps,
+            init_maps,
+            frame_budget=0,
+            progress_callback=lambda n_done, n_total: progress.append((n_done, n_total)),
+            complete_callback=results.append,
+        )
+        context = GLib.MainContext.default()
+        while not results and context.iteration(False):
+            pass
+        self.assertEqual(results, [None])
+        self.assertEqual(progress, [(idx, 5) for idx in range(1, 6)])
+        root = top_level.get_child()
+        self.assertEqual(root.get_child2().get_child1().get_child().get_text(), "Label")
+        interface = Aduct.get_interface(root)
+        self.assertEqual(interface["children"][1]["children"][1]["child"]["child_name"], "Child")
+        # Notified once the interface is built, not when its root is added.
+        self.assertEqual(ops, [("set_interface", {"child": root, "old_child": None}, root)])
+
+        ops.clear()
+        errors, made, destroyed = [], [], []
+
+        def new_paned():
+            paned = Aduct.Paned()
+            made.append(paned)
+            paned.connect("destroy", destroyed.append)
+            return paned
+
+        creator_maps["type"]["paned"] = (new_paned, (), {})
+        interface_dict["child_2"]["child_1"] = {**element_props, "provider": "Broken"}
+        Aduct.set_interface_incremental(
+            interface_dict,
+            top_level,
+            creator_maps,
+            init_maps,
+            frame_budget=0,
+            complete_callback=results.append,
+            error_callback=errors.append,
+        )
+        while not errors and context.iteration(False):
+            pass
+        self.assertIsInstance(errors[0], RuntimeError)
+        self.assertFalse(context.pending())
+        self.assertEqual(results, [None])
+        # The previous interface is put back and the part built is destroyed.
+        self.assertIs(top_level.get_child(), root)
+        self.assertEqual(len(made), 2)
+        self.assertEqual(destroyed, made)
+        self.assertEqual(ops, [])
+        Operations.remove_observer(observer)
+        top_level.destroy()
+
+    def test_set_own_props(self):
+
+        props = {
+            "type": self.paned,
+            "child_1": {"type": self.element_1, "provider": None, "child": {}},
+            "child_2": {},
+            "orientation": 1,
+            "position": 20,
+        }
+        children = self.paned.set_own_props(props)
+        self.assertEqual(children, [(self.element_1, props["child_1"])])
+        self.assertEqual(self.paned.get_child1(), self.element_1)
+        self.assertEqual(self.paned.get_orientation(), 1)
+
     def test_set_from_props(self):
 
         props = {
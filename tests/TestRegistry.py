@@ -0,0 +1,59 @@
+import unittest
+
+import Aduct
+from tests.TestElement import TestProvider
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+
+        self.prov = TestProvider()
+        self.top_level = Aduct.Bin()
+        self.notebook = Aduct.Notebook()
+        self.top_level.add_child(self.notebook)
+        self.elements = [Aduct.Element() for i in range(3)]
+        for element in self.elements:
+            self.notebook.add_child(element)
+
+    def tearDown(self):
+
+        self.top_level.destroy()
+        self.top_level = None
+
+    def test_find_elements(self):
+
+        Aduct.change_child_at_element(self.elements[0], self.prov, "Child 1")
+        Aduct.change_child_at_element(self.elements[1], self.prov, "Child 2")
+
+        found = Aduct.find_elements(provider=self.prov, top_level=self.top_level)
+        self.assertEqual(set(found), set(self.elements[:2]))
+        found = Aduct.find_elements(provider="Test Provider", child_name="Child 2")
+        self.assertEqual(found, [self.elements[1]])
+
+        self.elements[1].clear_child()
+        self.assertEqual(Aduct.find_elements(child_name="Child 2"), [])
+        found = Aduct.find_elements(predicate=lambda element: element.get_child_name() is None,
+                                    top_level=self.top_level)
+        self.assertEqual(set(found), set(self.elements[1:]))
+
+    def test_find_views(self):
+
+        self.assertEqual(Aduct.find_views("notebook", self.top_level), [self.notebook])
+        self.assertEqual(set(Aduct.find_views(top_level=self.top_level)),
+                         {self.top_level, self.notebook})
+
+    def test_get_by_id(self):
+
+        element = self.elements[0]
+        self.assertIs(Aduct.get_by_id(element.get_id()), element)
+        element.set_id("main")
+        self.assertIs(Aduct.get_by_id("main"), element)
+        self.assertRaises(ValueError, self.elements[1].set_id, "main")
+
+        element.destroy()
+        self.assertIsNone(Aduct.get_by_id("main"))
+
+
+if __name__ == "__main__":
+    unittest.main()
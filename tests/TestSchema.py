@@ -0,0 +1,46 @@
+import unittest
+
+from Aduct import Schema
+
+
+def new_props_v1():
+    element = {"type": "element", "provider": "Test Provider", "child": {"child_name": "A"}}
+    notebook = {
+        "type": "notebook",
+        "tab_position": 2,
+        "n_action_button": 0,
+        "element_0": element,
+        "n_elements": 1,
+    }
+    paned = {"type": "paned", "child_1": notebook, "child_2": {}, "orientation": 0, "position": 5}
+    return {"type": "bin", "child": paned}
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_downgrade(self):
+
+        props = new_props_v1()
+        self.assertEqual(Schema.downgrade(Schema.upgrade(props)), props)
+
+    def test_upgrade(self):
+
+        props = new_props_v1()
+        obs_props = Schema.upgrade(props)
+
+        self.assertEqual(obs_props["version"], 2)
+        paned = obs_props["child"]
+        self.assertEqual(paned["children"][1], {})
+        notebook = paned["children"][0]
+        self.assertEqual(notebook["elements"], [props["child"]["child_1"]["element_0"]])
+        self.assertNotIn("n_elements", notebook)
+        self.assertEqual(props, new_props_v1())
+        self.assertIs(Schema.upgrade(obs_props), obs_props)
+
+    def test_upgrade_err(self):
+
+        self.assertRaises(ValueError, Schema.upgrade, {"type": "bin", "child": {}, "version": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+
+from gi.repository import Gdk
+
+import Aduct
+from Aduct import Schema
+from Aduct.History import History
+
+
+def new_element():
+    element = Aduct.Element()
+    return element
+
+
+class TestTiles(unittest.TestCase):
+
+    def setUp(self):
+
+        self.element_1 = new_element()
+        self.element_2 = new_element()
+        self.tiles = Aduct.Tiles()
+
+    def tearDown(self):
+
+        self.element_1.destroy()
+        self.element_2.destroy()
+        self.tiles.destroy()
+
+        self.element_1 = None
+        self.element_2 = None
+        self.tiles = None
+
+    def test_add_child(self):
+
+        self.tiles.add_child(self.element_1)
+        self.tiles.add_child(self.element_2, 0, 3)
+
+        self.assertEqual(self.tiles.get_children(), [self.element_2, self.element_1])
+        self.assertEqual(self.tiles.get_weights(), [3, 1.0])
+        self.assertRaises(ValueError, self.tiles.add_child, new_element(), -1, 0)
+
+    def test_add_to_tiles(self):
+
+        top_level = Aduct.Bin()
+        top_level.add_child(self.element_1)
+        tiles = Aduct.add_to_tiles(self.element_1, self.element_2, self.tiles, 1)
+        self.assertIs(tiles, self.tiles)
+        self.assertIs(top_level.get_child(), self.tiles)
+
+        # Splitting again adds a sibling instead of nesting another view.
+        element_3 = new_element()
+        other_tiles = Aduct.Tiles()
+        tiles = Aduct.add_to_tiles(self.element_1, element_3, other_tiles, 2)
+        self.assertIs(tiles, self.tiles)
+        self.assertIsNone(other_tiles.get_parent())
+        self.assertEqual(self.tiles.get_children(), [element_3, self.element_1, self.element_2])
+        self.assertEqual(self.tiles.get_weights(), [0.5, 0.5, 1.0])
+
+        Aduct.remove_element(element_3, self.tiles)
+        Aduct.remove_element(self.element_2, self.tiles)
+        self.assertIs(top_level.get_child(), self.element_1)
+
+        other_tiles.destroy()
+        top_level.destroy()
+
+    def test_get_props(self):
+
+        self.tiles.add_child(self.element_1)
+        self.tiles.add_child(self.element_2, -1, 2)
+
+        exp_props = {
+            "type": "tiles",
+            "id": self.tiles.get_id(),
+            "children": [
+                {"type": "element", "id": self.element_1.get_id(), "provider": None, "child": {}},
+                {"type": "element", "id": self.element_2.get_id(), "provider": None, "child": {}},
+            ],
+            "orientation": 0,
+            "weights": [1.0, 2],
+        }
+        self.assertEqual(self.tiles.get_props(), exp_props)
+
+        props = {**exp_props, "version": 2}
+        self.assertEqual(Schema.downgrade(props)["n_children"], 2)
+        self.assertEqual(Schema.upgrade(Schema.downgrade(props)), props)
+        self.assertIs(Aduct.get_widget_at_path(self.tiles, "tiles/child_2"), self.element_2)
+
+    def test_history(self):
+
+        top_level = Aduct.Bin()
+        top_level.add_child(self.tiles)
+        self.tiles.add_child(self.element_1)
+        history = History(top_level)
+
+        Aduct.add_to_tiles(self.element_1, self.element_2, Aduct.Tiles(), 1)
+        self.assertEqual(self.tiles.get_weights(), [0.5, 0.5])
+        self.assertTrue(history.undo())
+        self.assertEqual(self.tiles.get_children(), [self.element_1])
+        self.assertEqual(self.tiles.get_weights(), [1.0])
+        self.assertTrue(history.redo())
+        self.assertEqual(self.tiles.get_children(), [self.element_1, self.element_2])
+
+        history.stop()
+        top_level.destroy()
+
+    def test_replace_child(self):
+
+        self.tiles.add_child(self.element_1, -1, 2)
+        self.tiles.add_child(self.element_2)
+
+        n_element = new_element()
+        self.tiles.replace_child(self.element_1, n_element)
+        self.assertEqual(self.tiles.get_children(), [n_element, self.element_2])
+        self.assertEqual(self.tiles.get_weights(), [2, 1.0])
+        self.assertRaises(ValueError, self.tiles.replace_child, self.element_1, new_element())
+
+    def test_set_from_props(self):
+
+        props = {
+            "type": self.tiles,
+            "children": [
+                {"type": self.element_1, "provider": None, "child": {}},
+                {"type": self.element_2, "provider": None, "child": {}},
+            ],
+            "orientation": 1,
+            "weights": [1, 3],
+        }
+        self.tiles.set_from_props(props)
+        self.assertEqual(self.tiles.get_children(), [self.element_1, self.element_2])
+        self.assertEqual(self.tiles.get_orientation(), 1)
+        self.assertEqual(self.tiles.get_weights(), [1, 3])
+
+    def test_size_allocate(self):
+
+        self.tiles.add_child(self.element_1)
+        self.tiles.add_child(self.element_2, -1, 3)
+        self.tiles.show_all()
+        allocation = Gdk.Rectangle()
+        allocation.x, allocation.y, allocation.width, allocation.height = 0, 0, 400, 100
+        self.tiles.size_allocate(allocation)
+
+        self.assertEqual(self.element_1.get_allocated_width(), 100)
+        self.assertEqual(self.element_2.get_allocated_width(), 300)
+        self.assertEqual(self.element_2.get_allocation().x, 100)
+        self.assertRaises(ValueError, self.tiles.set_weights, [1])
+        self.assertRaises(ValueError, self.tiles.set_weights, [1, -1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import unittest
+
+import Aduct
+from Aduct import GLib, Gtk, Walk
+from Aduct.History import History
+from tests.TestElement import TestProvider
+
+
+def run_pending():
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+
+def make_props(n_pages):
+    elements = [
+        {
+            "type": "element",
+            "id": f"page-{idx}",
+            "provider": "Test Provider",
+            "child": {
+                "child_name": f"Page {idx}",
+                "child_label": f"Label {idx}",
+                "header_label": "Header",
+            },
+        }
+        for idx in range(n_pages)
+    ]
+    return {
+        "version": 2,
+        "type": "notebook",
+        "id": "pages",
+        "tab_position": 2,
+        "n_action_button": 0,
+        "elements": elements,
+    }
+
+
+class TestVirtualNotebook(unittest.TestCase):
+
+    def setUp(self):
+
+        self.prov = TestProvider()
+        self.creator_maps = {
+            "type": {
+                "element": (Aduct.Element, (), {}),
+                "notebook": (Aduct.VirtualNotebook, (), {}),
+            }
+        }
+        self.init_maps = {"provider": {"Test Provider": self.prov, None: None}}
+        self.props = make_props(100)
+        self.top_level = Aduct.Bin()
+        Aduct.set_interface(
+            Walk.copy_props(self.props), self.top_level, self.creator_maps, self.init_maps
+        )
+        self.notebook = self.top_level.get_child()
+
+    def tearDown(self):
+
+        self.top_level.destroy()
+        self.top_level = None
+        self.notebook = None
+
+    def test_page_list(self):
+
+        self.notebook.set_property("max-results", 4)
+        self.assertEqual(self.notebook.find_pages("PAGE 1"), [1, 10, 11, 12])
+
+        self.notebook.page_search.set_text("page 99")
+        self.notebook.show_page_list(Gtk.Button())
+        rows = self.notebook.page_list.get_children()
+        self.assertEqual([row.page_index for row in rows], [99])
+        self.notebook.page_list.emit("row-activated", rows[0])
+        self.assertEqual(self.notebook.get_current_page(), 99)
+        self.assertEqual(self.notebook.get_nth_page(99).child_name, "Page 99")
+
+    def test_pages(self):
+
+        self.assertIsInstance(self.notebook, Aduct.VirtualNotebook)
+        self.assertEqual(self.notebook.get_n_pages(), 100)
+        self.assertEqual(len(self.notebook.get_children()), 3)
+        self.assertIsNone(self.notebook.get_nth_page(50).child_name)
+        self.assertEqual(Aduct.get_interface(self.notebook), self.props)
+
+        changes = []
+        self.notebook.connect("interface-changed", lambda notebook: changes.append(notebook))
+        self.notebook.set_current_page(50)
+        run_pending()
+        self.assertEqual(self.notebook.get_current_page(), 50)
+        real = [idx for idx in range(100) if self.notebook.is_page_real(idx)]
+        self.assertEqual(real, [48, 49, 50, 51, 52])
+        self.assertEqual(self.notebook.get_nth_page(50).child_name, "Page 50")
+        # The pages that left the window keep their element, but not its child.
+        self.assertEqual(self.notebook.get_nth_page(0).get_id(), "page-0")
+        self.assertIsNone(self.notebook.get_nth_page(0).child_name)
+        self.assertEqual(changes, [])
+        self.assertEqual(Aduct.get_interface(self.notebook), self.props)
+
+    def test_patch_interface(self):
+
+        props = Walk.copy_props(self.props)
+        props["elements"][70]["child"]["child_label"] = "Changed"
+        stats = Aduct.patch_interface(props, self.top_level, self.creator_maps, self.init_maps)
+        self.assertEqual(stats["built"], 0)
+        self.assertFalse(self.notebook.is_page_real(70))
+        self.assertEqual(Aduct.get_interface(self.notebook), props)
+
+        self.notebook.set_current_page(70)
+        self.assertEqual(self.notebook.get_nth_page(70).get_child().get_text(), "Changed")
+
+    def test_remove_child(self):
+
+        element = self.notebook.get_nth_page(60)
+        self.notebook.remove_child(element)
+        self.assertEqual(self.notebook.get_n_pages(), 99)
+        self.assertEqual(self.notebook.page_num(element), -1)
+        self.assertRaises(ValueError, self.notebook.remove_child, element)
+
+        self.notebook.add_child(element, 10)
+        self.assertEqual(self.notebook.page_num(element), 10)
+        self.assertTrue(self.notebook.is_page_real(10))
+        self.assertEqual(Aduct.get_interface(self.notebook)["elements"][10]["id"], "page-60")
+        run_pending()
+        self.assertFalse(self.notebook.is_page_real(10))
+        element.destroy()
+
+    def test_remove_element(self):
+
+        history = History(self.top_level)
+        self.notebook.set_property("window-size", 1)
+        self.notebook.set_current_page(99)
+        run_pending()
+        element = self.notebook.get_nth_page(98)
+        Aduct.remove_element(element, self.notebook)
+
+        # The pages that are not real count, so the notebook is not put out for the last page.
+        self.assertIs(self.top_level.get_child(), self.notebook)
+        self.assertEqual(self.notebook.get_n_pages(), 99)
+        ids = [props["id"] for props in Aduct.get_interface(self.notebook)["elements"]]
+        self.assertEqual(ids, [f"page-{idx}" for idx in range(100) if idx != 98])
+
+        self.assertTrue(history.undo())
+        self.assertEqual(Aduct.get_interface(self.notebook), self.props)
+        history.stop()
+
+    def test_remove_real_child(self):
+
+        self.notebook.set_current_page(50)
+        run_pending()
+        element = self.notebook.get_nth_page(49)
+        last = self.notebook.get_nth_page(52)
+        self.notebook.remove_child(element)
+
+        # Only the tab of removed page is gone, not the last one.
+        self.assertIsNone(element.get_parent())
+        self.assertIs(last.get_parent(), self.notebook)
+        self.assertEqual(self.notebook.get_n_pages(), 99)
+        self.assertEqual(self.notebook.page_num(last), 51)
+        self.assertEqual(len(self.notebook.get_children()), 4)
+        ids = [props["id"] for props in Aduct.get_interface(self.notebook)["elements"]]
+        self.assertNotIn("page-49", ids)
+        self.assertEqual(len(ids), 99)
+        element.destroy()
+
+    def test_paths(self):
+
+        self.notebook.set_current_page(50)
+        run_pending()
+        # The paths given by walk count all pages, like get_nth_child.
+        for widget, depth, path in Aduct.walk(self.top_level):
+            self.assertIs(Aduct.get_widget_at_path(self.top_level, list(path)), widget)
+        paths = [path for widget, depth, path in Aduct.walk(self.notebook)]
+        self.assertEqual(paths, [(), (48,), (49,), (50,), (51,), (52,)])
+
+        props = Aduct.get_interface(self.top_level, path=[0, 70])
+        self.assertEqual(props, {**self.props["elements"][70], "version": 2})
+        self.assertFalse(self.notebook.is_page_real(70))
+        props = Aduct.get_interface(self.top_level, path="child/notebook/element_50")
+        self.assertEqual(props, {**self.props["elements"][50], "version": 2})
+
+    def test_get_nth_child(self):
+
+        element = self.notebook.get_nth_child(80)
+        self.assertIs(element, self.notebook.get_nth_page(80))
+        self.assertFalse(self.notebook.is_page_real(80))
+        self.assertIsNone(self.notebook.get_nth_child(100))
+
+
+if __name__ == "__main__":
+    unittest.main()
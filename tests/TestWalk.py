@@ -0,0 +1,149 @@
+import unittest
+
+import Aduct
+from Aduct import Codec, Gtk, Walk
+
+
+def make_deep(depth):
+    # Each paned holds an element and the paned below it, like a panel split depth times.
+    child = Aduct.Element()
+    for idx in range(depth):
+        paned = Aduct.Paned()
+        paned.add_child(Aduct.Element(), 1)
+        paned.add_child(child, 2)
+        child = paned
+    return child
+
+
+class LabelView(Aduct.View, Gtk.Box):
+    # A view of an application that gives no slots and makes its properties by itself.
+
+    def __init__(self):
+
+        Gtk.Box.__init__(self)
+        Aduct.View.__init__(self)
+        self.text = ""
+
+    def get_props(self, use_cache=False):
+
+        return {"type": "label", "text": self.text}
+
+    def set_from_props(self, props):
+
+        self.text = props["text"]
+
+
+class TestWalk(unittest.TestCase):
+
+    def setUp(self):
+
+        self.top_level = Aduct.Bin()
+        self.paned = Aduct.Paned()
+        self.notebook = Aduct.Notebook()
+        self.elements = [Aduct.Element() for idx in range(3)]
+        self.notebook.add_child(self.elements[1])
+        self.notebook.add_child(self.elements[2])
+        self.paned.add_child(self.elements[0], 1)
+        self.paned.add_child(self.notebook, 2)
+        self.top_level.add_child(self.paned)
+
+        self.creator_maps = {
+            "type": {
+                "bin": (Aduct.Bin, (), {}),
+                "element": (Aduct.Element, (), {}),
+                "paned": (Aduct.Paned, (), {}),
+            }
+        }
+        self.init_maps = {"provider": {None: None}}
+
+    def tearDown(self):
+
+        self.top_level.destroy()
+        self.top_level = None
+
+    def test_copy_props(self):
+
+        props = self.top_level.get_props()
+        new_props = Walk.copy_props(props)
+        self.assertEqual(new_props, props)
+        self.assertIsNot(new_props["child"], props["child"])
+        self.assertIsNot(new_props["child"]["children"], props["child"]["children"])
+
+    def test_deep(self):
+
+        depth = 1500
+        self.top_level.replace_child(self.paned, make_deep(depth))
+        props = self.top_level.get_props(use_cache=True)
+        self.assertIs(self.top_level.get_props(use_cache=True), props)
+
+        widgets = list(Aduct.walk(self.top_level, "post"))
+        self.assertEqual(len(widgets), 2 * depth + 2)
+        widget, max_depth, path = max(widgets, key=lambda item: item[1])
+        self.assertEqual(max_depth, depth + 1)
+        self.assertIs(Aduct.get_widget_at_path(self.top_level, list(path)), widget)
+
+        top_level = Aduct.Bin()
+        interface_dict = {**Walk.copy_props(props["child"]), "version": 2}
+        Aduct.set_interface(interface_dict, top_level, self.creator_maps, self.init_maps)
+        # Comparing the dictionaries directly recurses, so their encodings are compared.
+        new_props = top_level.get_props()
+        self.assertEqual(Codec.dumps(new_props["child"]), Codec.dumps(props["child"]))
+        top_level.destroy()
+
+    def test_no_slots(self):
+
+        view = LabelView()
+        view.text = "Test"
+        self.paned.replace_child(self.notebook, view)
+        props = self.top_level.get_props()
+        self.assertEqual(props["child"]["children"][1], {"type": "label", "text": "Test"})
+        self.assertEqual([widget for widget, depth, path in Aduct.walk(view)], [view])
+
+        creator_maps = {"type": {**self.creator_maps["type"], "label": (LabelView, (), {})}}
+        top_level = Aduct.Bin()
+        interface_dict = {**Walk.copy_props(props["child"]), "version": 2}
+        Aduct.set_interface(interface_dict, top_level, creator_maps, self.init_maps)
+        self.assertEqual(top_level.get_child().get_child2().text, "Test")
+        top_level.destroy()
+        self.notebook.destroy()
+
+    def test_walk(self):
+
+        items = Aduct.walk(self.top_level)
+        order = [(widget.get_type(), depth, path) for widget, depth, path in items]
+        self.assertEqual(
+            order,
+            [
+                ("bin", 0, ()),
+                ("paned", 1, (0,)),
+                ("element", 2, (0, 0)),
+                ("notebook", 2, (0, 1)),
+                ("element", 3, (0, 1, 0)),
+                ("element", 3, (0, 1, 1)),
+            ],
+        )
+
+        widgets = [widget for widget, depth, path in Aduct.walk(self.top_level, "post")]
+        self.assertEqual(widgets[:3], [self.elements[0], self.elements[1], self.elements[2]])
+        self.assertEqual(widgets[3:], [self.notebook, self.paned, self.top_level])
+
+    def test_walk_descend(self):
+
+        widgets = [
+            widget
+            for widget, depth, path in Aduct.walk(
+                self.top_level, descend=lambda widget: widget.get_type() != "notebook"
+            )
+        ]
+        self.assertEqual(widgets, [self.top_level, self.paned, self.elements[0], self.notebook])
+        self.assertRaises(ValueError, list, Aduct.walk(self.top_level, "in"))
+
+    def test_walk_no_paths(self):
+
+        items = list(Aduct.walk(self.top_level, "post", paths=False))
+        self.assertEqual([depth for widget, depth, path in items], [2, 3, 3, 2, 1, 0])
+        self.assertEqual({path for widget, depth, path in items}, {None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,41 @@
 import unittest
 
+from tests.TestAutosave import TestAutosave
+from tests.TestBatch import TestBatch
 from tests.TestBin import TestBin
+from tests.TestBudget import TestBudget
+from tests.TestCodec import TestCodec
 from tests.TestElement import TestElement
+from tests.TestHistory import TestHistory
+from tests.TestJournal import TestJournal
+from tests.TestNormalize import TestNormalize
 from tests.TestNotebook import TestNotebook
 from tests.TestPaned import TestPaned
+from tests.TestRegistry import TestRegistry
+from tests.TestSchema import TestSchema
+from tests.TestTiles import TestTiles
+from tests.TestVirtualNotebook import TestVirtualNotebook
+from tests.TestWalk import TestWalk
 
 if __name__ == "__main__":
 
     suite = unittest.TestSuite()
     result = unittest.TestResult()
+    suite.addTest(unittest.makeSuite(TestAutosave))
+    suite.addTest(unittest.makeSuite(TestBatch))
     suite.addTest(unittest.makeSuite(TestBin))
+    suite.addTest(unittest.makeSuite(TestBudget))
+    suite.addTest(unittest.makeSuite(TestCodec))
     suite.addTest(unittest.makeSuite(TestElement))
+    suite.addTest(unittest.makeSuite(TestHistory))
+    suite.addTest(unittest.makeSuite(TestJournal))
+    suite.addTest(unittest.makeSuite(TestNormalize))
     suite.addTest(unittest.makeSuite(TestNotebook))
     suite.addTest(unittest.makeSuite(TestPaned))
+    suite.addTest(unittest.makeSuite(TestRegistry))
+    suite.addTest(unittest.makeSuite(TestSchema))
+    suite.addTest(unittest.makeSuite(TestTiles))
+    suite.addTest(unittest.makeSuite(TestVirtualNotebook))
+    suite.addTest(unittest.makeSuite(TestWalk))
     runner = unittest.TextTestRunner()
     runner.run(suite)